@@ -2,48 +2,203 @@
 
 from __future__ import annotations
 
-from PIL import Image, ImageTk
+from PIL import ImageTk
 
-from dataclasses import dataclass
 from pathlib import Path
 from typing import Dict, Iterable, List, Sequence
 
-import json
+import bisect
+import os
 import random
 
 import tkinter as tk
 from tkinter import ttk
 
 from package.gerenciador_entidades import Entidade, GerenciadorEntidades
+from package import metricas
 from package.jogador import Jogador
+from package.questoes import carregar_questoes
+from package.motor_fusao import (
+    FALHA_CREDITOS,
+    FUSAO_CUSTO_CREDITOS,
+    SELECAO_INSUFICIENTE,
+    SEM_CREDITOS,
+    MotorFusao,
+)
+from package.miniaturas import (
+    DIRETORIO_CACHE_PADRAO,
+    TAMANHO_MINIATURA,
+    CacheLRU,
+    CacheMiniaturasDisco,
+    CarregadorMiniaturas,
+)
 
 
 def _ordenar_nomes(nomes: Iterable[str]) -> List[str]:
     return sorted(set(nomes))
 
 
-@dataclass
-class FusaResultado:
-    novas_criaturas: List[Entidade]
-    mensagem: str
+INTERVALO_COLETA_MINIATURAS_MS = 30
 
 
-FUSAO_CUSTO_CREDITOS = 1
+class _CelulaCriatura:
+    def __init__(self, canvas: tk.Canvas):
+        self.frame = ttk.Frame(canvas, borderwidth=2, relief="flat", style="Card.TFrame")
+        self.label_img = ttk.Label(self.frame)
+        self.label_img.pack()
+        self.label_nome = ttk.Label(self.frame)
+        self.label_nome.pack()
+        self.janela = canvas.create_window(0, 0, window=self.frame, anchor="nw")
+        self.nome: str | None = None
+
+
+class GradeCriaturas:
+    """Grade virtualizada: apenas as linhas visíveis do canvas recebem widgets."""
+
+    COLUNAS = 6
+    LARGURA_CELULA = 104
+    ALTURA_CELULA = 124
+
+    def __init__(self, canvas: tk.Canvas, exibir_imagem):
+        self._canvas = canvas
+        self._exibir_imagem = exibir_imagem
+        self._nomes: List[str] = []
+        self._entidades: Dict[str, Entidade] = {}
+        self._celulas: List[_CelulaCriatura] = []
+        self.selecionadas: set[str] = set()
+
+        canvas.bind("<Configure>", lambda e: self.renderizar())
+        self._vincular_rolagem(canvas)
+
+    def __contains__(self, nome: str) -> bool:
+        return nome in self._entidades
+
+    def __len__(self) -> int:
+        return len(self._nomes)
+
+    def adicionar(self, entidades: Iterable[Entidade]):
+        alterou = False
+        for entidade in entidades:
+            nome = entidade._nome
+            if nome in self._entidades:
+                continue
+            self._entidades[nome] = entidade
+            bisect.insort(self._nomes, nome)
+            alterou = True
+        if alterou:
+            self.renderizar()
+
+    def yview(self, *args):
+        self._canvas.yview(*args)
+        self.renderizar()
+
+    def renderizar(self):
+        linhas = -(-len(self._nomes) // self.COLUNAS)
+        self._canvas.configure(
+            scrollregion=(
+                0,
+                0,
+                self.COLUNAS * self.LARGURA_CELULA,
+                linhas * self.ALTURA_CELULA,
+            )
+        )
+        topo = max(self._canvas.canvasy(0), 0)
+        altura = max(self._canvas.winfo_height(), self.ALTURA_CELULA)
+        primeira = int(topo // self.ALTURA_CELULA)
+        ultima = int((topo + altura) // self.ALTURA_CELULA)
+        visiveis = range(
+            primeira * self.COLUNAS,
+            min(len(self._nomes), (ultima + 1) * self.COLUNAS),
+        )
+
+        while len(self._celulas) < len(visiveis):
+            self._celulas.append(self._criar_celula())
+
+        for celula, indice in zip(self._celulas, visiveis):
+            nome = self._nomes[indice]
+            if celula.nome != nome:
+                celula.nome = nome
+                celula.label_nome.configure(text=nome)
+                self._exibir_imagem(celula.label_img, self._entidades[nome])
+            self._aplicar_estilo(celula)
+            linha, coluna = divmod(indice, self.COLUNAS)
+            self._canvas.coords(
+                celula.janela,
+                coluna * self.LARGURA_CELULA,
+                linha * self.ALTURA_CELULA,
+            )
+            self._canvas.itemconfigure(celula.janela, state="normal")
+
+        for celula in self._celulas[len(visiveis):]:
+            self._canvas.itemconfigure(celula.janela, state="hidden")
+
+    def limpar_selecao(self):
+        self.selecionadas.clear()
+        for celula in self._celulas:
+            self._aplicar_estilo(celula)
+
+    def _criar_celula(self) -> _CelulaCriatura:
+        celula = _CelulaCriatura(self._canvas)
+        for widget in (celula.frame, celula.label_img, celula.label_nome):
+            widget.bind("<Button-1>", lambda e, celula=celula: self._alternar(celula))
+            self._vincular_rolagem(widget)
+        return celula
+
+    def _alternar(self, celula: _CelulaCriatura):
+        if celula.nome is None:
+            return
+        if celula.nome in self.selecionadas:
+            self.selecionadas.remove(celula.nome)
+        else:
+            self.selecionadas.add(celula.nome)
+        self._aplicar_estilo(celula)
+
+    def _aplicar_estilo(self, celula: _CelulaCriatura):
+        estilo = "Selecionado.TFrame" if celula.nome in self.selecionadas else "Card.TFrame"
+        celula.frame.config(style=estilo)
+
+    def _vincular_rolagem(self, widget: tk.Misc):
+        widget.bind("<MouseWheel>", self._rolar)
+        widget.bind("<Button-4>", lambda e: self.yview("scroll", -1, "units"))
+        widget.bind("<Button-5>", lambda e: self.yview("scroll", 1, "units"))
+
+    def _rolar(self, evento):
+        passos = -1 if evento.delta > 0 else 1
+        self.yview("scroll", passos, "units")
 
 
 class ChimeraDesktopApp(tk.Tk):
     """Interface gráfica principal da aplicação."""
 
-    def __init__(self, jogador_padrao: str = "Convidado"):
+    def __init__(
+        self,
+        jogador_padrao: str = "Convidado",
+        cache_imagens_itens: int | None = 512,
+        cache_imagens_bytes: int | None = 32 * 1024 * 1024,
+        diretorio_cache_miniaturas: str = DIRETORIO_CACHE_PADRAO,
+    ):
         super().__init__()
         self.title("Chimera OO")
         self.geometry("720x480")
         self.minsize(640, 420)
 
-        self.gerenciador = GerenciadorEntidades()
+        self.gerenciador = GerenciadorEntidades(tabela_fusoes=True)
+        self.gerenciador.tabela_fusoes.precomputar()
         self.jogador = Jogador(jogador_padrao)
+        self.motor_fusao = MotorFusao(self.gerenciador, FUSAO_CUSTO_CREDITOS)
 
-        self._imagem_cache: Dict[str, tk.PhotoImage] = {}
+        self._descobertas_validas: set[str] = set()
+        self._imagem_cache = CacheLRU(cache_imagens_itens, cache_imagens_bytes)
+        self._cache_miniaturas_disco = CacheMiniaturasDisco(diretorio_cache_miniaturas)
+        self._carregador_miniaturas = CarregadorMiniaturas(
+            gerar=self._cache_miniaturas_disco.gerar
+        )
+        self._labels_aguardando: Dict[str, List[ttk.Label]] = {}
+        self._imagem_provisoria = tk.PhotoImage(
+            width=TAMANHO_MINIATURA[0], height=TAMANHO_MINIATURA[1]
+        )
+        self._imagem_provisoria.put("#d9d9d9", to=(0, 0, *TAMANHO_MINIATURA))
+        self.protocol("WM_DELETE_WINDOW", self._encerrar)
 
         self.mensagem_var = tk.StringVar()
         self.novas_var = tk.StringVar()
@@ -120,25 +275,20 @@ class ChimeraDesktopApp(tk.Tk):
         selecao_frame = ttk.Frame(fusao_tab)
         selecao_frame.pack(fill=tk.BOTH, expand=True)
 
-        self.canvas = tk.Canvas(selecao_frame)
+        self.canvas = tk.Canvas(
+            selecao_frame, yscrollincrement=GradeCriaturas.ALTURA_CELULA // 4
+        )
         self.canvas.pack(side=tk.LEFT, fill=tk.BOTH, expand=True)
 
+        self.grade_criaturas = GradeCriaturas(self.canvas, self._exibir_imagem)
+        self.criaturas_selecionadas = self.grade_criaturas.selecionadas
+
         scrollbar = ttk.Scrollbar(
-            selecao_frame, orient=tk.VERTICAL, command=self.canvas.yview
+            selecao_frame, orient=tk.VERTICAL, command=self.grade_criaturas.yview
         )
         scrollbar.pack(side=tk.LEFT, fill=tk.Y)
         self.canvas.configure(yscrollcommand=scrollbar.set)
 
-        self.grid_frame = ttk.Frame(self.canvas)
-        self.canvas.create_window((0, 0), window=self.grid_frame, anchor="nw")
-
-        self.grid_frame.bind(
-            "<Configure>", lambda e: self.canvas.configure(scrollregion=self.canvas.bbox("all"))
-        )
-
-        self.criaturas_widgets: Dict[str, ttk.Frame] = {}
-        self.criaturas_selecionadas: set[str] = set()
-
         self._carregar_criaturas_iniciais()
 
         botoes_frame = ttk.Frame(fusao_tab, padding=(0, 12))
@@ -229,134 +379,57 @@ class ChimeraDesktopApp(tk.Tk):
     # Lógica da aplicação
     # ------------------------------------------------------------------
     def realizar_fusao(self):
-        selecionadas = list(self.criaturas_selecionadas)
-        if len(selecionadas) < 2:
-            self.mensagem_var.set(
-                "Selecione pelo menos duas criaturas para realizar a fusão."
-            )
+        resultado = self.motor_fusao.realizar_fusao(
+            self.jogador, list(self.criaturas_selecionadas)
+        )
+        self.mensagem_var.set(resultado.mensagem)
+        if resultado.situacao == SELECAO_INSUFICIENTE:
             return
 
-        if not self.jogador.tem_creditos(FUSAO_CUSTO_CREDITOS):
-            self.mensagem_var.set(
-                "Você precisa de créditos para realizar a fusão. Responda às "
-                "perguntas na aba Desafios OO para ganhar créditos. É "
-                f"necessário ao menos {FUSAO_CUSTO_CREDITOS} crédito."
-            )
-            self._mostrar_novas_criaturas([])
+        self._registrar_descobertas(resultado.novas_criaturas)
+        self._mostrar_novas_criaturas(resultado.novas_criaturas)
+        if resultado.situacao in (SEM_CREDITOS, FALHA_CREDITOS):
             return
 
-        resultado = self._processar_fusao(selecionadas)
-        self.mensagem_var.set(resultado.mensagem)
-
-        if resultado.novas_criaturas:
-            if not self.jogador.gastar_creditos(FUSAO_CUSTO_CREDITOS):
-                self.mensagem_var.set(
-                    "Não foi possível consumir créditos para realizar a fusão."
-                )
-                self._mostrar_novas_criaturas([])
-                return
-            self._atualizar_creditos()
-            self._incluir_criaturas_disponiveis(resultado.novas_criaturas)
-            self._mostrar_novas_criaturas(resultado.novas_criaturas)
-        else:
-            self._mostrar_novas_criaturas([])
-
-        self._atualizar_descobertas()
+        self._atualizar_creditos()
         self._limpar_selecao()
 
-    def _processar_fusao(self, selecionadas: List[str]) -> FusaResultado:
-        if len(selecionadas) < 2:
-            return FusaResultado([], "Selecione pelo menos duas criaturas para realizar a fusão.")
-
-        entidades_escolhidas = self.gerenciador.get(selecionadas)
-        if len(entidades_escolhidas) != len(selecionadas):
-            return FusaResultado(
-                [],
-                "Algumas criaturas selecionadas não foram encontradas no gerenciador.",
-            )
-
-        novas_criaturas = self.gerenciador.cruzar(entidades_escolhidas)
-        if not novas_criaturas:
-            return FusaResultado(
-                [], "Nenhuma combinação conhecida para as criaturas escolhidas."
-            )
-
-        for entidade in novas_criaturas:
-            self.jogador.registrar_fusao(entidade._nome)
-
-        return FusaResultado(
-            novas_criaturas,
-            "Fusão concluída! Novas criaturas foram adicionadas ao seu códex.",
-        )
-
     def _atualizar_descobertas(self):
         nomes = _ordenar_nomes(self.jogador.criaturas_descobertas)
 
+        self._descobertas_validas.clear()
         entidades: List[Entidade] = []
-        descobertas_validas = 0
+        encontradas_por_nome = self.gerenciador.buscar_nomes(nomes)
         for nome in nomes:
-            encontradas = self.gerenciador.get([nome])
+            encontradas = encontradas_por_nome[nome]
             if not encontradas:
                 continue
-            entidade = encontradas[0]
-            entidades.append(entidade)
-            descobertas_validas += 1
-            iid = self._criar_iid("descoberta", nome)
-            imagem = self._obter_imagem(entidade)
+            entidades.append(encontradas[0])
+            self._descobertas_validas.add(nome)
 
         if entidades:
             self._incluir_criaturas_disponiveis(entidades)
 
-        self._atualizar_contador(descobertas_validas)
+        self._atualizar_contador()
+
+    def _registrar_descobertas(self, entidades: Sequence[Entidade]):
+        if not entidades:
+            return
+        self._descobertas_validas.update(entidade._nome for entidade in entidades)
+        self._incluir_criaturas_disponiveis(entidades)
+        self._atualizar_contador()
 
     # ------------------------------------------------------------------
     # Métodos auxiliares
     # ------------------------------------------------------------------
-    def _criar_iid(self, prefixo: str, nome: str) -> str:
-        normalizado = nome.replace(" ", "_")
-        return f"{prefixo}::{normalizado}"
-
     def _carregar_criaturas_iniciais(self):
-        iniciais = self.gerenciador.listar_basicas()
-        for entidade in iniciais:
-            self._adicionar_criatura_disponivel(entidade)
-        self._renderizar_criaturas()
-        
+        self.grade_criaturas.adicionar(self.gerenciador.listar_basicas())
+
     def _incluir_criaturas_disponiveis(
         self, entidades: Sequence[Entidade]
     ):
-        for entidade in entidades:
-            self._adicionar_criatura_disponivel(entidade)
-        self._renderizar_criaturas()
-
+        self.grade_criaturas.adicionar(entidades)
 
-    def _adicionar_criatura_disponivel(self, entidade: Entidade):
-        nome = entidade._nome
-        if nome in self.criaturas_widgets:
-            return
-
-        imagem = self._obter_imagem(entidade)
-
-        frame = ttk.Frame(self.grid_frame, borderwidth=2, relief="flat")
-        label_img = ttk.Label(frame, image=imagem)
-        label_img.image = imagem
-        label_img.pack()
-        label_nome = ttk.Label(frame, text=nome)
-        label_nome.pack()
-
-        def toggle_selecao(event=None, nome=nome, frame=frame):
-            if nome in self.criaturas_selecionadas:
-                self.criaturas_selecionadas.remove(nome)
-                frame.config(style="Card.TFrame")
-            else:
-                self.criaturas_selecionadas.add(nome)
-                frame.config(style="Selecionado.TFrame")
-
-        frame.bind("<Button-1>", toggle_selecao)
-        label_img.bind("<Button-1>", toggle_selecao)
-        label_nome.bind("<Button-1>", toggle_selecao)
-
-        self.criaturas_widgets[nome] = frame
     def _mostrar_novas_criaturas(self, criaturas: Sequence[Entidade]):
         # Limpa o conteúdo anterior
         for widget in self.novas_frame.winfo_children():
@@ -373,11 +446,10 @@ class ChimeraDesktopApp(tk.Tk):
         colunas = 4
         for i, entidade in enumerate(criaturas):
             nome = entidade._nome
-            imagem = self._obter_imagem(entidade)
 
             frame = ttk.Frame(self.novas_frame, borderwidth=1, relief="solid", padding=4)
-            label_img = ttk.Label(frame, image=imagem)
-            label_img.image = imagem
+            label_img = ttk.Label(frame)
+            self._exibir_imagem(label_img, entidade)
             label_img.pack()
             ttk.Label(frame, text=nome).pack()
 
@@ -388,7 +460,7 @@ class ChimeraDesktopApp(tk.Tk):
             f"Créditos disponíveis: {self.jogador.creditos}"
         )
 
-    def _obter_imagem(self, entidade: Entidade):
+    def _caminho_imagem(self, entidade: Entidade) -> Path | None:
         caminho = entidade.caminho_imagem
         if not caminho:
             return None
@@ -396,32 +468,77 @@ class ChimeraDesktopApp(tk.Tk):
         caminho_relativo = Path(caminho)
         if not caminho_relativo.is_absolute():
             caminho_relativo = Path(__file__).parent / caminho_relativo
+        return caminho_relativo.resolve()
+
+    def _obter_imagem(self, entidade: Entidade):
+        caminho = self._caminho_imagem(entidade)
+        if caminho is None:
+            return None
 
-        chave_cache = str(caminho_relativo.resolve())
-        if chave_cache not in self._imagem_cache and caminho_relativo.exists():
-            imagem = Image.open(caminho_relativo)
-            imagem = imagem.resize((80, 80), Image.LANCZOS)
-            self._imagem_cache[chave_cache] = ImageTk.PhotoImage(imagem)
+        chave_cache = str(caminho)
+        imagem = self._imagem_cache.get(chave_cache)
+        if imagem is not None:
+            return imagem
+        if not caminho.exists():
+            return None
 
-        return self._imagem_cache.get(chave_cache)
+        caminho_miniatura = self._cache_miniaturas_disco.obter(caminho, TAMANHO_MINIATURA)
+        if caminho_miniatura is not None:
+            try:
+                imagem = tk.PhotoImage(file=caminho_miniatura)
+            except tk.TclError:
+                imagem = None
+            if imagem is not None:
+                metricas.registrar_bytes("miniaturas.cache.lidos", os.path.getsize(caminho_miniatura))
+                self._imagem_cache.put(
+                    chave_cache, imagem, imagem.width() * imagem.height() * 4
+                )
+                return imagem
 
-    def _renderizar_criaturas(self):
-        # Remove widgets visuais antigos, mas não destrói os frames guardados
-        for widget in self.grid_frame.winfo_children():
-            widget.grid_forget()
+        agendar_coleta = not self._carregador_miniaturas.pendentes
+        if not self._carregador_miniaturas.solicitar(chave_cache, caminho, TAMANHO_MINIATURA):
+            return None
+        if agendar_coleta:
+            self.after(INTERVALO_COLETA_MINIATURAS_MS, self._coletar_miniaturas)
+        return self._imagem_provisoria
 
-        colunas = 6
-        for i, (nome, frame) in enumerate(sorted(self.criaturas_widgets.items())):
-            frame.grid(row=i // colunas, column=i % colunas, padx=8, pady=8)
+    def _exibir_imagem(self, label: ttk.Label, entidade: Entidade):
+        imagem = self._obter_imagem(entidade)
+        caminho = self._caminho_imagem(entidade)
+        label.chave_imagem = str(caminho) if caminho is not None else None
+        label.configure(image=imagem or "")
+        label.image = imagem
+        if imagem is self._imagem_provisoria:
+            self._labels_aguardando.setdefault(label.chave_imagem, []).append(label)
+
+    def _coletar_miniaturas(self):
+        for chave_cache, miniatura in self._carregador_miniaturas.coletar():
+            labels = self._labels_aguardando.pop(chave_cache, [])
+            if miniatura is None:
+                continue
+            imagem = ImageTk.PhotoImage(miniatura)
+            largura, altura = miniatura.size
+            self._imagem_cache.put(chave_cache, imagem, largura * altura * 4)
+            for label in labels:
+                # Células da grade são recicladas: ignora labels que já mudaram de criatura
+                if label.winfo_exists() and label.chave_imagem == chave_cache:
+                    label.configure(image=imagem)
+                    label.image = imagem
+
+        if self._carregador_miniaturas.pendentes:
+            self.after(INTERVALO_COLETA_MINIATURAS_MS, self._coletar_miniaturas)
+
+    def _encerrar(self):
+        self._carregador_miniaturas.encerrar()
+        self.jogador.salvar()
+        self.destroy()
 
     def _limpar_selecao(self):
-        for nome in list(self.criaturas_selecionadas):
-            frame = self.criaturas_widgets[nome]
-            frame.config(style="Card.TFrame")
-        self.criaturas_selecionadas.clear()
+        self.grade_criaturas.limpar_selecao()
 
-    def _atualizar_contador(self, descobertas: int):
-        total = len(self.gerenciador.listar_nomes())
+    def _atualizar_contador(self):
+        descobertas = len(self._descobertas_validas)
+        total = len(self.gerenciador)
         faltam = max(total - descobertas, 0)
         self.contador_var.set(
             f"Quimeras descobertas: {descobertas} de {total} (faltam {faltam})"
@@ -431,39 +548,7 @@ class ChimeraDesktopApp(tk.Tk):
     # Sistema de perguntas e respostas
     # ------------------------------------------------------------------
     def _carregar_questoes(self) -> List[Dict[str, object]]:
-        caminho = Path(__file__).parent / "assets" / "perguntas_oo.json"
-        if not caminho.exists():
-            return []
-        try:
-            with open(caminho, "r", encoding="utf-8") as arquivo:
-                dados = json.load(arquivo)
-        except (json.JSONDecodeError, OSError):
-            return []
-
-        questoes_validas: List[Dict[str, object]] = []
-        for questao in dados:
-            if not isinstance(questao, dict):
-                continue
-            pergunta = questao.get("pergunta")
-            alternativas = questao.get("alternativas")
-            try:
-                correta = int(questao.get("correta"))
-            except (TypeError, ValueError):
-                continue
-
-            if not pergunta or not isinstance(alternativas, list) or len(alternativas) < 2:
-                continue
-            if not 0 <= correta < len(alternativas):
-                continue
-
-            questoes_validas.append(
-                {
-                    "pergunta": str(pergunta),
-                    "alternativas": [str(opcao) for opcao in alternativas],
-                    "correta": correta,
-                }
-            )
-        return questoes_validas
+        return carregar_questoes(str(Path(__file__).parent / "assets" / "perguntas_oo.json"))
 
     def _sortear_pergunta(self):
         if not getattr(self, "alternativas_frame", None):
@@ -528,6 +613,17 @@ class ChimeraDesktopApp(tk.Tk):
         else:
             self.quiz_feedback_var.set("Resposta incorreta. Tente novamente.")
 
+
+metricas.instrumentar(ChimeraDesktopApp, "_obter_imagem", "app.obter_imagem")
+
+
 if __name__ == "__main__":  # pragma: no cover
+    # CHIMERA_METRICAS=arquivo.json ativa a instrumentação e grava as métricas ao sair
+    arquivo_metricas = os.environ.get("CHIMERA_METRICAS")
+    if arquivo_metricas:
+        metricas.ativar()
     app = ChimeraDesktopApp()
     app.mainloop()
+    if arquivo_metricas:
+        with open(arquivo_metricas, "w", encoding="utf-8") as arquivo:
+            arquivo.write(metricas.REGISTRO.exportar_json())
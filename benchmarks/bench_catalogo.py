@@ -0,0 +1,157 @@
+"""Benchmarks das operações de catálogo do GerenciadorEntidades.
+
+Exemplos::
+
+    python benchmarks/bench_catalogo.py --tamanhos 1000 100000
+    python benchmarks/bench_catalogo.py --salvar-base base.json
+    python benchmarks/bench_catalogo.py --comparar base.json --tolerancia 0.25
+"""
+
+import argparse
+import json
+import os
+import platform
+import random
+import sys
+import tempfile
+import time
+import tracemalloc
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from package.catalogo_sintetico import DISTRIBUICOES, escrever_csv, gerar_registros  # noqa: E402
+from package.gerenciador_entidades import TAMANHO_CACHE_CONSULTAS, GerenciadorEntidades  # noqa: E402
+
+
+def _medir(funcao, argumentos, repeticoes=1):
+    inicio = time.perf_counter()
+    for _ in range(repeticoes):
+        for argumento in argumentos:
+            funcao(argumento)
+    duracao = time.perf_counter() - inicio
+    operacoes = repeticoes * len(argumentos)
+    return {
+        "operacoes": operacoes,
+        "segundos": duracao,
+        "operacoes_por_segundo": operacoes / duracao if duracao else float("inf"),
+    }
+
+
+def executar_tamanho(quantidade, opcoes):
+    registros = gerar_registros(
+        quantidade,
+        tamanho_vocabulario=opcoes.vocabulario,
+        tags_por_entidade=(opcoes.min_tags, opcoes.max_tags),
+        distribuicao=opcoes.distribuicao,
+        semente=opcoes.semente,
+    )
+    resultados = {}
+    with tempfile.TemporaryDirectory() as diretorio:
+        caminho_csv = os.path.join(diretorio, "catalogo.csv")
+        escrever_csv(registros, caminho_csv)
+
+        if opcoes.memoria:
+            tracemalloc.start()
+        inicio = time.perf_counter()
+        gerenciador = GerenciadorEntidades(predefinidas=False, tamanho_cache=0)
+        gerenciador.carregar_csv(caminho_csv)
+        duracao = time.perf_counter() - inicio
+        if opcoes.memoria:
+            memoria, _ = tracemalloc.get_traced_memory()
+            tracemalloc.stop()
+            resultados["memoria_catalogo_bytes"] = memoria
+        resultados["carregar_csv"] = {
+            "operacoes": quantidade,
+            "segundos": duracao,
+            "operacoes_por_segundo": quantidade / duracao if duracao else float("inf"),
+        }
+
+    aleatorio = random.Random(opcoes.semente)
+    entidades = [gerenciador._entidades[aleatorio.randrange(quantidade)] for _ in range(opcoes.operacoes)]
+    nomes = [[entidade._nome] for entidade in entidades]
+    basicas = gerenciador.listar_basicas()
+    pares = [aleatorio.sample(basicas, 2) for _ in range(opcoes.operacoes)]
+
+    resultados["get"] = _medir(gerenciador.get, nomes, opcoes.repeticoes)
+    resultados["listar_basicas"] = _medir(lambda _: gerenciador.listar_basicas(), [None], opcoes.repeticoes)
+    resultados["cruzar"] = _medir(gerenciador.cruzar, pares, opcoes.repeticoes)
+    resultados["evolucoes"] = _medir(gerenciador.evolucoes, entidades, opcoes.repeticoes)
+    resultados["derivacoes"] = _medir(gerenciador.derivacoes, entidades, opcoes.repeticoes)
+
+    gerenciador._tamanho_cache = TAMANHO_CACHE_CONSULTAS
+    gerenciador.limpar_cache()
+    resultados["evolucoes_cache"] = _medir(gerenciador.evolucoes, entidades, opcoes.repeticoes)
+    resultados["derivacoes_cache"] = _medir(gerenciador.derivacoes, entidades, opcoes.repeticoes)
+    return resultados
+
+
+def comparar(atual, base, tolerancia):
+    regressoes = []
+    for tamanho, operacoes in atual["resultados"].items():
+        for operacao, medida in operacoes.items():
+            referencia = base["resultados"].get(tamanho, {}).get(operacao)
+            if not isinstance(medida, dict) or not isinstance(referencia, dict):
+                continue
+            razao = medida["operacoes_por_segundo"] / referencia["operacoes_por_segundo"]
+            if razao < 1 - tolerancia:
+                regressoes.append((tamanho, operacao, razao))
+    return regressoes
+
+
+def main(argumentos=None):
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--tamanhos", type=int, nargs="+", default=[1000, 100000, 1000000])
+    parser.add_argument("--vocabulario", type=int, default=1000)
+    parser.add_argument("--min-tags", type=int, default=1)
+    parser.add_argument("--max-tags", type=int, default=5)
+    parser.add_argument("--distribuicao", choices=DISTRIBUICOES, default="geometrica")
+    parser.add_argument("--operacoes", type=int, default=20, help="consultas por operação")
+    parser.add_argument("--repeticoes", type=int, default=1)
+    parser.add_argument("--semente", type=int, default=0)
+    parser.add_argument("--memoria", action="store_true", help="mede a memória do catálogo (mais lento)")
+    parser.add_argument("--saida", help="grava os resultados em JSON")
+    parser.add_argument("--salvar-base", help="grava os resultados como linha de base")
+    parser.add_argument("--comparar", help="linha de base JSON para detectar regressões")
+    parser.add_argument("--tolerancia", type=float, default=0.2)
+    opcoes = parser.parse_args(argumentos)
+
+    relatorio = {
+        "python": platform.python_version(),
+        "plataforma": platform.platform(),
+        "parametros": {
+            chave: valor
+            for chave, valor in vars(opcoes).items()
+            if chave not in {"saida", "salvar_base", "comparar"}
+        },
+        "resultados": {},
+    }
+    for quantidade in opcoes.tamanhos:
+        resultados = executar_tamanho(quantidade, opcoes)
+        relatorio["resultados"][str(quantidade)] = resultados
+        for operacao, medida in resultados.items():
+            if isinstance(medida, dict):
+                print(
+                    f"{quantidade:>9} {operacao:<15} "
+                    f"{medida['operacoes_por_segundo']:>14.1f} op/s "
+                    f"({medida['segundos']:.4f}s)"
+                )
+            else:
+                print(f"{quantidade:>9} {operacao:<15} {medida / 1024 / 1024:>14.1f} MiB")
+
+    for destino in (opcoes.saida, opcoes.salvar_base):
+        if destino:
+            with open(destino, "w", encoding="utf-8") as arquivo:
+                json.dump(relatorio, arquivo, indent=2)
+
+    if opcoes.comparar:
+        with open(opcoes.comparar, encoding="utf-8") as arquivo:
+            base = json.load(arquivo)
+        regressoes = comparar(relatorio, base, opcoes.tolerancia)
+        for tamanho, operacao, razao in regressoes:
+            print(f"REGRESSÃO: {operacao} com {tamanho} entidades a {razao:.0%} da linha de base")
+        return 1 if regressoes else 0
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
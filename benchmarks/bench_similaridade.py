@@ -0,0 +1,100 @@
+"""Compara o índice de similaridade com a varredura completa do catálogo.
+
+Exemplos::
+
+    python benchmarks/bench_similaridade.py --tamanhos 10000 100000
+    python benchmarks/bench_similaridade.py --tamanhos 100000 --k 5 --consultas 200
+"""
+
+import argparse
+import json
+import os
+import random
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from package.catalogo_sintetico import DISTRIBUICOES, gerar_gerenciador  # noqa: E402
+from package.indice_similaridade import jaccard  # noqa: E402
+
+
+def similares_forca_bruta(gerenciador, tags, k):
+    pontuadas = []
+    for posicao in range(len(gerenciador)):
+        similaridade = jaccard(tags, gerenciador._tags_em(posicao))
+        if similaridade > 0:
+            pontuadas.append((-similaridade, posicao))
+    pontuadas.sort()
+    return [(posicao, -similaridade) for similaridade, posicao in pontuadas[:k]]
+
+
+def _medir(funcao, consultas):
+    inicio = time.perf_counter()
+    resultados = [funcao(tags) for tags in consultas]
+    duracao = time.perf_counter() - inicio
+    return resultados, {
+        "operacoes": len(consultas),
+        "segundos": duracao,
+        "operacoes_por_segundo": len(consultas) / duracao if duracao else float("inf"),
+    }
+
+
+def executar_tamanho(quantidade, opcoes):
+    gerenciador = gerar_gerenciador(
+        quantidade,
+        tamanho_vocabulario=opcoes.vocabulario,
+        tags_por_entidade=(opcoes.min_tags, opcoes.max_tags),
+        distribuicao=opcoes.distribuicao,
+        semente=opcoes.semente,
+    )
+    aleatorio = random.Random(opcoes.semente)
+    consultas = [gerenciador._tags_em(aleatorio.randrange(quantidade)) for _ in range(opcoes.consultas)]
+
+    inicio = time.perf_counter()
+    indice = gerenciador.indice_similaridade()
+    construcao = time.perf_counter() - inicio
+    rapidos, medida_indice = _medir(lambda tags: indice.posicoes_similares(tags, opcoes.k), consultas)
+    lentos, medida_bruta = _medir(lambda tags: similares_forca_bruta(gerenciador, tags, opcoes.k), consultas)
+    if rapidos != lentos:
+        raise AssertionError("O índice divergiu da varredura completa.")
+    aceleracao = float("inf")
+    if medida_indice["segundos"]:
+        aceleracao = medida_bruta["segundos"] / medida_indice["segundos"]
+    return {
+        "construcao_indice_segundos": construcao,
+        "indice": medida_indice,
+        "forca_bruta": medida_bruta,
+        "aceleracao": aceleracao,
+    }
+
+
+def main(argumentos=None):
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--tamanhos", type=int, nargs="+", default=[10000, 100000])
+    parser.add_argument("--vocabulario", type=int, default=1000)
+    parser.add_argument("--min-tags", type=int, default=1)
+    parser.add_argument("--max-tags", type=int, default=5)
+    parser.add_argument("--distribuicao", choices=DISTRIBUICOES, default="geometrica")
+    parser.add_argument("--consultas", type=int, default=50)
+    parser.add_argument("--k", type=int, default=10)
+    parser.add_argument("--semente", type=int, default=0)
+    parser.add_argument("--saida", help="grava os resultados em JSON")
+    opcoes = parser.parse_args(argumentos)
+
+    relatorio = {}
+    for quantidade in opcoes.tamanhos:
+        resultados = relatorio[str(quantidade)] = executar_tamanho(quantidade, opcoes)
+        print(
+            f"{quantidade:>9} índice {resultados['indice']['operacoes_por_segundo']:>10.1f} op/s  "
+            f"força bruta {resultados['forca_bruta']['operacoes_por_segundo']:>8.1f} op/s  "
+            f"aceleração {resultados['aceleracao']:.1f}x"
+        )
+    if opcoes.saida:
+        with open(opcoes.saida, "w", encoding="utf-8") as arquivo:
+            json.dump(relatorio, arquivo, indent=2)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
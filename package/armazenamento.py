@@ -0,0 +1,257 @@
+import json
+import os
+import pickle
+import sqlite3
+import threading
+
+from package import metricas
+
+
+class ArmazenamentoPickle:
+    transacional = False
+
+    def __init__(self, arquivo="dados_jogador.pkl"):
+        self._arquivo = arquivo
+
+    def _ler_dados(self):
+        if not os.path.exists(self._arquivo):
+            return {}
+        try:
+            with open(self._arquivo, "rb") as arquivo:
+                dados = pickle.load(arquivo)
+                metricas.registrar_bytes("armazenamento.pickle.lidos", arquivo.tell())
+        except (pickle.PickleError, EOFError, AttributeError, ValueError):
+            return {}
+        return dados if isinstance(dados, dict) else {}
+
+    def carregar(self, nome):
+        return self._interpretar(self._ler_dados().get(nome))
+
+    def exportar(self):
+        return {nome: self._interpretar(progresso) for nome, progresso in self._ler_dados().items()}
+
+    @staticmethod
+    def _interpretar(progresso):
+        if isinstance(progresso, dict):
+            criaturas = progresso.get("criaturas", [])
+            creditos = progresso.get("creditos", 0)
+        elif progresso is None:
+            criaturas = []
+            creditos = 0
+        else:
+            criaturas = progresso
+            creditos = 0
+        try:
+            return set(criaturas), int(creditos)
+        except (TypeError, ValueError):
+            return set(), 0
+
+    def registrar(self, nome, novas_criaturas, variacao_creditos, criaturas, creditos):
+        dados = self._ler_dados()
+        dados[nome] = {
+            "criaturas": list(criaturas),
+            "creditos": creditos,
+        }
+        with open(self._arquivo, "wb") as arquivo:
+            pickle.dump(dados, arquivo)
+            metricas.registrar_bytes("armazenamento.pickle.escritos", arquivo.tell())
+
+
+class ArmazenamentoLog:
+    transacional = False
+
+    def __init__(self, arquivo="dados_jogador.log", limite_compactacao=1000):
+        self._arquivo = arquivo
+        self._limite_compactacao = limite_compactacao
+        self._excedentes = None
+
+    def _ler_registros(self):
+        progresso = {}
+        quantidade = 0
+        if not os.path.exists(self._arquivo):
+            return progresso, quantidade
+        with open(self._arquivo, "r", encoding="utf-8") as arquivo:
+            for linha in arquivo:
+                try:
+                    registro = json.loads(linha)
+                    nome = registro["j"]
+                    criaturas = registro.get("c", [])
+                    variacao = int(registro.get("d", 0))
+                except (ValueError, KeyError, TypeError):
+                    continue
+                quantidade += 1
+                atual = progresso.get(nome)
+                if atual is None:
+                    atual = progresso[nome] = [set(), 0]
+                atual[0].update(criaturas)
+                atual[1] += variacao
+            metricas.registrar_bytes("armazenamento.log.lidos", arquivo.tell())
+        return progresso, quantidade
+
+    def carregar(self, nome):
+        progresso, quantidade = self._ler_registros()
+        self._excedentes = quantidade - len(progresso)
+        criaturas, creditos = progresso.get(nome, (set(), 0))
+        return set(criaturas), creditos
+
+    def registrar(self, nome, novas_criaturas, variacao_creditos, criaturas, creditos):
+        if not novas_criaturas and not variacao_creditos:
+            return
+        registro = {"j": nome}
+        if novas_criaturas:
+            registro["c"] = list(novas_criaturas)
+        if variacao_creditos:
+            registro["d"] = variacao_creditos
+        linha = (json.dumps(registro, ensure_ascii=False) + "\n").encode("utf-8")
+        with open(self._arquivo, "a+b") as arquivo:
+            if arquivo.tell() > 0:
+                arquivo.seek(-1, os.SEEK_END)
+                if arquivo.read(1) != b"\n":
+                    linha = b"\n" + linha
+            arquivo.write(linha)
+        metricas.registrar_bytes("armazenamento.log.escritos", len(linha))
+        if self._excedentes is None:
+            progresso, quantidade = self._ler_registros()
+            self._excedentes = quantidade - len(progresso)
+        else:
+            self._excedentes += 1
+        if self._excedentes >= self._limite_compactacao:
+            self.compactar()
+
+    def compactar(self):
+        progresso, _ = self._ler_registros()
+        temporario = f"{self._arquivo}.tmp"
+        with open(temporario, "w", encoding="utf-8") as arquivo:
+            for nome, (criaturas, creditos) in progresso.items():
+                registro = {"j": nome, "c": sorted(criaturas), "d": creditos}
+                arquivo.write(json.dumps(registro, ensure_ascii=False) + "\n")
+        os.replace(temporario, self._arquivo)
+        self._excedentes = 0
+
+
+class ArmazenamentoSQLite:
+    transacional = True
+
+    def __init__(self, arquivo="dados_jogador.sqlite3", timeout=30.0):
+        self._arquivo = arquivo
+        self._conexao = sqlite3.connect(
+            arquivo, timeout=timeout, isolation_level=None, check_same_thread=False
+        )
+        self._trava = threading.RLock()
+        self._conexao.execute("PRAGMA journal_mode=WAL")
+        self._conexao.execute("PRAGMA synchronous=NORMAL")
+        self._conexao.execute(
+            "CREATE TABLE IF NOT EXISTS jogadores ("
+            "nome TEXT PRIMARY KEY, creditos INTEGER NOT NULL DEFAULT 0)"
+        )
+        self._conexao.execute(
+            "CREATE TABLE IF NOT EXISTS criaturas ("
+            "jogador TEXT NOT NULL, criatura TEXT NOT NULL, "
+            "PRIMARY KEY (jogador, criatura))"
+        )
+
+    def fechar(self):
+        self._conexao.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *excecao):
+        self.fechar()
+
+    def carregar(self, nome):
+        with self._trava:
+            linha = self._conexao.execute(
+                "SELECT creditos FROM jogadores WHERE nome = ?", (nome,)
+            ).fetchone()
+            criaturas = {
+                criatura
+                for (criatura,) in self._conexao.execute(
+                    "SELECT criatura FROM criaturas WHERE jogador = ?", (nome,)
+                )
+            }
+        return criaturas, linha[0] if linha else 0
+
+    def registrar(self, nome, novas_criaturas, variacao_creditos, criaturas, creditos):
+        if not novas_criaturas and not variacao_creditos:
+            return
+        with self._transacao():
+            self._aplicar(nome, novas_criaturas, variacao_creditos)
+
+    def debitar(self, nome, quantidade, novas_criaturas=()):
+        with self._transacao():
+            cursor = self._conexao.execute(
+                "UPDATE jogadores SET creditos = creditos - ? WHERE nome = ? AND creditos >= ?",
+                (quantidade, nome, quantidade),
+            )
+            if cursor.rowcount == 1 and novas_criaturas:
+                self._conexao.executemany(
+                    "INSERT OR IGNORE INTO criaturas (jogador, criatura) VALUES (?, ?)",
+                    [(nome, criatura) for criatura in novas_criaturas],
+                )
+            linha = self._conexao.execute(
+                "SELECT creditos FROM jogadores WHERE nome = ?", (nome,)
+            ).fetchone()
+        return cursor.rowcount == 1, linha[0] if linha else 0
+
+    def importar_pickle(self, arquivo_pickle):
+        progresso = ArmazenamentoPickle(arquivo_pickle).exportar()
+        with self._transacao():
+            for nome, (criaturas, creditos) in progresso.items():
+                self._conexao.execute(
+                    "INSERT INTO jogadores (nome, creditos) VALUES (?, ?) "
+                    "ON CONFLICT(nome) DO NOTHING",
+                    (nome, creditos),
+                )
+                self._conexao.executemany(
+                    "INSERT OR IGNORE INTO criaturas (jogador, criatura) VALUES (?, ?)",
+                    [(nome, criatura) for criatura in criaturas],
+                )
+        return len(progresso)
+
+    def _transacao(self):
+        return _Transacao(self._conexao, self._trava)
+
+    def _aplicar(self, nome, novas_criaturas, variacao_creditos):
+        self._conexao.execute(
+            "INSERT INTO jogadores (nome, creditos) VALUES (?, 0) ON CONFLICT(nome) DO NOTHING",
+            (nome,),
+        )
+        if variacao_creditos:
+            cursor = self._conexao.execute(
+                "UPDATE jogadores SET creditos = creditos + ? WHERE nome = ? AND creditos + ? >= 0",
+                (variacao_creditos, nome, variacao_creditos),
+            )
+            if cursor.rowcount != 1:
+                raise ValueError("Créditos insuficientes para concluir a operação.")
+        if novas_criaturas:
+            self._conexao.executemany(
+                "INSERT OR IGNORE INTO criaturas (jogador, criatura) VALUES (?, ?)",
+                [(nome, criatura) for criatura in novas_criaturas],
+            )
+
+
+class _Transacao:
+
+    def __init__(self, conexao, trava):
+        self._conexao = conexao
+        self._trava = trava
+
+    def __enter__(self):
+        self._trava.acquire()
+        try:
+            self._conexao.execute("BEGIN IMMEDIATE")
+        except Exception:
+            self._trava.release()
+            raise
+        return self._conexao
+
+    def __exit__(self, tipo, excecao, rastreamento):
+        try:
+            if tipo is None:
+                self._conexao.execute("COMMIT")
+            else:
+                self._conexao.execute("ROLLBACK")
+        finally:
+            self._trava.release()
+        return False
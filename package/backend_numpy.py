@@ -0,0 +1,181 @@
+try:
+    import numpy as np
+except ImportError:  # pragma: no cover - depende do ambiente
+    np = None
+
+
+NUMPY_DISPONIVEL = np is not None
+
+
+class MatrizTagsPython:
+
+    def __init__(self, gerenciador):
+        self._versao = gerenciador.versao
+        self._ids = {tag: identificador for identificador, tag in enumerate(gerenciador._indice_tags)}
+        self._linhas = []
+        self._contagens = []
+        for posicao in range(len(gerenciador)):
+            tags = gerenciador._tags_em(posicao)
+            mascara = 0
+            for tag in tags:
+                mascara |= 1 << self._ids[tag]
+            self._linhas.append(mascara)
+            self._contagens.append(len(tags))
+
+    @property
+    def versao(self):
+        return self._versao
+
+    def adicionar(self, inicio, tags_novas, versao):
+        if inicio != len(self._linhas):
+            raise ValueError("As novas linhas devem continuar a matriz.")
+        for tags in tags_novas:
+            mascara = 0
+            for tag in tags:
+                identificador = self._ids.get(tag)
+                if identificador is None:
+                    identificador = self._ids[tag] = len(self._ids)
+                mascara |= 1 << identificador
+            self._linhas.append(mascara)
+            self._contagens.append(len(tags))
+        self._versao = versao
+
+    def _mascara(self, tags, ignorar_desconhecidas):
+        mascara = 0
+        for tag in tags:
+            identificador = self._ids.get(tag)
+            if identificador is None:
+                if ignorar_desconhecidas:
+                    continue
+                return None
+            mascara |= 1 << identificador
+        return mascara
+
+    def basicas(self):
+        return [posicao for posicao, quantidade in enumerate(self._contagens) if quantidade == 1]
+
+    def superconjuntos(self, tags):
+        mascara = self._mascara(tags, ignorar_desconhecidas=False)
+        if mascara is None:
+            return []
+        return [posicao for posicao, linha in enumerate(self._linhas) if linha & mascara == mascara]
+
+    def subconjuntos(self, tags):
+        complemento = ~self._mascara(tags, ignorar_desconhecidas=True)
+        return [posicao for posicao, linha in enumerate(self._linhas) if not linha & complemento]
+
+    def compativeis(self, assinatura):
+        mascaras = [self._mascara(tags, ignorar_desconhecidas=True) for tags in assinatura]
+        resultado = []
+        for posicao in self.subconjuntos(frozenset().union(*assinatura)):
+            restante = self._linhas[posicao]
+            for mascara in mascaras:
+                if not restante & mascara:
+                    break
+                restante &= ~mascara
+            else:
+                if not restante:
+                    resultado.append(posicao)
+        return resultado
+
+
+class MatrizTagsNumpy:
+
+    def __init__(self, gerenciador):
+        self._versao = gerenciador.versao
+        self._ids = {tag: identificador for identificador, tag in enumerate(gerenciador._indice_tags)}
+        self._palavras = (len(self._ids) + 63) // 64
+        self._quantidade = 0
+        self._buffer = np.zeros((0, self._palavras), dtype=np.uint64)
+        self._buffer_contagens = np.zeros(0, dtype=np.intp)
+        self._preencher(0, [gerenciador._tags_em(posicao) for posicao in range(len(gerenciador))])
+
+    @property
+    def versao(self):
+        return self._versao
+
+    def adicionar(self, inicio, tags_novas, versao):
+        if inicio != self._quantidade:
+            raise ValueError("As novas linhas devem continuar a matriz.")
+        for tags in tags_novas:
+            for tag in tags:
+                if tag not in self._ids:
+                    self._ids[tag] = len(self._ids)
+        self._preencher(inicio, tags_novas)
+        self._versao = versao
+
+    def _preencher(self, inicio, tags_novas):
+        quantidade = inicio + len(tags_novas)
+        palavras = max(self._palavras, (len(self._ids) + 63) // 64)
+        if quantidade > len(self._buffer) or palavras != self._palavras:
+            capacidade = max(quantidade, 2 * len(self._buffer))
+            buffer = np.zeros((capacidade, palavras), dtype=np.uint64)
+            buffer[:self._quantidade, :self._palavras] = self._buffer[:self._quantidade]
+            contagens = np.zeros(capacidade, dtype=np.intp)
+            contagens[:self._quantidade] = self._buffer_contagens[:self._quantidade]
+            self._buffer, self._buffer_contagens, self._palavras = buffer, contagens, palavras
+        linhas = []
+        identificadores = []
+        for posicao, tags in enumerate(tags_novas, inicio):
+            for tag in tags:
+                linhas.append(posicao)
+                identificadores.append(self._ids[tag])
+            self._buffer_contagens[posicao] = len(tags)
+        linhas = np.array(linhas, dtype=np.intp)
+        identificadores = np.array(identificadores, dtype=np.uint64)
+        np.bitwise_or.at(
+            self._buffer,
+            (linhas, (identificadores >> np.uint64(6)).astype(np.intp)),
+            np.left_shift(np.uint64(1), identificadores & np.uint64(63)),
+        )
+        self._quantidade = quantidade
+        self._matriz = self._buffer[:quantidade]
+        self._contagens = self._buffer_contagens[:quantidade]
+
+    def _mascara(self, tags, ignorar_desconhecidas):
+        mascara = np.zeros(self._palavras, dtype=np.uint64)
+        for tag in tags:
+            identificador = self._ids.get(tag)
+            if identificador is None:
+                if ignorar_desconhecidas:
+                    continue
+                return None
+            mascara[identificador >> 6] |= np.uint64(1) << np.uint64(identificador & 63)
+        return mascara
+
+    def basicas(self):
+        return np.flatnonzero(self._contagens == 1).tolist()
+
+    def superconjuntos(self, tags):
+        mascara = self._mascara(tags, ignorar_desconhecidas=False)
+        if mascara is None:
+            return []
+        return np.flatnonzero(((self._matriz & mascara) == mascara).all(axis=1)).tolist()
+
+    def _subconjuntos(self, tags):
+        complemento = ~self._mascara(tags, ignorar_desconhecidas=True)
+        return np.flatnonzero(~(self._matriz & complemento).any(axis=1))
+
+    def subconjuntos(self, tags):
+        return self._subconjuntos(tags).tolist()
+
+    def compativeis(self, assinatura):
+        candidatos = self._subconjuntos(frozenset().union(*assinatura))
+        restante = self._matriz[candidatos]
+        compativel = np.ones(len(candidatos), dtype=bool)
+        for tags in assinatura:
+            mascara = self._mascara(tags, ignorar_desconhecidas=True)
+            compativel &= (restante & mascara).any(axis=1)
+            restante &= ~mascara
+        compativel &= ~restante.any(axis=1)
+        return candidatos[compativel].tolist()
+
+
+def criar_matriz_tags(gerenciador, usar_numpy=None):
+    if usar_numpy is None:
+        usar_numpy = NUMPY_DISPONIVEL
+    if usar_numpy:
+        if not NUMPY_DISPONIVEL:
+            raise ImportError("O backend vetorizado requer o pacote numpy.")
+        return MatrizTagsNumpy(gerenciador)
+    return MatrizTagsPython(gerenciador)
@@ -0,0 +1,104 @@
+import csv
+import glob
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass, field
+from typing import List, Optional
+
+
+@dataclass
+class LinhaInvalida:
+    numero: int
+    motivo: str
+    arquivo: Optional[str] = None
+
+
+@dataclass
+class RelatorioCarga:
+    linhas_lidas: int = 0
+    entidades_carregadas: int = 0
+    linhas_invalidas: List[LinhaInvalida] = field(default_factory=list)
+
+    def incorporar(self, outro: "RelatorioCarga"):
+        self.linhas_lidas += outro.linhas_lidas
+        self.entidades_carregadas += outro.entidades_carregadas
+        self.linhas_invalidas.extend(outro.linhas_invalidas)
+
+
+def _posicao_coluna(cabecalho, coluna, obrigatoria=True) -> Optional[int]:
+    try:
+        return cabecalho.index(coluna)
+    except ValueError:
+        if obrigatoria:
+            raise ValueError(f"Coluna obrigatória ausente no CSV: {coluna}")
+        return None
+
+
+def ler_lotes_csv(arquivo, delimitador: str = ",", tamanho_lote: int = 10000):
+    if tamanho_lote < 1:
+        raise ValueError("O tamanho do lote deve ser positivo.")
+    leitor = csv.reader(arquivo, delimiter=delimitador)
+    cabecalho = next(leitor, None)
+    if cabecalho is None:
+        return
+    cabecalho = [coluna.strip() for coluna in cabecalho]
+    coluna_nome = _posicao_coluna(cabecalho, "nome")
+    coluna_tags = _posicao_coluna(cabecalho, "tags")
+    coluna_imagem = _posicao_coluna(cabecalho, "imagem", obrigatoria=False)
+
+    registros = []
+    relatorio = RelatorioCarga()
+    for linha in leitor:
+        if not linha:
+            continue
+        relatorio.linhas_lidas += 1
+        if coluna_nome >= len(linha) or not linha[coluna_nome].strip():
+            relatorio.linhas_invalidas.append(LinhaInvalida(leitor.line_num, "nome vazio"))
+        elif coluna_tags >= len(linha) or not linha[coluna_tags].strip():
+            relatorio.linhas_invalidas.append(LinhaInvalida(leitor.line_num, "tags ausentes"))
+        else:
+            caminho_imagem = None
+            if coluna_imagem is not None and coluna_imagem < len(linha):
+                caminho_imagem = linha[coluna_imagem].strip() or None
+            registros.append(
+                (
+                    linha[coluna_nome].strip(),
+                    [tag.strip() for tag in linha[coluna_tags].split(";")],
+                    caminho_imagem,
+                )
+            )
+        if relatorio.linhas_lidas >= tamanho_lote:
+            relatorio.entidades_carregadas = len(registros)
+            yield registros, relatorio
+            registros = []
+            relatorio = RelatorioCarga()
+    if relatorio.linhas_lidas:
+        relatorio.entidades_carregadas = len(registros)
+        yield registros, relatorio
+
+
+def ler_arquivo_csv(caminho_csv: str, delimitador: str = ","):
+    registros = []
+    relatorio = RelatorioCarga()
+    with open(caminho_csv, newline="", encoding="utf-8") as csvfile:
+        for registros_lote, relatorio_lote in ler_lotes_csv(csvfile, delimitador):
+            registros.extend(registros_lote)
+            relatorio.incorporar(relatorio_lote)
+    for linha_invalida in relatorio.linhas_invalidas:
+        linha_invalida.arquivo = caminho_csv
+    return registros, relatorio
+
+
+def expandir_caminhos(caminhos):
+    if isinstance(caminhos, str):
+        return sorted(glob.glob(caminhos))
+    return list(caminhos)
+
+
+def ler_arquivos_csv(caminhos, delimitador: str = ",", processos: Optional[int] = None):
+    caminhos = expandir_caminhos(caminhos)
+    delimitadores = [delimitador] * len(caminhos)
+    if processos == 1 or len(caminhos) <= 1:
+        yield from map(ler_arquivo_csv, caminhos, delimitadores)
+        return
+    with ProcessPoolExecutor(max_workers=processos) as executor:
+        yield from executor.map(ler_arquivo_csv, caminhos, delimitadores)
@@ -0,0 +1,138 @@
+from array import array
+
+from package.entidade import Entidade
+from package.vocabulario_tags import VocabularioTags
+
+
+class VisaoEntidade(Entidade):
+
+    __slots__ = ("_catalogo", "_posicao")
+
+    def __init__(self, catalogo, posicao):
+        self._catalogo = catalogo
+        self._posicao = posicao
+
+    @property
+    def _nome(self):
+        return self._catalogo.nome(self._posicao)
+
+    @property
+    def _tags(self):
+        return self._catalogo.tags(self._posicao)
+
+    @property
+    def _caminho_imagem(self):
+        return self._catalogo.caminho_imagem(self._posicao)
+
+    @property
+    def _mascara(self):
+        return self._catalogo.mascara(self._posicao)
+
+    @property
+    def _vocabulario(self):
+        return self._catalogo.vocabulario
+
+    def set_nome(self, nome):
+        raise TypeError("Entidades de um catálogo colunar são somente leitura.")
+
+    def set_tags(self, tags):
+        raise TypeError("Entidades de um catálogo colunar são somente leitura.")
+
+    def set_caminho_imagem(self, caminho_imagem):
+        raise TypeError("Entidades de um catálogo colunar são somente leitura.")
+
+    def compactar(self, vocabulario):
+        if vocabulario is not self._catalogo.vocabulario:
+            raise TypeError("Entidades de um catálogo colunar são somente leitura.")
+
+    def __str__(self):
+        return f"{self._nome}, tags: {set(self._tags)}, imagem: {self._caminho_imagem}"
+
+    def __eq__(self, outra):
+        if not isinstance(outra, VisaoEntidade):
+            return NotImplemented
+        return self._catalogo is outra._catalogo and self._posicao == outra._posicao
+
+    def __hash__(self):
+        return hash((id(self._catalogo), self._posicao))
+
+
+class CatalogoColunar:
+
+    def __init__(self, vocabulario=None):
+        self._vocabulario = vocabulario if vocabulario is not None else VocabularioTags()
+        self._nomes_offsets = array("Q", [0])
+        self._nomes = bytearray()
+        self._imagens_offsets = array("Q", [0])
+        self._imagens = bytearray()
+        self._tags_offsets = array("Q", [0])
+        self._ids_tags = array("I")
+
+    def __len__(self):
+        return len(self._nomes_offsets) - 1
+
+    def __getitem__(self, posicao):
+        if isinstance(posicao, slice):
+            return [VisaoEntidade(self, indice) for indice in range(*posicao.indices(len(self)))]
+        if posicao < 0:
+            posicao += len(self)
+        if not 0 <= posicao < len(self):
+            raise IndexError("Posição fora do catálogo.")
+        return VisaoEntidade(self, posicao)
+
+    def __iter__(self):
+        for posicao in range(len(self)):
+            yield VisaoEntidade(self, posicao)
+
+    @property
+    def vocabulario(self):
+        return self._vocabulario
+
+    def append(self, entidade):
+        self.extend([entidade])
+
+    def extend(self, entidades):
+        internar = self._vocabulario.internar
+        for entidade in entidades:
+            self._nomes += entidade._nome.encode("utf-8")
+            self._nomes_offsets.append(len(self._nomes))
+            self._imagens += (entidade._caminho_imagem or "").encode("utf-8")
+            self._imagens_offsets.append(len(self._imagens))
+            self._ids_tags.extend(sorted(internar(tag) for tag in entidade._tags))
+            self._tags_offsets.append(len(self._ids_tags))
+
+    def nome(self, posicao):
+        return self._nomes[self._nomes_offsets[posicao]:self._nomes_offsets[posicao + 1]].decode("utf-8")
+
+    def caminho_imagem(self, posicao):
+        inicio = self._imagens_offsets[posicao]
+        return self._imagens[inicio:self._imagens_offsets[posicao + 1]].decode("utf-8") or None
+
+    def ids_tags(self, posicao):
+        return self._ids_tags[self._tags_offsets[posicao]:self._tags_offsets[posicao + 1]]
+
+    def quantidade_tags(self, posicao):
+        return self._tags_offsets[posicao + 1] - self._tags_offsets[posicao]
+
+    def tags(self, posicao):
+        tag = self._vocabulario.tag
+        return frozenset(tag(identificador) for identificador in self.ids_tags(posicao))
+
+    def mascara(self, posicao):
+        mascara = 0
+        for identificador in self.ids_tags(posicao):
+            mascara |= 1 << identificador
+        return mascara
+
+    def tamanho_bytes(self):
+        colunas = (
+            self._nomes_offsets,
+            self._imagens_offsets,
+            self._tags_offsets,
+            self._ids_tags,
+        )
+        return (
+            len(self._nomes)
+            + len(self._imagens)
+            + sum(len(coluna) * coluna.itemsize for coluna in colunas)
+        )
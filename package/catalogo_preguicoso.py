@@ -0,0 +1,105 @@
+import sys
+
+from package.entidade import Entidade
+
+
+class CatalogoPreguicoso:
+
+    def __init__(self, vocabulario=None):
+        self._vocabulario = vocabulario
+        self._snapshot = None
+        self._base = 0
+        self._registros = []
+        self._materializadas = {}
+
+    def __len__(self):
+        return self._base + len(self._registros)
+
+    def __getitem__(self, posicao):
+        if isinstance(posicao, slice):
+            return [self[indice] for indice in range(*posicao.indices(len(self)))]
+        if posicao < 0:
+            posicao += len(self)
+        if not 0 <= posicao < len(self):
+            raise IndexError("Posição fora do catálogo.")
+        entidade = self._materializadas.get(posicao)
+        if entidade is None:
+            entidade = self._materializadas[posicao] = Entidade(
+                self.nome(posicao), self.tags(posicao), self.caminho_imagem(posicao)
+            )
+        if self._vocabulario is not None and entidade._vocabulario is not self._vocabulario:
+            entidade.compactar(self._vocabulario)
+        return entidade
+
+    def __iter__(self):
+        for posicao in range(len(self)):
+            yield self[posicao]
+
+    @property
+    def materializadas(self):
+        return len(self._materializadas)
+
+    def anexar_snapshot(self, snapshot):
+        if len(self):
+            raise ValueError("O snapshot deve ser anexado a um catálogo vazio.")
+        self._snapshot = snapshot
+        self._base = len(snapshot)
+
+    def fechar(self):
+        if self._snapshot is not None:
+            self._snapshot.fechar()
+            self._snapshot = None
+
+    def append(self, entidade):
+        self.extend([entidade])
+
+    def extend(self, entidades):
+        for entidade in entidades:
+            self._materializadas[len(self)] = entidade
+            self._registros.append(None)
+
+    def estender_registros(self, registros):
+        novos = [
+            (nome, tuple({sys.intern(tag) for tag in tags}), caminho_imagem)
+            for nome, tags, caminho_imagem in registros
+        ]
+        self._registros.extend(novos)
+        return novos
+
+    def _registro(self, posicao):
+        return self._registros[posicao - self._base]
+
+    def nome(self, posicao):
+        entidade = self._materializadas.get(posicao)
+        if entidade is not None:
+            return entidade._nome
+        if posicao < self._base:
+            return self._snapshot.nome(posicao)
+        return self._registro(posicao)[0]
+
+    def tags(self, posicao):
+        entidade = self._materializadas.get(posicao)
+        if entidade is not None:
+            return frozenset(entidade._tags)
+        if posicao < self._base:
+            return frozenset(self._snapshot.tags(posicao))
+        return frozenset(self._registro(posicao)[1])
+
+    def quantidade_tags(self, posicao):
+        entidade = self._materializadas.get(posicao)
+        if entidade is not None:
+            return len(entidade._tags)
+        if posicao < self._base:
+            return len(self._snapshot.ids_tags(posicao))
+        return len(self._registro(posicao)[1])
+
+    def caminho_imagem(self, posicao):
+        entidade = self._materializadas.get(posicao)
+        if entidade is not None:
+            return entidade._caminho_imagem
+        if posicao < self._base:
+            return self._snapshot.caminho_imagem(posicao)
+        return self._registro(posicao)[2]
+
+    def mascara(self, posicao):
+        return self._vocabulario.mascara(self.tags(posicao))
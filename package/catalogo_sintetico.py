@@ -0,0 +1,85 @@
+import csv
+import random
+from typing import List, Tuple
+
+
+DISTRIBUICOES = ("uniforme", "geometrica")
+
+
+def _quantidade_tags(aleatorio, minimo, maximo, distribuicao):
+    if distribuicao == "uniforme":
+        return aleatorio.randint(minimo, maximo)
+    if distribuicao == "geometrica":
+        quantidade = minimo
+        while quantidade < maximo and aleatorio.random() < 0.5:
+            quantidade += 1
+        return quantidade
+    raise ValueError(f"Distribuição desconhecida: {distribuicao}")
+
+
+def gerar_registros(
+    quantidade: int,
+    tamanho_vocabulario: int = 1000,
+    tags_por_entidade: Tuple[int, int] = (1, 5),
+    distribuicao: str = "geometrica",
+    expoente_popularidade: float = 1.0,
+    proporcao_basicas: float = 0.1,
+    semente: int = 0,
+) -> List[Tuple[str, List[str], str]]:
+    minimo, maximo = tags_por_entidade
+    if not 1 <= minimo <= maximo <= tamanho_vocabulario:
+        raise ValueError("Faixa de tags por entidade inválida para o vocabulário.")
+    if not 0.0 <= proporcao_basicas <= 1.0:
+        raise ValueError("A proporção de criaturas básicas deve estar entre 0 e 1.")
+    aleatorio = random.Random(semente)
+    vocabulario = [f"TAG{indice}" for indice in range(tamanho_vocabulario)]
+    pesos = [1 / (indice + 1) ** expoente_popularidade for indice in range(tamanho_vocabulario)]
+    acumulados = []
+    total = 0.0
+    for peso in pesos:
+        total += peso
+        acumulados.append(total)
+
+    registros = []
+    quantidade_basicas = min(round(quantidade * proporcao_basicas), tamanho_vocabulario)
+    for indice, tag in enumerate(vocabulario[:quantidade_basicas]):
+        registros.append((f"Basica {indice}", [tag], f"assets/sintetico/{indice}.png"))
+    for indice in range(len(registros), quantidade):
+        alvo = _quantidade_tags(aleatorio, max(minimo, 2), max(maximo, 2), distribuicao)
+        tags = set()
+        while len(tags) < alvo:
+            tags.update(aleatorio.choices(vocabulario, cum_weights=acumulados, k=alvo - len(tags)))
+        registros.append((f"Quimera {indice}", sorted(tags), f"assets/sintetico/{indice}.png"))
+    return registros
+
+
+def escrever_csv(registros, caminho_csv: str, delimitador: str = ","):
+    with open(caminho_csv, "w", newline="", encoding="utf-8") as arquivo:
+        escritor = csv.writer(arquivo, delimiter=delimitador)
+        escritor.writerow(["nome", "tags", "imagem"])
+        for nome, tags, caminho_imagem in registros:
+            escritor.writerow([nome, ";".join(tags), caminho_imagem or ""])
+
+
+def gerar_gerenciador(quantidade: int, **opcoes_catalogo):
+    from package.entidade import Entidade
+    from package.gerenciador_entidades import GerenciadorEntidades
+
+    opcoes_gerenciador = {
+        chave: opcoes_catalogo.pop(chave)
+        for chave in list(opcoes_catalogo)
+        if chave not in {
+            "tamanho_vocabulario",
+            "tags_por_entidade",
+            "distribuicao",
+            "expoente_popularidade",
+            "proporcao_basicas",
+            "semente",
+        }
+    }
+    gerenciador = GerenciadorEntidades(predefinidas=False, **opcoes_gerenciador)
+    gerenciador.adicionar_varias(
+        Entidade(nome, tags, caminho_imagem)
+        for nome, tags, caminho_imagem in gerar_registros(quantidade, **opcoes_catalogo)
+    )
+    return gerenciador
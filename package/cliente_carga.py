@@ -0,0 +1,146 @@
+import argparse
+import asyncio
+import itertools
+import json
+import os
+import random
+import tempfile
+import time
+from dataclasses import dataclass, field
+from typing import List
+
+
+@dataclass
+class RelatorioCargaServidor:
+    requisicoes: int = 0
+    erros: int = 0
+    duracao: float = 0.0
+    latencias: List[float] = field(default_factory=list)
+
+    @property
+    def requisicoes_por_segundo(self):
+        return self.requisicoes / self.duracao if self.duracao else 0.0
+
+    def percentil(self, fracao):
+        if not self.latencias:
+            return 0.0
+        ordenadas = sorted(self.latencias)
+        indice = min(len(ordenadas) - 1, int(round(fracao * (len(ordenadas) - 1))))
+        return ordenadas[indice]
+
+    def resumo(self):
+        return (
+            f"{self.requisicoes} requisições em {self.duracao:.2f}s "
+            f"({self.requisicoes_por_segundo:.0f} req/s), erros: {self.erros}, "
+            f"p50: {self.percentil(0.50) * 1000:.2f}ms, "
+            f"p95: {self.percentil(0.95) * 1000:.2f}ms, "
+            f"p99: {self.percentil(0.99) * 1000:.2f}ms"
+        )
+
+
+class ClienteFusao:
+
+    def __init__(self, leitor, escritor):
+        self._leitor = leitor
+        self._escritor = escritor
+        self._sequencia = itertools.count()
+
+    @classmethod
+    async def conectar(cls, host, porta):
+        from package.servidor import LIMITE_LINHA_BYTES
+
+        leitor, escritor = await asyncio.open_connection(host, porta, limit=LIMITE_LINHA_BYTES)
+        return cls(leitor, escritor)
+
+    async def pedir(self, acao, jogador, **dados):
+        pedido = {"id": next(self._sequencia), "acao": acao, "jogador": jogador, **dados}
+        self._escritor.write(json.dumps(pedido, ensure_ascii=False).encode("utf-8") + b"\n")
+        await self._escritor.drain()
+        linha = await self._leitor.readline()
+        if not linha:
+            raise ConnectionError("O servidor encerrou a conexão.")
+        return json.loads(linha)
+
+    async def fechar(self):
+        self._escritor.close()
+        await self._escritor.wait_closed()
+
+
+async def _simular_jogador(host, porta, jogador, requisicoes, basicas, relatorio):
+    cliente = await ClienteFusao.conectar(host, porta)
+    try:
+        alternativas = 0
+        for _ in range(requisicoes):
+            if alternativas:
+                pedido = ("responder", {"resposta": random.randrange(alternativas)})
+            elif random.random() < 0.5:
+                pedido = ("pergunta", {})
+            else:
+                pedido = ("fusao", {"criaturas": random.sample(basicas, 2)})
+            inicio = time.perf_counter()
+            resposta = await cliente.pedir(pedido[0], jogador, **pedido[1])
+            relatorio.latencias.append(time.perf_counter() - inicio)
+            relatorio.requisicoes += 1
+            if not resposta.get("ok"):
+                relatorio.erros += 1
+            if pedido[0] == "pergunta":
+                alternativas = len(resposta.get("alternativas", ()))
+            elif pedido[0] == "responder" and resposta.get("correta"):
+                alternativas = 0
+    finally:
+        await cliente.fechar()
+
+
+async def gerar_carga(host, porta, jogadores=50, requisicoes=100, basicas=None, semente=None):
+    if semente is not None:
+        random.seed(semente)
+    if basicas is None:
+        from package.gerenciador_entidades import GerenciadorEntidades
+
+        basicas = [entidade._nome for entidade in GerenciadorEntidades().listar_basicas()]
+    relatorio = RelatorioCargaServidor()
+    inicio = time.perf_counter()
+    await asyncio.gather(
+        *(
+            _simular_jogador(host, porta, f"jogador-{indice}", requisicoes, basicas, relatorio)
+            for indice in range(jogadores)
+        )
+    )
+    relatorio.duracao = time.perf_counter() - inicio
+    return relatorio
+
+
+async def _carga_local(jogadores, requisicoes):
+    from package.armazenamento import ArmazenamentoSQLite
+    from package.servidor import ServidorFusao
+
+    with tempfile.TemporaryDirectory() as diretorio:
+        with ArmazenamentoSQLite(os.path.join(diretorio, "carga.sqlite3")) as armazenamento:
+            servidor = await ServidorFusao(armazenamento).iniciar("127.0.0.1", 0)
+            porta = servidor.sockets[0].getsockname()[1]
+            async with servidor:
+                return await gerar_carga("127.0.0.1", porta, jogadores, requisicoes)
+
+
+def main(argumentos=None):
+    parser = argparse.ArgumentParser(description="Gerador de carga para o servidor de fusões.")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--porta", type=int, default=8765)
+    parser.add_argument("--jogadores", type=int, default=50)
+    parser.add_argument("--requisicoes", type=int, default=100, help="requisições por jogador")
+    parser.add_argument(
+        "--local", action="store_true", help="sobe um servidor temporário no próprio processo"
+    )
+    opcoes = parser.parse_args(argumentos)
+    if opcoes.local:
+        relatorio = asyncio.run(_carga_local(opcoes.jogadores, opcoes.requisicoes))
+    else:
+        relatorio = asyncio.run(
+            gerar_carga(opcoes.host, opcoes.porta, opcoes.jogadores, opcoes.requisicoes)
+        )
+    print(relatorio.resumo())
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,42 @@
+from concurrent.futures import ProcessPoolExecutor
+from typing import Optional
+
+from package.tabela_fusoes import avaliar_assinaturas
+
+
+TAMANHO_BLOCO = 256
+
+_gerenciador_processo = None
+
+
+def _iniciar_processo(tags_por_posicao):
+    global _gerenciador_processo
+    from package.gerenciador_entidades import GerenciadorEntidades
+
+    _gerenciador_processo = GerenciadorEntidades(predefinidas=False, preguicoso=True)
+    _gerenciador_processo._adicionar_registros(("", tags, None) for tags in tags_por_posicao)
+
+
+def _avaliar_bloco(assinaturas):
+    return avaliar_assinaturas(
+        assinaturas, _gerenciador_processo._ids_subconjuntos, _gerenciador_processo._tags_em
+    )
+
+
+def avaliar_em_processos(
+    assinaturas,
+    tags_por_posicao,
+    processos: Optional[int] = None,
+    tamanho_bloco: int = TAMANHO_BLOCO,
+):
+    blocos = [
+        assinaturas[inicio:inicio + tamanho_bloco]
+        for inicio in range(0, len(assinaturas), tamanho_bloco)
+    ]
+    resultados = []
+    with ProcessPoolExecutor(
+        max_workers=processos, initializer=_iniciar_processo, initargs=(tags_por_posicao,)
+    ) as executor:
+        for parcial in executor.map(_avaliar_bloco, blocos):
+            resultados.extend(parcial)
+    return resultados
@@ -1,5 +1,7 @@
 class Entidade:
 
+    __slots__ = ("_nome", "_conjunto_tags", "_caminho_imagem", "_mascara", "_vocabulario")
+
     def __init__(self, nome, tags, caminho_imagem=None):
         self.set_nome(nome)
         self.set_tags(tags)
@@ -9,7 +11,9 @@ class Entidade:
         self._nome = nome
 
     def set_tags(self, tags):
-        self._tags = set(tags)
+        self._conjunto_tags = set(tags)
+        self._mascara = None
+        self._vocabulario = None
 
     def set_caminho_imagem(self, caminho_imagem):
         self._caminho_imagem = caminho_imagem
@@ -18,6 +22,12 @@ class Entidade:
     def nome(self):
         return self._nome
 
+    @property
+    def _tags(self):
+        if self._vocabulario is not None:
+            return self._vocabulario.tags(self._mascara)
+        return self._conjunto_tags
+
     @property
     def tags(self):
         return set(self._tags)
@@ -29,5 +39,16 @@ class Entidade:
     def __str__(self):
         return f"{self._nome}, tags: {self._tags}, imagem: {self._caminho_imagem}"
 
+    @property
+    def mascara(self):
+        return self._mascara
+
+    def compactar(self, vocabulario):
+        self._mascara = vocabulario.mascara(self._tags)
+        self._vocabulario = vocabulario
+        self._conjunto_tags = None
+
     def contem(self, outra):
+        if self._vocabulario is not None and self._vocabulario is outra._vocabulario:
+            return self._mascara & outra._mascara == outra._mascara
         return outra._tags.issubset(self._tags)
@@ -1,5 +1,18 @@
 import csv
+from collections import OrderedDict
+from typing import Optional
+
+from package.backend_numpy import criar_matriz_tags
+from package.carga_csv import RelatorioCarga, ler_arquivos_csv, ler_lotes_csv
+from package.catalogo_colunar import CatalogoColunar
+from package.catalogo_preguicoso import CatalogoPreguicoso
+from package.cruzamento_lote import avaliar_em_processos
+from package.grafo_fusoes import GrafoFusoes
+from package.indice_similaridade import IndiceSimilaridade
 from package.entidade import Entidade
+from package.snapshot import IndiceNomesSnapshot, PostagemSnapshot, Snapshot, gravar_snapshot
+from package.tabela_fusoes import TabelaFusoes, assinatura_fusao, avaliar_assinaturas
+from package.vocabulario_tags import VocabularioTags
 
 
 PREDEFINED_ENTIDADES = [
@@ -24,23 +37,240 @@ PREDEFINED_ENTIDADES = [
 	{"nome": "Unicórnio Alado", "tags": ["CAVALO","TOURO","AVE"], "imagem": "assets/unicornio_alado.png"}
 ]
 
+TAMANHO_CACHE_CONSULTAS = 1024
+
 
 
 class GerenciadorEntidades:
 
-    def __init__(self):
-        self._entidades = []
-        self._carregar_predefinidas()
+    def __init__(
+        self,
+        compacto=False,
+        tabela_fusoes=False,
+        predefinidas=True,
+        colunar=False,
+        preguicoso=False,
+        tamanho_cache=TAMANHO_CACHE_CONSULTAS,
+        vetorizado=False,
+    ):
+        if colunar and preguicoso:
+            raise ValueError("Os modos colunar e preguicoso não podem ser combinados.")
+        self._versao = 0
+        self._vocabulario = VocabularioTags() if compacto else None
+        if colunar:
+            self._entidades = CatalogoColunar(self._vocabulario)
+        elif preguicoso:
+            self._entidades = CatalogoPreguicoso(self._vocabulario)
+        else:
+            self._entidades = []
+        self._indice_tags = {}
+        self._ids_sem_tags = []
+        self._indice_nomes = {}
+        self._tabela_fusoes = TabelaFusoes(self) if tabela_fusoes else None
+        self._grafo_fusoes = None
+        self._indice_similaridade = None
+        self._vetorizado = vetorizado
+        self._matriz_tags = None
+        self._tamanho_cache = tamanho_cache
+        self._cache_consultas = OrderedDict()
+        self._versao_cache = self._versao
+        self._acertos_cache = 0
+        self._falhas_cache = 0
+        if predefinidas:
+            self._carregar_predefinidas()
 
     def _carregar_predefinidas(self):
-        for dados in PREDEFINED_ENTIDADES:
-            entidade = Entidade(
-                dados["nome"], dados["tags"], dados.get("imagem")
-            )
-            self._entidades.append(entidade)
+        self._adicionar_registros(
+            (dados["nome"], dados["tags"], dados.get("imagem"))
+            for dados in PREDEFINED_ENTIDADES
+        )
+
+    def __len__(self):
+        return len(self._entidades)
+
+    @property
+    def versao(self):
+        return self._versao
+
+    @property
+    def tabela_fusoes(self):
+        return self._tabela_fusoes
+
+    def grafo_fusoes(self):
+        if self._grafo_fusoes is None or self._grafo_fusoes.versao != self._versao:
+            self._grafo_fusoes = GrafoFusoes(self)
+        return self._grafo_fusoes
+
+    def matriz_tags(self):
+        if self._matriz_tags is None or self._matriz_tags.versao != self._versao:
+            self._matriz_tags = criar_matriz_tags(self)
+        return self._matriz_tags
+
+    def indice_similaridade(self):
+        if self._indice_similaridade is None or self._indice_similaridade.versao != self._versao:
+            self._indice_similaridade = IndiceSimilaridade(self)
+        return self._indice_similaridade
 
     def adicionar(self, entidade: Entidade):
-        self._entidades.append(entidade)
+        self.adicionar_varias([entidade])
+
+    def adicionar_varias(self, entidades):
+        entidades = list(entidades)
+        if not entidades:
+            return
+        if isinstance(self._entidades, list):
+            self._compactar(entidades)
+        inicio = len(self._entidades)
+        self._entidades.extend(entidades)
+        self._registrar_adicao(inicio, [(entidade._nome, entidade._tags) for entidade in entidades])
+
+    def _adicionar_registros(self, registros):
+        if not isinstance(self._entidades, CatalogoPreguicoso):
+            self.adicionar_varias(
+                Entidade(nome, tags, caminho_imagem)
+                for nome, tags, caminho_imagem in registros
+            )
+            return
+        inicio = len(self._entidades)
+        novos = self._entidades.estender_registros(registros)
+        if novos:
+            self._registrar_adicao(inicio, [(nome, tags) for nome, tags, _caminho_imagem in novos])
+
+    def _registrar_adicao(self, inicio, nomes_tags):
+        self._versao += 1
+        self._indexar(inicio, nomes_tags)
+        if self._tabela_fusoes is not None:
+            self._tabela_fusoes.adicionar(inicio, [tags for _nome, tags in nomes_tags])
+        if self._matriz_tags is not None and self._matriz_tags.versao == self._versao - 1:
+            self._matriz_tags.adicionar(inicio, [tags for _nome, tags in nomes_tags], self._versao)
+
+    def _compactar(self, entidades):
+        if self._vocabulario is None:
+            return
+        for entidade in entidades:
+            if entidade._vocabulario is not self._vocabulario:
+                entidade.compactar(self._vocabulario)
+
+    def _indexar(self, inicio, nomes_tags):
+        novas_postagens = {}
+        for posicao, (nome, tags) in enumerate(nomes_tags, inicio):
+            self._indice_nomes.setdefault(nome, []).append(posicao)
+            if not tags:
+                self._ids_sem_tags.append(posicao)
+            for tag in tags:
+                posicoes_tag = novas_postagens.get(tag)
+                if posicoes_tag is None:
+                    posicoes_tag = novas_postagens[tag] = []
+                posicoes_tag.append(posicao)
+        for tag, posicoes_tag in novas_postagens.items():
+            postagens = self._indice_tags.get(tag)
+            if postagens is None:
+                self._indice_tags[tag] = set(posicoes_tag)
+            else:
+                postagens.update(posicoes_tag)
+
+    def reindexar(self):
+        self._versao += 1
+        self._indice_tags = {}
+        self._ids_sem_tags = []
+        self._indice_nomes = {}
+        if isinstance(self._entidades, list):
+            self._compactar(self._entidades)
+        self._indexar(
+            0,
+            [(self._nome_em(posicao), self._tags_em(posicao)) for posicao in range(len(self._entidades))],
+        )
+
+    @classmethod
+    def carregar_snapshot(cls, caminho, **opcoes):
+        if not opcoes.get("colunar"):
+            opcoes.setdefault("preguicoso", True)
+        gerenciador = cls(predefinidas=False, **opcoes)
+        if isinstance(gerenciador._entidades, CatalogoPreguicoso):
+            snapshot = Snapshot(caminho)
+            if gerenciador._vocabulario is not None:
+                for tag in snapshot.vocabulario:
+                    gerenciador._vocabulario.internar(tag)
+            gerenciador._entidades.anexar_snapshot(snapshot)
+            gerenciador._restaurar(snapshot)
+            return gerenciador
+        with Snapshot(caminho) as snapshot:
+            entidades = [snapshot.entidade(posicao) for posicao in range(len(snapshot))]
+            if gerenciador._vocabulario is not None:
+                for tag in snapshot.vocabulario:
+                    gerenciador._vocabulario.internar(tag)
+        gerenciador.adicionar_varias(entidades)
+        return gerenciador
+
+    def _restaurar(self, snapshot):
+        self._versao += 1
+        self._indice_nomes = IndiceNomesSnapshot(snapshot)
+        self._ids_sem_tags = list(snapshot.sem_tags)
+        self._indice_tags = {}
+        for identificador, tag in enumerate(snapshot.vocabulario):
+            postagem = PostagemSnapshot(snapshot, identificador)
+            if len(postagem):
+                self._indice_tags[tag] = postagem
+
+    def salvar_snapshot(self, caminho):
+        gravar_snapshot(self, caminho)
+
+    def fechar(self):
+        if isinstance(self._entidades, CatalogoPreguicoso):
+            self._entidades.fechar()
+
+    def _ids_superconjuntos(self, tags):
+        if not tags:
+            return range(len(self._entidades))
+        postagens = []
+        for tag in tags:
+            postagem = self._indice_tags.get(tag)
+            if not postagem:
+                return []
+            postagens.append(postagem)
+        postagens.sort(key=len)
+        menor, outras = postagens[0], postagens[1:]
+        return sorted(
+            posicao for posicao in menor if all(posicao in postagem for postagem in outras)
+        )
+
+    def _nome_em(self, posicao):
+        if isinstance(self._entidades, list):
+            return self._entidades[posicao]._nome
+        return self._entidades.nome(posicao)
+
+    def _tags_em(self, posicao):
+        if isinstance(self._entidades, list):
+            return self._entidades[posicao]._tags
+        return self._entidades.tags(posicao)
+
+    def _caminho_imagem_em(self, posicao):
+        if isinstance(self._entidades, list):
+            return self._entidades[posicao]._caminho_imagem
+        return self._entidades.caminho_imagem(posicao)
+
+    def _quantidade_tags(self, posicao):
+        if isinstance(self._entidades, list):
+            return len(self._entidades[posicao]._tags)
+        return self._entidades.quantidade_tags(posicao)
+
+    def _mascara_em(self, posicao):
+        if isinstance(self._entidades, list):
+            return self._mascara_de(self._entidades[posicao], internar=True)
+        return self._entidades.mascara(posicao)
+
+    def _ids_subconjuntos(self, tags):
+        contagem = {}
+        for tag in tags:
+            for posicao in self._indice_tags.get(tag, ()):
+                contagem[posicao] = contagem.get(posicao, 0) + 1
+        ids = [
+            posicao
+            for posicao, quantidade in contagem.items()
+            if quantidade == self._quantidade_tags(posicao)
+        ]
+        ids.extend(self._ids_sem_tags)
+        return sorted(ids)
 
     def carregar_csv(self, caminho_csv: str, delimitador: str = ","):
         with open(caminho_csv, newline="", encoding="utf-8") as csvfile:
@@ -51,30 +281,74 @@ class GerenciadorEntidades:
                 caminho_imagem = linha.get("imagem")
                 if caminho_imagem is not None:
                     caminho_imagem = caminho_imagem.strip() or None
-                entidade = Entidade(nome, tags, caminho_imagem)
-                self.adicionar(entidade)
+                self._adicionar_registros([(nome, tags, caminho_imagem)])
+
+    def carregar_csv_em_lotes(
+        self,
+        caminho_csv: str,
+        delimitador: str = ",",
+        tamanho_lote: int = 10000,
+        progresso=None,
+    ) -> RelatorioCarga:
+        relatorio = RelatorioCarga()
+        with open(caminho_csv, newline="", encoding="utf-8") as csvfile:
+            for registros, relatorio_lote in ler_lotes_csv(csvfile, delimitador, tamanho_lote):
+                self._adicionar_registros(registros)
+                relatorio.incorporar(relatorio_lote)
+                if progresso is not None:
+                    progresso(relatorio)
+        return relatorio
+
+    def carregar_csvs(self, caminhos, delimitador: str = ",", processos=None) -> RelatorioCarga:
+        relatorio = RelatorioCarga()
+        for registros, relatorio_arquivo in ler_arquivos_csv(caminhos, delimitador, processos):
+            self._adicionar_registros(registros)
+            relatorio.incorporar(relatorio_arquivo)
+        return relatorio
 
     def get(self, nomes):
         resultado = []
         for nome in nomes:
-            for _entidade in self._entidades:
-                if _entidade._nome == nome:
-                    resultado.append(_entidade)
+            for posicao in self._indice_nomes.get(nome, ()):
+                resultado.append(self._entidades[posicao])
         return resultado
 
+    def buscar_nomes(self, nomes):
+        return {
+            nome: [self._entidades[posicao] for posicao in self._indice_nomes.get(nome, ())]
+            for nome in nomes
+        }
+
     def listar_nomes(self):
-        return sorted(entidade._nome for entidade in self._entidades)
+        if isinstance(self._entidades, list):
+            return sorted(entidade._nome for entidade in self._entidades)
+        return sorted(map(self._entidades.nome, range(len(self._entidades))))
 
     def listar_basicas(self):
-        return sorted(
-            (entidade for entidade in self._entidades if len(entidade._tags) == 1),
-            key=lambda entidade: entidade._nome,
-        )
+        if self._vetorizado:
+            basicas = [self._entidades[posicao] for posicao in self.matriz_tags().basicas()]
+        elif isinstance(self._entidades, list):
+            basicas = [entidade for entidade in self._entidades if len(entidade._tags) == 1]
+        else:
+            quantidade_tags = self._entidades.quantidade_tags
+            basicas = [
+                self._entidades[posicao]
+                for posicao in range(len(self._entidades))
+                if quantidade_tags(posicao) == 1
+            ]
+        return sorted(basicas, key=lambda entidade: entidade._nome)
 
     def cruzar(self, entidades):
+        if self._tabela_fusoes is not None:
+            return self._tabela_fusoes.cruzar(entidades)
+        if self._vetorizado:
+            posicoes = self.matriz_tags().compativeis(assinatura_fusao(entidades))
+            return [self._entidades[posicao] for posicao in posicoes]
+        if self._vocabulario is not None:
+            return self._cruzar_mascaras(entidades)
         resultado = []
-        for _entidade in self._entidades:
-            tags_entidade = set(_entidade._tags)
+        for posicao in range(len(self._entidades)):
+            tags_entidade = set(self._tags_em(posicao))
             compativel = True
             for entidade in entidades:
                 alteracao = tags_entidade - entidade._tags
@@ -85,19 +359,113 @@ class GerenciadorEntidades:
             if len(tags_entidade) > 0:
                 compativel = False
             if compativel:
-                resultado.append(_entidade)
+                resultado.append(self._entidades[posicao])
         return resultado
 
+    def cruzar_em_lote(self, selecoes, processos: Optional[int] = 1):
+        assinaturas = [assinatura_fusao(selecao) for selecao in selecoes]
+        unicas = list(dict.fromkeys(assinaturas))
+        posicoes = dict(zip(unicas, self._posicoes_assinaturas(unicas, processos)))
+        return [
+            [self._entidades[posicao] for posicao in posicoes[assinatura]]
+            for assinatura in assinaturas
+        ]
+
+    def _posicoes_assinaturas(self, assinaturas, processos):
+        tabela = self._tabela_fusoes
+        pendentes = assinaturas
+        if tabela is not None:
+            pendentes = [assinatura for assinatura in assinaturas if assinatura not in tabela]
+        if processos == 1 or len(pendentes) <= 1:
+            calculadas = avaliar_assinaturas(pendentes, self._ids_subconjuntos, self._tags_em)
+        else:
+            tags_por_posicao = [tuple(self._tags_em(posicao)) for posicao in range(len(self._entidades))]
+            calculadas = avaliar_em_processos(pendentes, tags_por_posicao, processos)
+        if tabela is None:
+            return calculadas
+        for assinatura, posicoes in zip(pendentes, calculadas):
+            tabela.registrar(assinatura, posicoes)
+        return [tabela.posicoes(assinatura) for assinatura in assinaturas]
+
+    def similares(self, consulta, k: int = 10, minimo: float = 0.0):
+        if isinstance(consulta, Entidade):
+            tags = consulta._tags
+            excluir = [
+                posicao
+                for posicao in self._indice_nomes.get(consulta._nome, ())
+                if self._entidades[posicao] == consulta
+            ]
+        else:
+            tags = consulta
+            excluir = []
+        return self.indice_similaridade().similares(tags, k, minimo, excluir)
+
+    def _mascara_de(self, entidade, internar=False):
+        if entidade._vocabulario is self._vocabulario:
+            return entidade._mascara
+        return self._vocabulario.mascara(entidade._tags, internar=internar)
+
+    def _cruzar_mascaras(self, entidades):
+        mascaras = [self._mascara_de(entidade) for entidade in entidades]
+        resultado = []
+        for posicao in range(len(self._entidades)):
+            restante = self._mascara_em(posicao)
+            compativel = True
+            for mascara in mascaras:
+                if not restante & mascara:
+                    compativel = False
+                    break
+                restante &= ~mascara
+            if compativel and not restante:
+                resultado.append(self._entidades[posicao])
+        return resultado
+
+    def _consultar(self, consulta, calcular, tags):
+        if self._tamanho_cache <= 0:
+            return calcular(tags)
+        if self._versao_cache != self._versao:
+            self._cache_consultas.clear()
+            self._versao_cache = self._versao
+        chave = (consulta, frozenset(tags))
+        posicoes = self._cache_consultas.get(chave)
+        if posicoes is not None:
+            self._acertos_cache += 1
+            self._cache_consultas.move_to_end(chave)
+            return posicoes
+        self._falhas_cache += 1
+        posicoes = self._cache_consultas[chave] = tuple(calcular(tags))
+        if len(self._cache_consultas) > self._tamanho_cache:
+            self._cache_consultas.popitem(last=False)
+        return posicoes
+
+    def estatisticas_cache(self):
+        consultas = self._acertos_cache + self._falhas_cache
+        return {
+            "acertos": self._acertos_cache,
+            "falhas": self._falhas_cache,
+            "taxa_acertos": self._acertos_cache / consultas if consultas else 0.0,
+            "entradas": len(self._cache_consultas),
+            "capacidade": self._tamanho_cache,
+        }
+
+    def limpar_cache(self):
+        self._cache_consultas.clear()
+        self._acertos_cache = 0
+        self._falhas_cache = 0
+
     def evolucoes(self, entidade):
         resultado = []
-        for _entidade in self._entidades:
-            if _entidade != entidade and _entidade.contem(entidade):
+        for posicao in self._consultar("evolucoes", self._ids_superconjuntos, entidade._tags):
+            _entidade = self._entidades[posicao]
+            if _entidade != entidade:
                 resultado.append(_entidade)
         return resultado
 
     def derivacoes(self, entidade):
         resultado = []
-        for _entidade in self._entidades:
-            if _entidade != entidade and entidade.contem(_entidade):
+        calcular = self.matriz_tags().subconjuntos if self._vetorizado else self._ids_subconjuntos
+        for posicao in self._consultar("derivacoes", calcular, entidade._tags):
+            _entidade = self._entidades[posicao]
+            if _entidade != entidade:
                 resultado.append(_entidade)
         return resultado
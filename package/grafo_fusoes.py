@@ -0,0 +1,243 @@
+from itertools import combinations
+
+
+LIMITE_ENUMERACAO_SUBCONJUNTOS = 12
+
+
+class GrafoFusoes:
+
+    def __init__(self, gerenciador, iniciais=None):
+        self._gerenciador = gerenciador
+        self._versao = gerenciador.versao
+        self._iniciais = None if iniciais is None else list(iniciais)
+        self._assinaturas = {}
+        for posicao in range(len(gerenciador)):
+            tags = frozenset(gerenciador._tags_em(posicao))
+            posicoes = self._assinaturas.get(tags)
+            if posicoes is None:
+                posicoes = self._assinaturas[tags] = []
+            posicoes.append(posicao)
+        self._niveis = None
+        self._receitas = None
+        self._antecessores = None
+        self._sucessores = None
+
+    @property
+    def versao(self):
+        return self._versao
+
+    def _assinaturas_iniciais(self):
+        if self._iniciais is None:
+            return [tags for tags in self._assinaturas if len(tags) == 1]
+        return list(dict.fromkeys(
+            frozenset(self._gerenciador._tags_em(posicao))
+            for nome in self._iniciais
+            for posicao in self._gerenciador._indice_nomes.get(nome, ())
+        ))
+
+    def _calcular_alcance(self):
+        niveis = {}
+        receitas = {}
+        interseccoes = {}
+        disponiveis_por_tag = {}
+        pendentes_por_tag = {}
+        for tags in self._assinaturas:
+            for tag in tags:
+                pendentes = pendentes_por_tag.get(tag)
+                if pendentes is None:
+                    pendentes = pendentes_por_tag[tag] = []
+                pendentes.append(tags)
+
+        def disponibilizar(tags, alteradas):
+            for tag in tags:
+                disponiveis_por_tag.setdefault(tag, []).append(tags)
+                atual = interseccoes.get(tag)
+                if atual is None or not atual <= tags:
+                    interseccoes[tag] = tags if atual is None else atual & tags
+                    alteradas.add(tag)
+
+        alteradas = set()
+        for tags in self._assinaturas_iniciais():
+            niveis[tags] = 0
+            disponibilizar(tags, alteradas)
+
+        rodada = 1
+        while alteradas:
+            candidatas = []
+            for tag in alteradas:
+                pendentes = [tags for tags in pendentes_por_tag.get(tag, ()) if tags not in niveis]
+                pendentes_por_tag[tag] = pendentes
+                candidatas.extend(pendentes)
+            alcancadas = [
+                tags
+                for tags in dict.fromkeys(candidatas)
+                if all(tag in interseccoes for tag in tags)
+                and any(not tags <= interseccoes[tag] for tag in tags)
+            ]
+            for tags in alcancadas:
+                receitas[tags] = _receita_minima(tags, disponiveis_por_tag)
+            alteradas = set()
+            for tags in alcancadas:
+                niveis[tags] = rodada
+                disponibilizar(tags, alteradas)
+            rodada += 1
+        self._niveis = niveis
+        self._receitas = receitas
+
+    def _garantir_alcance(self):
+        if self._niveis is None:
+            self._calcular_alcance()
+
+    def _representante(self, tags):
+        return self._gerenciador._entidades[self._assinaturas[tags][0]]
+
+    def _entidades_de(self, tags):
+        entidades = self._gerenciador._entidades
+        return [entidades[posicao] for posicao in self._assinaturas.get(tags, ())]
+
+    def nivel(self, entidade):
+        self._garantir_alcance()
+        return self._niveis.get(frozenset(entidade._tags))
+
+    def alcancaveis(self):
+        self._garantir_alcance()
+        ordem = sorted(
+            (nivel, posicao)
+            for tags, nivel in self._niveis.items()
+            for posicao in self._assinaturas.get(tags, ())
+        )
+        return [self._gerenciador._entidades[posicao] for _nivel, posicao in ordem]
+
+    def inalcancaveis(self):
+        self._garantir_alcance()
+        posicoes = sorted(
+            posicao
+            for tags, posicoes in self._assinaturas.items()
+            if tags not in self._niveis
+            for posicao in posicoes
+        )
+        return [self._gerenciador._entidades[posicao] for posicao in posicoes]
+
+    def receita(self, entidade):
+        self._garantir_alcance()
+        receita = self._receitas.get(frozenset(entidade._tags))
+        if receita is None:
+            return None
+        return [self._representante(tags) for tags in receita]
+
+    def caminho(self, entidade):
+        self._garantir_alcance()
+        destino = frozenset(entidade._tags)
+        if destino not in self._niveis:
+            return None
+        passos = []
+        visitadas = set()
+        pilha = [(destino, False)]
+        while pilha:
+            tags, expandida = pilha.pop()
+            if expandida:
+                passos.append(
+                    ([self._representante(ingrediente) for ingrediente in self._receitas[tags]],
+                     self._representante(tags))
+                )
+                continue
+            if tags in visitadas or tags not in self._receitas:
+                continue
+            visitadas.add(tags)
+            pilha.append((tags, True))
+            for ingrediente in reversed(self._receitas[tags]):
+                pilha.append((ingrediente, False))
+        return passos
+
+    def arestas(self):
+        self._garantir_alcance()
+        for tags, receita in self._receitas.items():
+            ingredientes = [self._representante(ingrediente) for ingrediente in receita]
+            for resultado in self._entidades_de(tags):
+                yield ingredientes, resultado
+
+    def _calcular_hasse(self):
+        assinaturas_por_tag = {}
+        for tags in self._assinaturas:
+            for tag in tags:
+                assinaturas_por_tag.setdefault(tag, []).append(tags)
+        antecessores = {}
+        sucessores = {tags: [] for tags in self._assinaturas}
+        for maior in self._assinaturas:
+            if len(maior) <= LIMITE_ENUMERACAO_SUBCONJUNTOS:
+                subconjuntos = [
+                    frozenset(combinacao)
+                    for tamanho in range(len(maior))
+                    for combinacao in combinations(maior, tamanho)
+                    if frozenset(combinacao) in self._assinaturas
+                ]
+            else:
+                contagem = {}
+                for tag in maior:
+                    for tags in assinaturas_por_tag[tag]:
+                        contagem[tags] = contagem.get(tags, 0) + 1
+                subconjuntos = [
+                    tags for tags, quantidade in contagem.items()
+                    if quantidade == len(tags) and tags != maior
+                ]
+                if frozenset() in self._assinaturas:
+                    subconjuntos.append(frozenset())
+            subconjuntos.sort(key=len, reverse=True)
+            imediatos = []
+            for menor in subconjuntos:
+                if not any(menor < outro for outro in imediatos):
+                    imediatos.append(menor)
+            antecessores[maior] = imediatos
+            for menor in imediatos:
+                sucessores[menor].append(maior)
+        self._antecessores = antecessores
+        self._sucessores = sucessores
+
+    def _garantir_hasse(self):
+        if self._antecessores is None:
+            self._calcular_hasse()
+
+    def antecessores_hasse(self, entidade):
+        self._garantir_hasse()
+        return [
+            entidade_menor
+            for tags in self._antecessores.get(frozenset(entidade._tags), ())
+            for entidade_menor in self._entidades_de(tags)
+        ]
+
+    def sucessores_hasse(self, entidade):
+        self._garantir_hasse()
+        return [
+            entidade_maior
+            for tags in self._sucessores.get(frozenset(entidade._tags), ())
+            for entidade_maior in self._entidades_de(tags)
+        ]
+
+    def arestas_hasse(self):
+        self._garantir_hasse()
+        for maior, imediatos in self._antecessores.items():
+            for menor in imediatos:
+                yield menor, maior
+
+
+def _receita_minima(alvo, disponiveis_por_tag):
+    escolhidas = []
+    cobertas = set()
+    superconjunto = None
+    for tag in sorted(alvo):
+        if tag in cobertas:
+            continue
+        for tags in disponiveis_por_tag[tag]:
+            if not alvo <= tags:
+                escolhidas.append(tags)
+                cobertas |= tags & alvo
+                break
+            if superconjunto is None:
+                superconjunto = tags
+    if cobertas != alvo:
+        return (escolhidas[0], superconjunto)
+    for tags in list(reversed(escolhidas)):
+        restantes = [outras for outras in escolhidas if outras is not tags]
+        if frozenset().union(*restantes) >= alvo:
+            escolhidas = restantes
+    return tuple(escolhidas)
@@ -0,0 +1,75 @@
+import heapq
+from array import array
+
+
+def jaccard(tags, outras):
+    tags = frozenset(tags)
+    outras = frozenset(outras)
+    uniao = len(tags | outras)
+    return len(tags & outras) / uniao if uniao else 0.0
+
+
+class IndiceSimilaridade:
+
+    def __init__(self, gerenciador):
+        self._gerenciador = gerenciador
+        self._versao = gerenciador.versao
+        self._tamanhos = array(
+            "H", (gerenciador._quantidade_tags(posicao) for posicao in range(len(gerenciador)))
+        )
+
+    @property
+    def versao(self):
+        return self._versao
+
+    def posicoes_similares(self, tags, k=10, minimo=0.0, excluir=()):
+        consulta = frozenset(tags)
+        if not consulta or k <= 0:
+            return []
+        indice_tags = self._gerenciador._indice_tags
+        postagens = sorted((indice_tags.get(tag, ()) for tag in consulta), key=len)
+        tamanho_consulta = len(consulta)
+        tamanhos = self._tamanhos
+        necessarios = k + len(excluir)
+        contagem = {}
+        aceitando_novos = True
+        for indice, postagem in enumerate(postagens):
+            if aceitando_novos and len(contagem) >= necessarios:
+                limite = (len(postagens) - indice) / tamanho_consulta
+                pontuacoes = heapq.nlargest(
+                    necessarios,
+                    (
+                        quantidade / (tamanho_consulta + tamanhos[posicao] - quantidade)
+                        for posicao, quantidade in contagem.items()
+                    ),
+                )
+                aceitando_novos = pontuacoes[-1] <= limite
+            if aceitando_novos:
+                for posicao in postagem:
+                    contagem[posicao] = contagem.get(posicao, 0) + 1
+            elif len(contagem) < len(postagem):
+                for posicao in contagem:
+                    if posicao in postagem:
+                        contagem[posicao] += 1
+            else:
+                for posicao in postagem:
+                    if posicao in contagem:
+                        contagem[posicao] += 1
+        for posicao in excluir:
+            contagem.pop(posicao, None)
+        pontuadas = (
+            (quantidade / (tamanho_consulta + tamanhos[posicao] - quantidade), posicao)
+            for posicao, quantidade in contagem.items()
+        )
+        melhores = heapq.nsmallest(
+            k,
+            ((-similaridade, posicao) for similaridade, posicao in pontuadas if similaridade >= minimo),
+        )
+        return [(posicao, -similaridade) for similaridade, posicao in melhores]
+
+    def similares(self, tags, k=10, minimo=0.0, excluir=()):
+        entidades = self._gerenciador._entidades
+        return [
+            (entidades[posicao], similaridade)
+            for posicao, similaridade in self.posicoes_similares(tags, k, minimo, excluir)
+        ]
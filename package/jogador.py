@@ -1,56 +1,117 @@
-import os
-import pickle
+import threading
+from contextlib import contextmanager
+
+from package.armazenamento import ArmazenamentoPickle
 
 
 class Jogador:
-    def __init__(self, nome, arquivo_progresso="dados_jogador.pkl"):
+    def __init__(
+        self,
+        nome,
+        arquivo_progresso="dados_jogador.pkl",
+        armazenamento=None,
+        salvamento_automatico=None,
+    ):
         self._nome = nome
         self._arquivo_progresso = arquivo_progresso
+        if armazenamento is None:
+            armazenamento = ArmazenamentoPickle(arquivo_progresso)
+        self._armazenamento = armazenamento
         self._criaturas_descobertas = set()
         self._creditos = 0
+        self._profundidade_lote = 0
+        self._criaturas_pendentes = []
+        self._creditos_pendentes = 0
+        self._pendente = False
+        self._salvamento_automatico = salvamento_automatico
+        self._temporizador = None
+        self._falha_salvamento = None
+        self._trava = threading.RLock()
         self._carregar_progresso()
 
     def _carregar_progresso(self):
-        if not os.path.exists(self._arquivo_progresso):
-            return
+        self._criaturas_descobertas, self._creditos = self._armazenamento.carregar(self._nome)
+
+    def _salvar_progresso(self, novas_criaturas=(), variacao_creditos=0):
+        with self._trava:
+            self._criaturas_pendentes.extend(novas_criaturas)
+            self._creditos_pendentes += variacao_creditos
+            self._pendente = True
+            if self._profundidade_lote:
+                return
+            if self._salvamento_automatico is not None:
+                self._agendar_salvamento()
+                return
+            self.salvar()
+
+    def _agendar_salvamento(self):
+        if self._temporizador is None:
+            self._temporizador = threading.Timer(self._salvamento_automatico, self._salvar_agendado)
+            self._temporizador.daemon = True
+            self._temporizador.start()
+
+    def _salvar_agendado(self):
         try:
-            with open(self._arquivo_progresso, "rb") as arquivo:
-                dados = pickle.load(arquivo)
-                progresso = dados.get(self._nome)
-                if isinstance(progresso, dict):
-                    criaturas = progresso.get("criaturas", [])
-                    creditos = progresso.get("creditos", 0)
-                elif progresso is None:
-                    criaturas = []
-                    creditos = 0
-                else:
-                    criaturas = progresso
-                    creditos = 0
-                self._criaturas_descobertas = set(criaturas)
-                self._creditos = int(creditos)
-        except (pickle.PickleError, EOFError, AttributeError, ValueError):
-            self._criaturas_descobertas = set()
-            self._creditos = 0
-
-    def _salvar_progresso(self):
-        dados = {}
-        if os.path.exists(self._arquivo_progresso):
+            self.salvar()
+        except Exception as erro:
+            with self._trava:
+                self._falha_salvamento = erro
+
+    @property
+    def pendente(self):
+        return self._pendente
+
+    @property
+    def falha_salvamento(self):
+        return self._falha_salvamento
+
+    def salvar(self):
+        with self._trava:
+            if self._temporizador is not None:
+                self._temporizador.cancel()
+                self._temporizador = None
+            falha, self._falha_salvamento = self._falha_salvamento, None
+            if not self._pendente:
+                if falha is not None:
+                    raise falha
+                return
+            novas_criaturas = self._criaturas_pendentes
+            variacao_creditos = self._creditos_pendentes
+            self._criaturas_pendentes = []
+            self._creditos_pendentes = 0
+            self._pendente = False
             try:
-                with open(self._arquivo_progresso, "rb") as arquivo:
-                    dados = pickle.load(arquivo)
-            except (pickle.PickleError, EOFError, AttributeError, ValueError):
-                dados = {}
-        dados[self._nome] = {
-            "criaturas": list(self._criaturas_descobertas),
-            "creditos": self._creditos,
-        }
-        with open(self._arquivo_progresso, "wb") as arquivo:
-            pickle.dump(dados, arquivo)
+                self._armazenamento.registrar(
+                    self._nome,
+                    novas_criaturas,
+                    variacao_creditos,
+                    self._criaturas_descobertas,
+                    self._creditos,
+                )
+            except Exception:
+                self._criaturas_pendentes[:0] = novas_criaturas
+                self._creditos_pendentes += variacao_creditos
+                self._pendente = True
+                raise
+            if falha is not None:
+                raise falha
+
+    @contextmanager
+    def em_lote(self):
+        with self._trava:
+            self._profundidade_lote += 1
+        try:
+            yield self
+        finally:
+            with self._trava:
+                self._profundidade_lote -= 1
+                if not self._profundidade_lote:
+                    self.salvar()
 
     def registrar_fusao(self, criatura):
         if criatura not in self._criaturas_descobertas:
             self._criaturas_descobertas.add(criatura)
-            self._salvar_progresso()
+            self._salvar_progresso(novas_criaturas=[criatura])
 
     @property
     def criaturas_descobertas(self):
@@ -70,20 +131,38 @@ class Jogador:
         if quantidade == 0:
             return
         self._creditos += quantidade
-        self._salvar_progresso()
+        self._salvar_progresso(variacao_creditos=quantidade)
 
     def tem_creditos(self, quantidade: int) -> bool:
         if quantidade < 0:
             raise ValueError("A quantidade de créditos deve ser não negativa.")
         return self._creditos >= quantidade
 
-    def gastar_creditos(self, quantidade: int) -> bool:
+    def gastar_creditos(self, quantidade: int, novas_criaturas=()) -> bool:
         if quantidade < 0:
             raise ValueError("A quantidade de créditos deve ser não negativa.")
-        if self._creditos < quantidade:
-            return False
-        if quantidade == 0:
+        with self._trava:
+            novas_criaturas = [
+                criatura
+                for criatura in dict.fromkeys(novas_criaturas)
+                if criatura not in self._criaturas_descobertas
+            ]
+            if quantidade == 0:
+                for criatura in novas_criaturas:
+                    self.registrar_fusao(criatura)
+                return True
+            if self._armazenamento.transacional:
+                if self._creditos_pendentes:
+                    self.salvar()
+                gasto, self._creditos = self._armazenamento.debitar(
+                    self._nome, quantidade, novas_criaturas
+                )
+                if gasto:
+                    self._criaturas_descobertas.update(novas_criaturas)
+                return gasto
+            if self._creditos < quantidade:
+                return False
+            self._creditos -= quantidade
+            self._criaturas_descobertas.update(novas_criaturas)
+            self._salvar_progresso(novas_criaturas=novas_criaturas, variacao_creditos=-quantidade)
             return True
-        self._creditos -= quantidade
-        self._salvar_progresso()
-        return True
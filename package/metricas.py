@@ -0,0 +1,177 @@
+import functools
+import importlib
+import json
+import math
+import threading
+import time
+
+
+LIMITES_LATENCIA = (0.0001, 0.0005, 0.001, 0.005, 0.01, 0.05, 0.1, 0.5, 1.0, 5.0, math.inf)
+
+ALVOS_PADRAO = (
+    ("package.gerenciador_entidades", "GerenciadorEntidades", "get", "gerenciador.get"),
+    ("package.gerenciador_entidades", "GerenciadorEntidades", "cruzar", "gerenciador.cruzar"),
+    ("package.gerenciador_entidades", "GerenciadorEntidades", "evolucoes", "gerenciador.evolucoes"),
+    ("package.gerenciador_entidades", "GerenciadorEntidades", "derivacoes", "gerenciador.derivacoes"),
+    ("package.gerenciador_entidades", "GerenciadorEntidades", "listar_basicas", "gerenciador.listar_basicas"),
+    ("package.gerenciador_entidades", "GerenciadorEntidades", "carregar_csv", "gerenciador.carregar_csv"),
+    ("package.jogador", "Jogador", "_carregar_progresso", "jogador.carregar_progresso"),
+    ("package.jogador", "Jogador", "salvar", "jogador.salvar"),
+    ("package.armazenamento", "ArmazenamentoPickle", "carregar", "armazenamento.pickle.carregar"),
+    ("package.armazenamento", "ArmazenamentoPickle", "registrar", "armazenamento.pickle.registrar"),
+    ("package.armazenamento", "ArmazenamentoLog", "carregar", "armazenamento.log.carregar"),
+    ("package.armazenamento", "ArmazenamentoLog", "registrar", "armazenamento.log.registrar"),
+    ("package.armazenamento", "ArmazenamentoSQLite", "registrar", "armazenamento.sqlite.registrar"),
+    ("package.armazenamento", "ArmazenamentoSQLite", "debitar", "armazenamento.sqlite.debitar"),
+    ("package.miniaturas", "CacheMiniaturasDisco", "gerar", "miniaturas.gerar"),
+)
+
+
+class Histograma:
+
+    def __init__(self, limites=LIMITES_LATENCIA):
+        self._limites = limites
+        self._contagens = [0] * len(limites)
+        self.quantidade = 0
+        self.soma = 0.0
+
+    def observar(self, valor):
+        for indice, limite in enumerate(self._limites):
+            if valor <= limite:
+                self._contagens[indice] += 1
+                break
+        self.quantidade += 1
+        self.soma += valor
+
+    def acumulado(self):
+        total = 0
+        for limite, contagem in zip(self._limites, self._contagens):
+            total += contagem
+            yield limite, total
+
+    def como_dict(self):
+        return {
+            "quantidade": self.quantidade,
+            "soma": self.soma,
+            "faixas": {
+                ("+Inf" if math.isinf(limite) else repr(limite)): total
+                for limite, total in self.acumulado()
+            },
+        }
+
+
+class RegistroMetricas:
+
+    def __init__(self):
+        self._trava = threading.Lock()
+        self._contadores = {}
+        self._histogramas = {}
+
+    def incrementar(self, nome, valor=1):
+        with self._trava:
+            self._contadores[nome] = self._contadores.get(nome, 0) + valor
+
+    def observar(self, nome, valor):
+        with self._trava:
+            histograma = self._histogramas.get(nome)
+            if histograma is None:
+                histograma = self._histogramas[nome] = Histograma()
+            histograma.observar(valor)
+
+    def limpar(self):
+        with self._trava:
+            self._contadores.clear()
+            self._histogramas.clear()
+
+    def snapshot(self):
+        with self._trava:
+            return {
+                "contadores": dict(self._contadores),
+                "latencias": {
+                    nome: histograma.como_dict()
+                    for nome, histograma in self._histogramas.items()
+                },
+            }
+
+    def exportar_json(self):
+        return json.dumps(self.snapshot(), indent=2, sort_keys=True)
+
+    def exportar_prometheus(self, prefixo="chimera"):
+        dados = self.snapshot()
+        linhas = []
+        for nome, valor in sorted(dados["contadores"].items()):
+            metrica = _nome_prometheus(prefixo, nome) + "_total"
+            linhas.append(f"# TYPE {metrica} counter")
+            linhas.append(f"{metrica} {valor}")
+        for nome, histograma in sorted(dados["latencias"].items()):
+            metrica = _nome_prometheus(prefixo, nome) + "_segundos"
+            linhas.append(f"# TYPE {metrica} histogram")
+            for limite, total in histograma["faixas"].items():
+                linhas.append(f'{metrica}_bucket{{le="{limite}"}} {total}')
+            linhas.append(f"{metrica}_sum {histograma['soma']}")
+            linhas.append(f"{metrica}_count {histograma['quantidade']}")
+        return "\n".join(linhas) + "\n"
+
+
+def _nome_prometheus(prefixo, nome):
+    limpo = "".join(caractere if caractere.isalnum() else "_" for caractere in nome)
+    return f"{prefixo}_{limpo}"
+
+
+REGISTRO = RegistroMetricas()
+ATIVO = False
+
+_alvos = []
+_originais = {}
+
+
+def instrumentar(classe, metodo, nome=None):
+    alvo = (classe, metodo, nome or f"{classe.__name__}.{metodo}")
+    _alvos.append(alvo)
+    if ATIVO:
+        _envolver(*alvo)
+
+
+def registrar_bytes(nome, quantidade):
+    if ATIVO:
+        REGISTRO.incrementar(f"{nome}.bytes", quantidade)
+
+
+def _cronometrar(funcao, nome):
+    @functools.wraps(funcao)
+    def envoltorio(*args, **kwargs):
+        inicio = time.perf_counter()
+        try:
+            return funcao(*args, **kwargs)
+        finally:
+            REGISTRO.observar(nome, time.perf_counter() - inicio)
+
+    return envoltorio
+
+
+def _envolver(classe, metodo, nome):
+    chave = (classe, metodo)
+    if chave in _originais:
+        return
+    original = classe.__dict__[metodo]
+    _originais[chave] = original
+    setattr(classe, metodo, _cronometrar(original, nome))
+
+
+def ativar():
+    global ATIVO
+    if ATIVO:
+        return
+    for modulo, classe, metodo, nome in ALVOS_PADRAO:
+        _envolver(getattr(importlib.import_module(modulo), classe), metodo, nome)
+    for alvo in _alvos:
+        _envolver(*alvo)
+    ATIVO = True
+
+
+def desativar():
+    global ATIVO
+    for (classe, metodo), original in _originais.items():
+        setattr(classe, metodo, original)
+    _originais.clear()
+    ATIVO = False
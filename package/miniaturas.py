@@ -0,0 +1,217 @@
+import argparse
+import hashlib
+import os
+import queue
+import sys
+import threading
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+
+from package import metricas
+
+
+TAMANHO_MINIATURA = (80, 80)
+
+
+class CacheLRU:
+
+    def __init__(self, max_itens=None, max_bytes=None):
+        self._max_itens = max_itens
+        self._max_bytes = max_bytes
+        self._itens = OrderedDict()
+        self._bytes = 0
+
+    def __len__(self):
+        return len(self._itens)
+
+    def __contains__(self, chave):
+        return chave in self._itens
+
+    @property
+    def bytes_usados(self):
+        return self._bytes
+
+    def get(self, chave, padrao=None):
+        item = self._itens.get(chave)
+        if item is None:
+            return padrao
+        self._itens.move_to_end(chave)
+        return item[0]
+
+    def put(self, chave, valor, tamanho=0):
+        anterior = self._itens.pop(chave, None)
+        if anterior is not None:
+            self._bytes -= anterior[1]
+        self._itens[chave] = (valor, tamanho)
+        self._bytes += tamanho
+        self._liberar()
+
+    def _liberar(self):
+        while len(self._itens) > 1 and (
+            (self._max_itens is not None and len(self._itens) > self._max_itens)
+            or (self._max_bytes is not None and self._bytes > self._max_bytes)
+        ):
+            _, (_, tamanho) = self._itens.popitem(last=False)
+            self._bytes -= tamanho
+
+
+def gerar_miniatura(caminho, tamanho=TAMANHO_MINIATURA):
+    from PIL import Image
+
+    with open(caminho, "rb") as arquivo, Image.open(arquivo) as imagem:
+        miniatura = imagem.resize(tamanho, Image.LANCZOS)
+        metricas.registrar_bytes("miniaturas.origem.lidos", arquivo.tell())
+    return miniatura
+
+
+class CarregadorMiniaturas:
+
+    def __init__(self, processadores=4, gerar=gerar_miniatura):
+        self._executor = ThreadPoolExecutor(
+            max_workers=processadores, thread_name_prefix="miniaturas"
+        )
+        self._gerar = gerar
+        self._prontas = queue.SimpleQueue()
+        self._em_andamento = set()
+        self._falhas = set()
+
+    def solicitar(self, chave, caminho, tamanho=TAMANHO_MINIATURA):
+        if chave in self._falhas:
+            return False
+        if chave in self._em_andamento:
+            return True
+        self._em_andamento.add(chave)
+        futuro = self._executor.submit(self._gerar, caminho, tamanho)
+        futuro.add_done_callback(lambda futuro: self._prontas.put((chave, futuro)))
+        return True
+
+    def coletar(self):
+        prontas = []
+        while True:
+            try:
+                chave, futuro = self._prontas.get_nowait()
+            except queue.Empty:
+                return prontas
+            self._em_andamento.discard(chave)
+            try:
+                prontas.append((chave, futuro.result()))
+            except Exception:
+                self._falhas.add(chave)
+                prontas.append((chave, None))
+
+    @property
+    def pendentes(self):
+        return len(self._em_andamento)
+
+    def encerrar(self):
+        self._executor.shutdown(wait=False)
+
+
+DIRETORIO_CACHE_PADRAO = os.path.join(os.path.expanduser("~"), ".cache", "chimera_oo", "miniaturas")
+
+
+class CacheMiniaturasDisco:
+
+    def __init__(self, diretorio=DIRETORIO_CACHE_PADRAO, gerar=gerar_miniatura):
+        self._diretorio = diretorio
+        self._gerar = gerar
+        self._falhas = []
+
+    @property
+    def diretorio(self):
+        return self._diretorio
+
+    @property
+    def falhas(self):
+        return list(self._falhas)
+
+    def chave(self, caminho, tamanho=TAMANHO_MINIATURA):
+        caminho = os.path.abspath(caminho)
+        estado = os.stat(caminho)
+        identidade = f"{caminho}|{estado.st_mtime_ns}|{estado.st_size}|{tamanho[0]}x{tamanho[1]}"
+        return hashlib.sha1(identidade.encode("utf-8")).hexdigest()
+
+    def _caminho_cache(self, chave):
+        return os.path.join(self._diretorio, chave[:2], f"{chave}.png")
+
+    def obter(self, caminho, tamanho=TAMANHO_MINIATURA):
+        try:
+            caminho_cache = self._caminho_cache(self.chave(caminho, tamanho))
+        except OSError:
+            return None
+        return caminho_cache if os.path.exists(caminho_cache) else None
+
+    def gerar(self, caminho, tamanho=TAMANHO_MINIATURA):
+        miniatura = self._gerar(caminho, tamanho)
+        caminho_cache = self._caminho_cache(self.chave(caminho, tamanho))
+        os.makedirs(os.path.dirname(caminho_cache), exist_ok=True)
+        temporario = f"{caminho_cache}.{os.getpid()}.{threading.get_ident()}.tmp"
+        try:
+            miniatura.save(temporario, format="PNG")
+            os.replace(temporario, caminho_cache)
+        except OSError:
+            if os.path.exists(temporario):
+                os.remove(temporario)
+        return miniatura
+
+    def aquecer(self, caminhos, tamanho=TAMANHO_MINIATURA, processadores=4):
+        pendentes = [
+            caminho
+            for caminho in dict.fromkeys(caminhos)
+            if os.path.exists(caminho) and self.obter(caminho, tamanho) is None
+        ]
+        geradas = 0
+        with ThreadPoolExecutor(max_workers=processadores) as executor:
+            futuros = [executor.submit(self.gerar, caminho, tamanho) for caminho in pendentes]
+            for caminho, futuro in zip(pendentes, futuros):
+                try:
+                    futuro.result()
+                except Exception:
+                    self._falhas.append(caminho)
+                    continue
+                geradas += 1
+        return geradas
+
+
+def _caminhos_catalogo(gerenciador, base):
+    for posicao in range(len(gerenciador)):
+        caminho_imagem = gerenciador._caminho_imagem_em(posicao)
+        if caminho_imagem:
+            yield os.path.join(base, caminho_imagem)
+
+
+def main(argumentos=None):
+    from package.gerenciador_entidades import GerenciadorEntidades
+
+    parser = argparse.ArgumentParser(
+        description="Pré-gera as miniaturas das criaturas no cache em disco."
+    )
+    parser.add_argument("--cache", default=DIRETORIO_CACHE_PADRAO, help="diretório do cache")
+    parser.add_argument("--base", default=".", help="diretório base dos caminhos de imagem")
+    parser.add_argument("--csv", nargs="*", default=[], help="CSVs adicionais do catálogo")
+    parser.add_argument("--snapshot", help="snapshot do catálogo a usar no lugar das predefinidas")
+    parser.add_argument("--tamanho", type=int, default=TAMANHO_MINIATURA[0])
+    parser.add_argument("--processadores", type=int, default=4)
+    opcoes = parser.parse_args(argumentos)
+
+    if opcoes.snapshot:
+        gerenciador = GerenciadorEntidades.carregar_snapshot(opcoes.snapshot)
+    else:
+        gerenciador = GerenciadorEntidades()
+    if opcoes.csv:
+        gerenciador.carregar_csvs(opcoes.csv)
+
+    cache = CacheMiniaturasDisco(opcoes.cache)
+    geradas = cache.aquecer(
+        _caminhos_catalogo(gerenciador, opcoes.base),
+        (opcoes.tamanho, opcoes.tamanho),
+        opcoes.processadores,
+    )
+    print(f"{geradas} miniaturas geradas em {cache.diretorio}")
+    if cache.falhas:
+        print(f"{len(cache.falhas)} imagens não puderam ser convertidas", file=sys.stderr)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
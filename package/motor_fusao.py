@@ -0,0 +1,84 @@
+from dataclasses import dataclass
+from typing import List, Sequence
+
+from package.entidade import Entidade
+
+
+FUSAO_CUSTO_CREDITOS = 1
+MINIMO_CRIATURAS_FUSAO = 2
+
+FUSAO_CONCLUIDA = "concluida"
+SELECAO_INSUFICIENTE = "selecao_insuficiente"
+SEM_CREDITOS = "sem_creditos"
+CRIATURAS_NAO_ENCONTRADAS = "criaturas_nao_encontradas"
+SEM_COMBINACAO = "sem_combinacao"
+FALHA_CREDITOS = "falha_creditos"
+
+
+@dataclass
+class FusaResultado:
+    novas_criaturas: List[Entidade]
+    mensagem: str
+    situacao: str = FUSAO_CONCLUIDA
+
+
+class MotorFusao:
+
+    def __init__(self, gerenciador, custo_creditos: int = FUSAO_CUSTO_CREDITOS):
+        self._gerenciador = gerenciador
+        self._custo_creditos = custo_creditos
+
+    @property
+    def gerenciador(self):
+        return self._gerenciador
+
+    @property
+    def custo_creditos(self):
+        return self._custo_creditos
+
+    def realizar_fusao(self, jogador, nomes: Sequence[str]) -> FusaResultado:
+        nomes = list(nomes)
+        if len(nomes) < MINIMO_CRIATURAS_FUSAO:
+            return FusaResultado(
+                [],
+                "Selecione pelo menos duas criaturas para realizar a fusão.",
+                SELECAO_INSUFICIENTE,
+            )
+
+        if not jogador.tem_creditos(self._custo_creditos):
+            return FusaResultado(
+                [],
+                "Você precisa de créditos para realizar a fusão. Responda às "
+                "perguntas na aba Desafios OO para ganhar créditos. É "
+                f"necessário ao menos {self._custo_creditos} crédito.",
+                SEM_CREDITOS,
+            )
+
+        entidades_escolhidas = self._gerenciador.get(nomes)
+        if len(entidades_escolhidas) != len(nomes):
+            return FusaResultado(
+                [],
+                "Algumas criaturas selecionadas não foram encontradas no gerenciador.",
+                CRIATURAS_NAO_ENCONTRADAS,
+            )
+
+        novas_criaturas = self._gerenciador.cruzar(entidades_escolhidas)
+        if not novas_criaturas:
+            return FusaResultado(
+                [],
+                "Nenhuma combinação conhecida para as criaturas escolhidas.",
+                SEM_COMBINACAO,
+            )
+
+        nomes_novos = [entidade._nome for entidade in novas_criaturas]
+        if not jogador.gastar_creditos(self._custo_creditos, nomes_novos):
+            return FusaResultado(
+                [],
+                "Não foi possível consumir créditos para realizar a fusão.",
+                FALHA_CREDITOS,
+            )
+
+        return FusaResultado(
+            novas_criaturas,
+            "Fusão concluída! Novas criaturas foram adicionadas ao seu códex.",
+        )
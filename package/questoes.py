@@ -0,0 +1,43 @@
+import json
+import os
+from typing import Dict, List
+
+
+CAMINHO_QUESTOES_PADRAO = os.path.join(
+    os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "assets", "perguntas_oo.json"
+)
+
+
+def carregar_questoes(caminho: str = CAMINHO_QUESTOES_PADRAO) -> List[Dict[str, object]]:
+    if not os.path.exists(caminho):
+        return []
+    try:
+        with open(caminho, "r", encoding="utf-8") as arquivo:
+            dados = json.load(arquivo)
+    except (json.JSONDecodeError, OSError):
+        return []
+
+    questoes_validas: List[Dict[str, object]] = []
+    for questao in dados:
+        if not isinstance(questao, dict):
+            continue
+        pergunta = questao.get("pergunta")
+        alternativas = questao.get("alternativas")
+        try:
+            correta = int(questao.get("correta"))
+        except (TypeError, ValueError):
+            continue
+
+        if not pergunta or not isinstance(alternativas, list) or len(alternativas) < 2:
+            continue
+        if not 0 <= correta < len(alternativas):
+            continue
+
+        questoes_validas.append(
+            {
+                "pergunta": str(pergunta),
+                "alternativas": [str(opcao) for opcao in alternativas],
+                "correta": correta,
+            }
+        )
+    return questoes_validas
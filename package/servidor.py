@@ -0,0 +1,232 @@
+import argparse
+import asyncio
+import json
+import random
+from typing import Dict, Optional
+
+from package.armazenamento import ArmazenamentoSQLite
+from package.gerenciador_entidades import GerenciadorEntidades
+from package.jogador import Jogador
+from package.motor_fusao import MotorFusao
+from package.questoes import carregar_questoes
+
+
+CREDITOS_POR_RESPOSTA = 1
+LIMITE_LINHA_BYTES = 4 * 1024 * 1024
+MAXIMO_SELECOES_SIMULACAO = 10000
+
+
+class ErroPedido(Exception):
+    pass
+
+
+class _SessaoJogador:
+
+    def __init__(self, jogador: Jogador):
+        self.jogador = jogador
+        self.trava = asyncio.Lock()
+        self.questao_atual: Optional[int] = None
+        self.respondida = False
+
+
+class ServidorFusao:
+
+    def __init__(self, armazenamento, gerenciador=None, questoes=None, motor=None):
+        if gerenciador is None:
+            gerenciador = GerenciadorEntidades(tabela_fusoes=True)
+            gerenciador.tabela_fusoes.precomputar()
+        self._gerenciador = gerenciador
+        self._armazenamento = armazenamento
+        self._questoes = carregar_questoes() if questoes is None else questoes
+        self._motor = motor or MotorFusao(gerenciador)
+        self._sessoes: Dict[str, _SessaoJogador] = {}
+        self._criando: Dict[str, asyncio.Future] = {}
+        self._acoes = {
+            "fusao": self._fusao,
+            "pergunta": self._pergunta,
+            "responder": self._responder,
+            "creditos": self._creditos,
+            "descobertas": self._descobertas,
+            "simular": self._simular,
+        }
+
+    async def iniciar(self, host="127.0.0.1", porta=8765):
+        return await asyncio.start_server(self._atender, host, porta, limit=LIMITE_LINHA_BYTES)
+
+    async def _atender(self, leitor, escritor):
+        try:
+            while True:
+                linha, excedeu = await self._ler_linha(leitor)
+                if excedeu:
+                    resposta = {
+                        "ok": False,
+                        "erro": f"Pedido maior que o limite de {LIMITE_LINHA_BYTES} bytes.",
+                        "id": None,
+                    }
+                elif not linha:
+                    break
+                else:
+                    resposta = await self._responder_linha(linha)
+                escritor.write(json.dumps(resposta, ensure_ascii=False).encode("utf-8") + b"\n")
+                await escritor.drain()
+        except ConnectionError:
+            pass
+        finally:
+            escritor.close()
+
+    async def _ler_linha(self, leitor):
+        excedeu = False
+        while True:
+            try:
+                linha = await leitor.readuntil(b"\n")
+            except asyncio.IncompleteReadError as erro:
+                linha = erro.partial
+            except asyncio.LimitOverrunError as erro:
+                await leitor.readexactly(erro.consumed)
+                excedeu = True
+                continue
+            return linha, excedeu
+
+    async def _responder_linha(self, linha):
+        identificador = None
+        try:
+            pedido = json.loads(linha)
+            if not isinstance(pedido, dict):
+                raise ErroPedido("O pedido deve ser um objeto JSON.")
+            identificador = pedido.get("id")
+            resposta = await self.processar(pedido)
+        except json.JSONDecodeError:
+            resposta = {"ok": False, "erro": "JSON inválido."}
+        except ErroPedido as erro:
+            resposta = {"ok": False, "erro": str(erro)}
+        except Exception:
+            resposta = {"ok": False, "erro": "Erro interno ao processar o pedido."}
+        resposta["id"] = identificador
+        return resposta
+
+    async def processar(self, pedido):
+        nome_acao = pedido.get("acao")
+        if not isinstance(nome_acao, str):
+            raise ErroPedido("Informe a ação do pedido.")
+        acao = self._acoes.get(nome_acao)
+        if acao is None:
+            raise ErroPedido(f"Ação desconhecida: {nome_acao}")
+        nome = pedido.get("jogador")
+        if not isinstance(nome, str) or not nome:
+            raise ErroPedido("Informe o nome do jogador.")
+        sessao = await self._sessao(nome)
+        async with sessao.trava:
+            resposta = await acao(sessao, pedido)
+        resposta["ok"] = True
+        return resposta
+
+    async def _sessao(self, nome):
+        sessao = self._sessoes.get(nome)
+        if sessao is not None:
+            return sessao
+        criacao = self._criando.get(nome)
+        if criacao is None:
+            loop = asyncio.get_running_loop()
+            criacao = self._criando[nome] = loop.run_in_executor(
+                None, lambda: Jogador(nome, armazenamento=self._armazenamento)
+            )
+            try:
+                jogador = await criacao
+            finally:
+                del self._criando[nome]
+            sessao = self._sessoes[nome] = _SessaoJogador(jogador)
+            return sessao
+        await criacao
+        return self._sessoes[nome]
+
+    async def _executar(self, funcao, *argumentos):
+        return await asyncio.get_running_loop().run_in_executor(None, funcao, *argumentos)
+
+    async def _fusao(self, sessao, pedido):
+        criaturas = pedido.get("criaturas")
+        if not isinstance(criaturas, list):
+            raise ErroPedido("Informe a lista de criaturas da fusão.")
+        resultado = await self._executar(
+            self._motor.realizar_fusao, sessao.jogador, [str(nome) for nome in criaturas]
+        )
+        return {
+            "situacao": resultado.situacao,
+            "mensagem": resultado.mensagem,
+            "novas_criaturas": [entidade._nome for entidade in resultado.novas_criaturas],
+            "creditos": sessao.jogador.creditos,
+        }
+
+    async def _pergunta(self, sessao, pedido):
+        if not self._questoes:
+            raise ErroPedido("Nenhuma pergunta disponível no momento.")
+        sessao.questao_atual = random.randrange(len(self._questoes))
+        sessao.respondida = False
+        questao = self._questoes[sessao.questao_atual]
+        return {"pergunta": questao["pergunta"], "alternativas": questao["alternativas"]}
+
+    async def _responder(self, sessao, pedido):
+        if sessao.questao_atual is None:
+            raise ErroPedido("Peça uma pergunta antes de responder.")
+        if sessao.respondida:
+            raise ErroPedido("Você já respondeu esta pergunta. Avance para a próxima.")
+        try:
+            resposta = int(pedido.get("resposta"))
+        except (TypeError, ValueError, OverflowError):
+            raise ErroPedido("Informe o índice da alternativa escolhida.")
+        correta = resposta == self._questoes[sessao.questao_atual]["correta"]
+        if correta:
+            sessao.respondida = True
+            await self._executar(sessao.jogador.adicionar_creditos, CREDITOS_POR_RESPOSTA)
+        return {"correta": correta, "creditos": sessao.jogador.creditos}
+
+    async def _creditos(self, sessao, pedido):
+        return {"creditos": sessao.jogador.creditos}
+
+    async def _descobertas(self, sessao, pedido):
+        return {"criaturas": sorted(sessao.jogador.criaturas_descobertas)}
+
+    async def _simular(self, sessao, pedido):
+        selecoes = pedido.get("selecoes")
+        if not isinstance(selecoes, list) or not all(isinstance(selecao, list) for selecao in selecoes):
+            raise ErroPedido("Informe a lista de seleções a simular.")
+        if len(selecoes) > MAXIMO_SELECOES_SIMULACAO:
+            raise ErroPedido(f"Simule no máximo {MAXIMO_SELECOES_SIMULACAO} seleções por pedido.")
+        return {"resultados": await self._executar(self._simular_selecoes, selecoes)}
+
+    def _simular_selecoes(self, selecoes):
+        entidades = [self._gerenciador.get([str(nome) for nome in selecao]) for selecao in selecoes]
+        return [
+            [entidade._nome for entidade in resultado]
+            for resultado in self._gerenciador.cruzar_em_lote(entidades)
+        ]
+
+
+async def _servir(opcoes):
+    gerenciador = GerenciadorEntidades(tabela_fusoes=True)
+    if opcoes.csv:
+        gerenciador.carregar_csvs(opcoes.csv)
+    gerenciador.tabela_fusoes.precomputar()
+    with ArmazenamentoSQLite(opcoes.banco) as armazenamento:
+        servidor = await ServidorFusao(armazenamento, gerenciador).iniciar(opcoes.host, opcoes.porta)
+        enderecos = ", ".join(str(socket.getsockname()) for socket in servidor.sockets)
+        print(f"Servidor de fusões ouvindo em {enderecos}")
+        async with servidor:
+            await servidor.serve_forever()
+
+
+def main(argumentos=None):
+    parser = argparse.ArgumentParser(description="Servidor multijogador do Laboratório de Quimeras.")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--porta", type=int, default=8765)
+    parser.add_argument("--banco", default="dados_jogador.sqlite3", help="arquivo SQLite de progresso")
+    parser.add_argument("--csv", nargs="*", default=[], help="CSVs adicionais do catálogo")
+    opcoes = parser.parse_args(argumentos)
+    try:
+        asyncio.run(_servir(opcoes))
+    except KeyboardInterrupt:
+        pass
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,272 @@
+import mmap
+import os
+from bisect import bisect_left
+import struct
+import sys
+from array import array
+
+from package.entidade import Entidade
+
+
+MAGICO = b"CHIMERA\x00"
+VERSAO_FORMATO = 2
+
+_CABECALHO = struct.Struct("<8sIIII")
+_SECAO = struct.Struct("<QQ")
+
+_SECOES = (
+    ("nomes_offsets", "Q"),
+    ("nomes", None),
+    ("imagens_offsets", "Q"),
+    ("imagens", None),
+    ("vocabulario_offsets", "Q"),
+    ("vocabulario", None),
+    ("tags_offsets", "Q"),
+    ("tags", "I"),
+    ("postagens_offsets", "Q"),
+    ("postagens", "I"),
+    ("ordem_nomes", "I"),
+    ("sem_tags", "I"),
+)
+
+
+def _tabela_textos(textos):
+    offsets = array("Q", [0])
+    blob = bytearray()
+    for texto in textos:
+        blob += texto.encode("utf-8")
+        offsets.append(len(blob))
+    return offsets, bytes(blob)
+
+
+def _como_bytes(dados):
+    if isinstance(dados, array):
+        if sys.byteorder != "little":
+            dados = array(dados.typecode, dados)
+            dados.byteswap()
+        return dados.tobytes()
+    return dados
+
+
+def gravar_snapshot(gerenciador, caminho):
+    posicoes = range(len(gerenciador))
+    if gerenciador._vocabulario is not None:
+        vocabulario = [gerenciador._vocabulario.tag(i) for i in range(len(gerenciador._vocabulario))]
+    else:
+        vocabulario = list(gerenciador._indice_tags)
+    ids_tags = {tag: identificador for identificador, tag in enumerate(vocabulario)}
+
+    tags_offsets = array("Q", [0])
+    tags = array("I")
+    for posicao in posicoes:
+        for tag in gerenciador._tags_em(posicao):
+            identificador = ids_tags.get(tag)
+            if identificador is None:
+                identificador = ids_tags[tag] = len(vocabulario)
+                vocabulario.append(tag)
+            tags.append(identificador)
+        tags_offsets.append(len(tags))
+
+    postagens_offsets = array("Q", [0])
+    postagens = array("I")
+    for tag in vocabulario:
+        postagens.extend(sorted(gerenciador._indice_tags.get(tag, ())))
+        postagens_offsets.append(len(postagens))
+
+    nomes_offsets, nomes = _tabela_textos(gerenciador._nome_em(posicao) for posicao in posicoes)
+    imagens_offsets, imagens = _tabela_textos(
+        gerenciador._caminho_imagem_em(posicao) or "" for posicao in posicoes
+    )
+    vocabulario_offsets, vocabulario_blob = _tabela_textos(vocabulario)
+    ordem_nomes = array("I", sorted(posicoes, key=gerenciador._nome_em))
+    sem_tags = array("I", sorted(gerenciador._ids_sem_tags))
+    conteudo = [
+        nomes_offsets,
+        nomes,
+        imagens_offsets,
+        imagens,
+        vocabulario_offsets,
+        vocabulario_blob,
+        tags_offsets,
+        tags,
+        postagens_offsets,
+        postagens,
+        ordem_nomes,
+        sem_tags,
+    ]
+
+    posicao = _CABECALHO.size + _SECAO.size * len(_SECOES)
+    secoes = []
+    corpos = []
+    for dados in conteudo:
+        corpo = _como_bytes(dados)
+        preenchimento = -posicao % 8
+        posicao += preenchimento
+        secoes.append((posicao, len(corpo)))
+        corpos.append(b"\0" * preenchimento + corpo)
+        posicao += len(corpo)
+
+    temporario = f"{caminho}.tmp"
+    with open(temporario, "wb") as arquivo:
+        arquivo.write(
+            _CABECALHO.pack(MAGICO, VERSAO_FORMATO, len(posicoes), len(vocabulario), len(_SECOES))
+        )
+        for offset, tamanho in secoes:
+            arquivo.write(_SECAO.pack(offset, tamanho))
+        for corpo in corpos:
+            arquivo.write(corpo)
+    os.replace(temporario, caminho)
+
+
+class Snapshot:
+
+    def __init__(self, caminho):
+        with open(caminho, "rb") as arquivo:
+            self._mapa = mmap.mmap(arquivo.fileno(), 0, access=mmap.ACCESS_READ)
+        try:
+            self._ler_secoes()
+        except Exception:
+            self._mapa.close()
+            raise
+
+    def _ler_secoes(self):
+        if len(self._mapa) < _CABECALHO.size:
+            raise ValueError("Arquivo de snapshot truncado.")
+        magico, versao, quantidade, quantidade_tags, quantidade_secoes = _CABECALHO.unpack_from(self._mapa)
+        if magico != MAGICO:
+            raise ValueError("Arquivo não é um snapshot de catálogo.")
+        if versao != VERSAO_FORMATO:
+            raise ValueError(f"Versão de snapshot não suportada: {versao}")
+        if quantidade_secoes != len(_SECOES):
+            raise ValueError("Snapshot com seções inesperadas.")
+        self._quantidade = quantidade
+        self._quantidade_tags = quantidade_tags
+
+        visao = memoryview(self._mapa)
+        self._visoes = [visao]
+        for indice, (nome, tipo) in enumerate(_SECOES):
+            offset, tamanho = _SECAO.unpack_from(self._mapa, _CABECALHO.size + _SECAO.size * indice)
+            if offset + tamanho > len(self._mapa):
+                raise ValueError("Arquivo de snapshot truncado.")
+            dados = visao[offset:offset + tamanho]
+            if tipo is not None:
+                if sys.byteorder == "little":
+                    dados = dados.cast(tipo)
+                else:
+                    copia = array(tipo)
+                    copia.frombytes(dados)
+                    copia.byteswap()
+                    dados = copia
+            self._visoes.append(dados)
+            setattr(self, f"_{nome}", dados)
+        self._tags_vocabulario = [
+            self._texto(self._vocabulario_offsets, self._vocabulario, indice)
+            for indice in range(quantidade_tags)
+        ]
+
+    def __len__(self):
+        return self._quantidade
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *excecao):
+        self.fechar()
+
+    def fechar(self):
+        for visao in reversed(self._visoes):
+            if isinstance(visao, memoryview):
+                visao.release()
+        self._visoes = []
+        self._mapa.close()
+
+    @staticmethod
+    def _texto(offsets, blob, indice):
+        return str(blob[offsets[indice]:offsets[indice + 1]], "utf-8")
+
+    @property
+    def vocabulario(self):
+        return list(self._tags_vocabulario)
+
+    def nome(self, posicao):
+        return self._texto(self._nomes_offsets, self._nomes, posicao)
+
+    def caminho_imagem(self, posicao):
+        return self._texto(self._imagens_offsets, self._imagens, posicao) or None
+
+    def ids_tags(self, posicao):
+        return self._tags[self._tags_offsets[posicao]:self._tags_offsets[posicao + 1]]
+
+    def tags(self, posicao):
+        return [self._tags_vocabulario[identificador] for identificador in self.ids_tags(posicao)]
+
+    def postagens(self, identificador_tag):
+        return self._postagens[
+            self._postagens_offsets[identificador_tag]:self._postagens_offsets[identificador_tag + 1]
+        ]
+
+    @property
+    def sem_tags(self):
+        return self._sem_tags
+
+    def posicoes_nome(self, nome):
+        ordem = self._ordem_nomes
+        inicio, fim = 0, len(ordem)
+        while inicio < fim:
+            meio = (inicio + fim) // 2
+            if self.nome(ordem[meio]) < nome:
+                inicio = meio + 1
+            else:
+                fim = meio
+        posicoes = []
+        while inicio < len(ordem) and self.nome(ordem[inicio]) == nome:
+            posicoes.append(ordem[inicio])
+            inicio += 1
+        return posicoes
+
+    def entidade(self, posicao):
+        return Entidade(self.nome(posicao), self.tags(posicao), self.caminho_imagem(posicao))
+
+
+class PostagemSnapshot:
+    __slots__ = ("_snapshot", "_inicio", "_fim", "_novas")
+
+    def __init__(self, snapshot, identificador_tag):
+        self._snapshot = snapshot
+        self._inicio = snapshot._postagens_offsets[identificador_tag]
+        self._fim = snapshot._postagens_offsets[identificador_tag + 1]
+        self._novas = []
+
+    def __len__(self):
+        return self._fim - self._inicio + len(self._novas)
+
+    def __iter__(self):
+        yield from self._snapshot._postagens[self._inicio:self._fim]
+        yield from self._novas
+
+    def __contains__(self, posicao):
+        if self._novas and posicao >= self._novas[0]:
+            indice = bisect_left(self._novas, posicao)
+            return indice < len(self._novas) and self._novas[indice] == posicao
+        postagens = self._snapshot._postagens
+        indice = bisect_left(postagens, posicao, self._inicio, self._fim)
+        return indice < self._fim and postagens[indice] == posicao
+
+    def update(self, posicoes):
+        self._novas.extend(posicoes)
+
+
+class IndiceNomesSnapshot:
+
+    def __init__(self, snapshot):
+        self._snapshot = snapshot
+        self._novos = {}
+
+    def get(self, nome, padrao=None):
+        posicoes = self._snapshot.posicoes_nome(nome)
+        posicoes.extend(self._novos.get(nome, ()))
+        return posicoes or padrao
+
+    def setdefault(self, nome, padrao=None):
+        return self._novos.setdefault(nome, padrao)
+
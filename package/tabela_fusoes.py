@@ -0,0 +1,124 @@
+import threading
+from collections import OrderedDict
+from itertools import islice, permutations
+
+
+TAMANHO_TABELA_FUSOES = 65536
+
+
+def assinatura_fusao(entidades):
+    return tuple(frozenset(entidade._tags) for entidade in entidades)
+
+
+def _compativel(tags, assinatura):
+    restante = tags
+    for tags_entrada in assinatura:
+        reduzido = restante - tags_entrada
+        if len(reduzido) == len(restante):
+            return False
+        restante = reduzido
+    return not restante
+
+
+def avaliar_assinaturas(assinaturas, ids_subconjuntos, tags_em):
+    candidatos_por_uniao = {}
+    tags_por_posicao = {}
+    resultados = []
+    for assinatura in assinaturas:
+        uniao = frozenset().union(*assinatura)
+        candidatos = candidatos_por_uniao.get(uniao)
+        if candidatos is None:
+            candidatos = candidatos_por_uniao[uniao] = ids_subconjuntos(uniao)
+        compatibilidade = {}
+        posicoes = []
+        for posicao in candidatos:
+            tags = tags_por_posicao.get(posicao)
+            if tags is None:
+                tags = tags_por_posicao[posicao] = frozenset(tags_em(posicao))
+            compativel = compatibilidade.get(tags)
+            if compativel is None:
+                compativel = compatibilidade[tags] = _compativel(tags, assinatura)
+            if compativel:
+                posicoes.append(posicao)
+        resultados.append(posicoes)
+    return resultados
+
+
+class TabelaFusoes:
+
+    def __init__(self, gerenciador, tamanho_maximo=TAMANHO_TABELA_FUSOES):
+        self._gerenciador = gerenciador
+        self._tamanho_maximo = tamanho_maximo
+        self._receitas = OrderedDict()
+        self._versao = gerenciador.versao
+        self._trava = threading.Lock()
+
+    def __len__(self):
+        return len(self._receitas)
+
+    def __contains__(self, assinatura):
+        with self._trava:
+            self._validar_versao()
+            return assinatura in self._receitas
+
+    def _validar_versao(self):
+        if self._versao != self._gerenciador.versao:
+            self._receitas.clear()
+            self._versao = self._gerenciador.versao
+
+    def _calcular(self, assinatura):
+        return avaliar_assinaturas(
+            [assinatura], self._gerenciador._ids_subconjuntos, self._gerenciador._tags_em
+        )[0]
+
+    def posicoes(self, assinatura):
+        with self._trava:
+            self._validar_versao()
+            posicoes = self._receitas.get(assinatura)
+            if posicoes is None:
+                posicoes = self._calcular(assinatura)
+                self._guardar(assinatura, posicoes)
+            else:
+                self._receitas.move_to_end(assinatura)
+            return posicoes
+
+    def registrar(self, assinatura, posicoes):
+        with self._trava:
+            self._validar_versao()
+            self._guardar(assinatura, posicoes)
+
+    def _guardar(self, assinatura, posicoes):
+        self._receitas[assinatura] = posicoes
+        self._receitas.move_to_end(assinatura)
+        while len(self._receitas) > self._tamanho_maximo:
+            self._receitas.popitem(last=False)
+
+    def cruzar(self, entidades):
+        entidades_catalogo = self._gerenciador._entidades
+        return [entidades_catalogo[posicao] for posicao in self.posicoes(assinatura_fusao(entidades))]
+
+    def precomputar(self, entidades=None, max_entradas=2):
+        if entidades is None:
+            entidades = self._gerenciador.listar_basicas()
+        assinaturas = list(dict.fromkeys(frozenset(entidade._tags) for entidade in entidades))
+        restantes = self._tamanho_maximo
+        for quantidade in range(2, max_entradas + 1):
+            for assinatura in islice(permutations(assinaturas, quantidade), restantes):
+                self.posicoes(assinatura)
+                restantes -= 1
+            if restantes <= 0:
+                return
+
+    def adicionar(self, inicio, tags_novas):
+        with self._trava:
+            if self._versao != self._gerenciador.versao - 1:
+                self._validar_versao()
+                return
+            self._versao = self._gerenciador.versao
+            if not self._receitas:
+                return
+            novas = [(posicao, frozenset(tags)) for posicao, tags in enumerate(tags_novas, inicio)]
+            for assinatura, posicoes in self._receitas.items():
+                for posicao, tags in novas:
+                    if _compativel(tags, assinatura):
+                        posicoes.append(posicao)
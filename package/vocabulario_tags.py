@@ -0,0 +1,46 @@
+import sys
+
+
+class VocabularioTags:
+
+    def __init__(self):
+        self._ids = {}
+        self._tags = []
+
+    def __len__(self):
+        return len(self._tags)
+
+    def __contains__(self, tag):
+        return tag in self._ids
+
+    def internar(self, tag):
+        identificador = self._ids.get(tag)
+        if identificador is None:
+            tag = sys.intern(tag)
+            identificador = len(self._tags)
+            self._ids[tag] = identificador
+            self._tags.append(tag)
+        return identificador
+
+    def tag(self, identificador):
+        return self._tags[identificador]
+
+    def mascara(self, tags, internar=True):
+        mascara = 0
+        for tag in tags:
+            if internar:
+                identificador = self.internar(tag)
+            else:
+                identificador = self._ids.get(tag)
+                if identificador is None:
+                    continue
+            mascara |= 1 << identificador
+        return mascara
+
+    def tags(self, mascara):
+        resultado = set()
+        while mascara:
+            bit = mascara & -mascara
+            resultado.add(self._tags[bit.bit_length() - 1])
+            mascara ^= bit
+        return resultado
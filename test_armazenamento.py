@@ -0,0 +1,150 @@
+import os
+import pickle
+import tempfile
+import unittest
+from unittest import mock
+
+from package.armazenamento import ArmazenamentoLog, ArmazenamentoPickle, ArmazenamentoSQLite
+from package.jogador import Jogador
+
+
+class TestArmazenamentoPickle(unittest.TestCase):
+    def setUp(self):
+        self.diretorio = tempfile.TemporaryDirectory()
+        self.caminho = os.path.join(self.diretorio.name, "dados_jogador.pkl")
+
+    def tearDown(self):
+        self.diretorio.cleanup()
+
+    def test_formato_antigo_apenas_criaturas(self):
+        with open(self.caminho, "wb") as arquivo:
+            pickle.dump({"Alice": ["Sereia"]}, arquivo)
+        armazenamento = ArmazenamentoPickle(self.caminho)
+        self.assertEqual(armazenamento.carregar("Alice"), ({"Sereia"}, 0))
+
+    def test_preserva_outros_jogadores(self):
+        armazenamento = ArmazenamentoPickle(self.caminho)
+        armazenamento.registrar("Alice", ["Sereia"], 0, {"Sereia"}, 2)
+        armazenamento.registrar("Bob", ["Grifo"], 0, {"Grifo"}, 1)
+        self.assertEqual(armazenamento.carregar("Alice"), ({"Sereia"}, 2))
+        self.assertEqual(armazenamento.carregar("Bob"), ({"Grifo"}, 1))
+
+
+class TestArmazenamentoLog(unittest.TestCase):
+    def setUp(self):
+        self.diretorio = tempfile.TemporaryDirectory()
+        self.caminho = os.path.join(self.diretorio.name, "dados_jogador.log")
+
+    def tearDown(self):
+        self.diretorio.cleanup()
+
+    def _linhas(self):
+        with open(self.caminho, encoding="utf-8") as arquivo:
+            return arquivo.readlines()
+
+    def test_cada_alteracao_e_um_registro(self):
+        jogador = Jogador("Alice", armazenamento=ArmazenamentoLog(self.caminho))
+        jogador.registrar_fusao("Minotauro")
+        jogador.adicionar_creditos(3)
+        jogador.gastar_creditos(1)
+        self.assertEqual(len(self._linhas()), 3)
+
+        reaberto = Jogador("Alice", armazenamento=ArmazenamentoLog(self.caminho))
+        self.assertSetEqual(reaberto.criaturas_descobertas, {"Minotauro"})
+        self.assertEqual(reaberto.creditos, 2)
+
+    def test_compactacao_preserva_progresso(self):
+        armazenamento = ArmazenamentoLog(self.caminho, limite_compactacao=5)
+        alice = Jogador("Alice", armazenamento=armazenamento)
+        bob = Jogador("Bob", armazenamento=armazenamento)
+        for indice in range(4):
+            alice.registrar_fusao(f"Quimera {indice}")
+            bob.adicionar_creditos(1)
+        self.assertLess(len(self._linhas()), 8)
+
+        self.assertEqual(ArmazenamentoLog(self.caminho).carregar("Alice"), ({f"Quimera {i}" for i in range(4)}, 0))
+        self.assertEqual(ArmazenamentoLog(self.caminho).carregar("Bob"), (set(), 4))
+
+    def test_compactacao_conta_apenas_novos_registros(self):
+        armazenamento = ArmazenamentoLog(self.caminho, limite_compactacao=3)
+        with mock.patch.object(armazenamento, "compactar", wraps=armazenamento.compactar) as compactar:
+            for rodada in range(2):
+                for indice in range(5):
+                    armazenamento.registrar(f"Jogador {indice}", [], 1, set(), rodada + 1)
+        self.assertEqual(compactar.call_count, 3)
+        self.assertEqual(ArmazenamentoLog(self.caminho).carregar("Jogador 4"), (set(), 2))
+
+    def test_ignora_registro_incompleto(self):
+        armazenamento = ArmazenamentoLog(self.caminho)
+        armazenamento.registrar("Alice", ["Sereia"], 2, {"Sereia"}, 2)
+        with open(self.caminho, "a", encoding="utf-8") as arquivo:
+            arquivo.write('{"j": "Alice", "c": ["Gri')
+        self.assertEqual(ArmazenamentoLog(self.caminho).carregar("Alice"), ({"Sereia"}, 2))
+
+        armazenamento.registrar("Alice", ["Anjo"], 0, {"Sereia", "Anjo"}, 2)
+        self.assertEqual(ArmazenamentoLog(self.caminho).carregar("Alice"), ({"Sereia", "Anjo"}, 2))
+
+
+class TestArmazenamentoSQLite(unittest.TestCase):
+    def setUp(self):
+        self.diretorio = tempfile.TemporaryDirectory()
+        self.caminho = os.path.join(self.diretorio.name, "dados_jogador.sqlite3")
+        self.armazenamentos = []
+
+    def tearDown(self):
+        for armazenamento in self.armazenamentos:
+            armazenamento.fechar()
+        self.diretorio.cleanup()
+
+    def _abrir(self):
+        armazenamento = ArmazenamentoSQLite(self.caminho)
+        self.armazenamentos.append(armazenamento)
+        return armazenamento
+
+    def test_jogadores_independentes(self):
+        alice = Jogador("Alice", armazenamento=self._abrir())
+        bob = Jogador("Bob", armazenamento=self._abrir())
+        alice.registrar_fusao("Sereia")
+        bob.registrar_fusao("Grifo")
+        alice.adicionar_creditos(2)
+
+        self.assertEqual(self._abrir().carregar("Alice"), ({"Sereia"}, 2))
+        self.assertEqual(self._abrir().carregar("Bob"), ({"Grifo"}, 0))
+
+    def test_gasto_atomico_entre_conexoes(self):
+        primeira = Jogador("Carol", armazenamento=self._abrir())
+        primeira.adicionar_creditos(1)
+        segunda = Jogador("Carol", armazenamento=self._abrir())
+
+        self.assertTrue(primeira.gastar_creditos(1))
+        self.assertFalse(segunda.gastar_creditos(1))
+        self.assertEqual(segunda.creditos, 0)
+        self.assertEqual(self._abrir().carregar("Carol"), (set(), 0))
+
+    def test_importar_pickle(self):
+        caminho_pickle = os.path.join(self.diretorio.name, "dados_jogador.pkl")
+        with open(caminho_pickle, "wb") as arquivo:
+            pickle.dump(
+                {"Alice": {"criaturas": ["Sereia", "Anjo"], "creditos": 4}, "Bob": ["Grifo"]},
+                arquivo,
+            )
+        armazenamento = self._abrir()
+        self.assertEqual(armazenamento.importar_pickle(caminho_pickle), 2)
+        self.assertEqual(armazenamento.carregar("Alice"), ({"Sereia", "Anjo"}, 4))
+        self.assertEqual(armazenamento.carregar("Bob"), ({"Grifo"}, 0))
+
+    def test_reimportar_pickle_preserva_saldo(self):
+        caminho_pickle = os.path.join(self.diretorio.name, "dados_jogador.pkl")
+        with open(caminho_pickle, "wb") as arquivo:
+            pickle.dump({"Alice": {"criaturas": ["Sereia"], "creditos": 4}}, arquivo)
+        armazenamento = self._abrir()
+        armazenamento.importar_pickle(caminho_pickle)
+        alice = Jogador("Alice", armazenamento=armazenamento)
+        self.assertTrue(alice.gastar_creditos(3))
+
+        armazenamento.importar_pickle(caminho_pickle)
+        self.assertEqual(armazenamento.carregar("Alice"), ({"Sereia"}, 1))
+
+
+if __name__ == "__main__":
+    unittest.main()
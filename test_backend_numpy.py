@@ -0,0 +1,152 @@
+import random
+import unittest
+from itertools import permutations
+
+from package.backend_numpy import NUMPY_DISPONIVEL, MatrizTagsNumpy, MatrizTagsPython, criar_matriz_tags
+from package.catalogo_sintetico import gerar_gerenciador
+from package.entidade import Entidade
+from package.gerenciador_entidades import GerenciadorEntidades
+from package.tabela_fusoes import assinatura_fusao
+
+
+class _EquivalenciaMatriz:
+    """
+    Cada implementação da matriz de tags deve reproduzir as consultas
+    por índice do GerenciadorEntidades.
+    """
+
+    classe_matriz = None
+
+    def setUp(self):
+        self.gerenciador = gerar_gerenciador(500, tamanho_vocabulario=90, tags_por_entidade=(1, 4), semente=8)
+        self.gerenciador.adicionar_varias(
+            [Entidade("Forasteiro", ["TAG_EXTERNA", "OUTRA"]), Entidade("Vazia", [])]
+        )
+        self.matriz = self.classe_matriz(self.gerenciador)
+        aleatorio = random.Random(8)
+        self.consultas = [
+            self.gerenciador._tags_em(aleatorio.randrange(len(self.gerenciador))) for _ in range(60)
+        ]
+        self.consultas += [
+            frozenset(),
+            frozenset({"DESCONHECIDA"}),
+            frozenset({"DESCONHECIDA", "TAG_EXTERNA"}),
+        ]
+
+    def test_basicas(self):
+        """Posições com uma única tag."""
+        esperado = [
+            posicao
+            for posicao in range(len(self.gerenciador))
+            if self.gerenciador._quantidade_tags(posicao) == 1
+        ]
+        self.assertListEqual(self.matriz.basicas(), esperado)
+
+    def test_superconjuntos_e_subconjuntos(self):
+        """Filtros de contenção coincidem com o índice invertido."""
+        for tags in self.consultas:
+            with self.subTest(tags=sorted(tags)):
+                self.assertListEqual(
+                    self.matriz.superconjuntos(tags), list(self.gerenciador._ids_superconjuntos(tags))
+                )
+                self.assertListEqual(self.matriz.subconjuntos(tags), self.gerenciador._ids_subconjuntos(tags))
+
+    def test_compativeis_identico_ao_cruzar(self):
+        """A checagem de compatibilidade vetorizada segue as regras de cruzar."""
+        basicas = self.gerenciador.listar_basicas()[:12]
+        selecoes = [list(selecao) for selecao in permutations(basicas, 2)]
+        selecoes += [[], [Entidade("Externa", ["DESCONHECIDA"]), basicas[0]]]
+        for selecao in selecoes:
+            resultado = self.gerenciador.cruzar(selecao)
+            esperado = [
+                posicao
+                for posicao in range(len(self.gerenciador))
+                if self.gerenciador._entidades[posicao] in resultado
+            ]
+            self.assertListEqual(self.matriz.compativeis(assinatura_fusao(selecao)), esperado)
+
+    def test_adicionar_equivale_a_reconstruir(self):
+        """Linhas acrescentadas, inclusive com tags novas, respondem como uma matriz nova."""
+        inicio = len(self.gerenciador)
+        novas = [Entidade(f"Nova {indice}", [f"NOVA{indice}", "TAG0"]) for indice in range(70)]
+        novas.append(Entidade("Nova Básica", ["NOVA69"]))
+        self.gerenciador.adicionar_varias(novas)
+        self.matriz.adicionar(inicio, [entidade._tags for entidade in novas], self.gerenciador.versao)
+        reconstruida = self.classe_matriz(self.gerenciador)
+        self.assertEqual(self.matriz.versao, self.gerenciador.versao)
+        self.assertListEqual(self.matriz.basicas(), reconstruida.basicas())
+        for tags in self.consultas + [frozenset({"NOVA3", "TAG0"}), frozenset({"NOVA69"})]:
+            with self.subTest(tags=sorted(tags)):
+                self.assertListEqual(self.matriz.superconjuntos(tags), reconstruida.superconjuntos(tags))
+                self.assertListEqual(self.matriz.subconjuntos(tags), reconstruida.subconjuntos(tags))
+        assinatura = (frozenset({"NOVA69"}), frozenset({"TAG0"}))
+        self.assertListEqual(self.matriz.compativeis(assinatura), reconstruida.compativeis(assinatura))
+
+
+class TestMatrizTagsPython(_EquivalenciaMatriz, unittest.TestCase):
+    classe_matriz = MatrizTagsPython
+
+
+@unittest.skipUnless(NUMPY_DISPONIVEL, "numpy não está instalado")
+class TestMatrizTagsNumpy(_EquivalenciaMatriz, unittest.TestCase):
+    classe_matriz = MatrizTagsNumpy
+
+
+class TestGerenciadorVetorizado(unittest.TestCase):
+    """
+    O modo vetorizado deve responder às consultas exatamente como o modo padrão.
+    """
+
+    def setUp(self):
+        self.padrao = GerenciadorEntidades()
+        self.vetorizado = GerenciadorEntidades(vetorizado=True)
+
+    def _nomes(self, entidades):
+        return [entidade._nome for entidade in entidades]
+
+    def test_escolhe_backend_disponivel(self):
+        """Sem numpy, o modo vetorizado recorre à implementação em Python puro."""
+        esperado = MatrizTagsNumpy if NUMPY_DISPONIVEL else MatrizTagsPython
+        self.assertIsInstance(self.vetorizado.matriz_tags(), esperado)
+        self.assertIsInstance(criar_matriz_tags(self.padrao, usar_numpy=False), MatrizTagsPython)
+        if not NUMPY_DISPONIVEL:
+            with self.assertRaises(ImportError):
+                criar_matriz_tags(self.padrao, usar_numpy=True)
+
+    def test_consultas_identicas_ao_modo_padrao(self):
+        """Básicas, fusões, evoluções e derivações coincidem para todo o catálogo."""
+        self.assertListEqual(
+            self._nomes(self.vetorizado.listar_basicas()), self._nomes(self.padrao.listar_basicas())
+        )
+        nomes = self.padrao.listar_nomes()
+        for primeiro in nomes:
+            entidade_vetorizada = self.vetorizado.get([primeiro])[0]
+            entidade_padrao = self.padrao.get([primeiro])[0]
+            self.assertListEqual(
+                self._nomes(self.vetorizado.evolucoes(entidade_vetorizada)),
+                self._nomes(self.padrao.evolucoes(entidade_padrao)),
+            )
+            self.assertListEqual(
+                self._nomes(self.vetorizado.derivacoes(entidade_vetorizada)),
+                self._nomes(self.padrao.derivacoes(entidade_padrao)),
+            )
+            for segundo in nomes:
+                selecao = [primeiro, segundo]
+                self.assertListEqual(
+                    self._nomes(self.vetorizado.cruzar(self.vetorizado.get(selecao))),
+                    self._nomes(self.padrao.cruzar(self.padrao.get(selecao))),
+                )
+
+    def test_matriz_estendida_ao_adicionar(self):
+        """Novas entidades são acrescentadas à matriz existente; reindexar a reconstrói."""
+        matriz = self.vetorizado.matriz_tags()
+        self.vetorizado.adicionar(Entidade("Quimera", ["LEAO", "TOURO", "AVE"]))
+        self.assertIs(self.vetorizado.matriz_tags(), matriz)
+        leao, touro, ave = self.vetorizado.get(["Leão", "Touro", "Ave"])
+        self.assertIn("Quimera", self._nomes(self.vetorizado.cruzar([leao, touro, ave])))
+        self.vetorizado.reindexar()
+        self.assertIsNot(self.vetorizado.matriz_tags(), matriz)
+
+
+if __name__ == "__main__":
+    unittest.main()
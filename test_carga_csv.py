@@ -0,0 +1,44 @@
+import io
+import unittest
+
+from package.carga_csv import ler_lotes_csv
+
+
+class TestCargaCsv(unittest.TestCase):
+    """
+    Testes da leitura de CSV em lotes usada pela carga de catálogos grandes.
+    """
+
+    def test_lotes_respeitam_tamanho(self):
+        """Cada lote deve conter no máximo a quantidade de linhas pedida."""
+        conteudo = "nome,tags\n" + "".join(f"Criatura{i},A;B\n" for i in range(5))
+        lotes = list(ler_lotes_csv(io.StringIO(conteudo), tamanho_lote=2))
+        self.assertEqual([len(registros) for registros, _ in lotes], [2, 2, 1])
+        self.assertEqual(lotes[0][0][0], ("Criatura0", ["A", "B"], None))
+
+    def test_linhas_invalidas_sao_relatadas(self):
+        """Nome vazio ou tags ausentes não interrompem a leitura."""
+        conteudo = "nome,tags,imagem\n,A,x.png\nSem Tags\nDragão, FOGO ; AVE ,dragao.png\n"
+        lotes = list(ler_lotes_csv(io.StringIO(conteudo)))
+        registros, relatorio = lotes[0]
+        self.assertEqual(registros, [("Dragão", ["FOGO", "AVE"], "dragao.png")])
+        self.assertEqual(relatorio.linhas_lidas, 3)
+        self.assertEqual(relatorio.entidades_carregadas, 1)
+        self.assertEqual(
+            [(linha.numero, linha.motivo) for linha in relatorio.linhas_invalidas],
+            [(2, "nome vazio"), (3, "tags ausentes")],
+        )
+
+    def test_cabecalho_sem_coluna_obrigatoria(self):
+        """Um cabeçalho sem a coluna de tags torna o arquivo inválido."""
+        with self.assertRaises(ValueError):
+            list(ler_lotes_csv(io.StringIO("nome,imagem\nHumano,humano.png\n")))
+
+    def test_tamanho_lote_invalido(self):
+        """O tamanho do lote precisa ser positivo."""
+        with self.assertRaises(ValueError):
+            list(ler_lotes_csv(io.StringIO("nome,tags\n"), tamanho_lote=0))
+
+
+if __name__ == "__main__":
+    unittest.main()
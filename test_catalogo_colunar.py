@@ -0,0 +1,131 @@
+import os
+import sys
+import tempfile
+import unittest
+
+from package.catalogo_colunar import CatalogoColunar, VisaoEntidade
+from package.entidade import Entidade
+from package.gerenciador_entidades import GerenciadorEntidades
+
+
+class TestCatalogoColunar(unittest.TestCase):
+    """
+    Testes do armazenamento colunar e das visões de entidade.
+    """
+
+    def setUp(self):
+        self.catalogo = CatalogoColunar()
+        self.catalogo.extend([
+            Entidade("Minotauro", ["HUMANO", "TOURO"], "imagens/minotauro.png"),
+            Entidade("Humano", ["HUMANO"]),
+        ])
+
+    def test_visao_mantem_interface_da_entidade(self):
+        """Nome, tags, imagem, contem e __str__ funcionam sobre as colunas."""
+        minotauro, humano = self.catalogo[0], self.catalogo[1]
+        self.assertIsInstance(minotauro, Entidade)
+        self.assertEqual(minotauro.nome, "Minotauro")
+        self.assertEqual(minotauro.tags, {"HUMANO", "TOURO"})
+        self.assertEqual(minotauro.caminho_imagem, "imagens/minotauro.png")
+        self.assertIsNone(humano.caminho_imagem)
+        self.assertTrue(minotauro.contem(humano))
+        self.assertFalse(humano.contem(minotauro))
+        self.assertTrue(minotauro.contem(Entidade("Touro", ["TOURO"])))
+        self.assertIn("Minotauro", str(minotauro))
+        self.assertEqual(str(humano), str(Entidade("Humano", ["HUMANO"])))
+        self.assertNotIn("frozenset", str(minotauro))
+
+    def test_visoes_sao_leves_e_comparaveis(self):
+        """Visões não têm __dict__ e se igualam pela posição no catálogo."""
+        self.assertFalse(hasattr(self.catalogo[0], "__dict__"))
+        self.assertFalse(hasattr(Entidade("Humano", ["HUMANO"]), "__dict__"))
+        self.assertEqual(self.catalogo[0], self.catalogo[0])
+        self.assertEqual(len({self.catalogo[0], self.catalogo[0], self.catalogo[1]}), 2)
+        self.assertNotEqual(self.catalogo[1], Entidade("Humano", ["HUMANO"]))
+
+    def test_visao_somente_leitura(self):
+        """Alterar uma visão deve falhar em vez de corromper as colunas."""
+        with self.assertRaises(TypeError):
+            self.catalogo[0].set_tags(["FOGO"])
+        with self.assertRaises(IndexError):
+            self.catalogo[2]
+
+    def test_colunas_ocupam_menos_que_objetos(self):
+        """As colunas custam bem menos que os objetos equivalentes."""
+        entidades = [Entidade(f"Criatura {i}", [f"T{i % 50}", f"T{i % 7}"], f"img/{i}.png") for i in range(1000)]
+        catalogo = CatalogoColunar()
+        catalogo.extend(entidades)
+        custo_objetos = sum(
+            sys.getsizeof(entidade) + sys.getsizeof(entidade._tags) + sys.getsizeof(entidade._nome)
+            for entidade in entidades
+        )
+        self.assertLess(catalogo.tamanho_bytes() * 4, custo_objetos)
+
+
+class TestGerenciadorColunar(unittest.TestCase):
+    """
+    O modo colunar deve responder às consultas exatamente como o modo padrão.
+    """
+
+    def setUp(self):
+        self.padrao = GerenciadorEntidades()
+        self.colunar = GerenciadorEntidades(colunar=True)
+
+    def _nomes(self, entidades):
+        return [entidade._nome for entidade in entidades]
+
+    def test_consultas_identicas_ao_modo_padrao(self):
+        """Fusões, evoluções e derivações coincidem para todo o catálogo."""
+        nomes = self.padrao.listar_nomes()
+        self.assertListEqual(self.colunar.listar_nomes(), nomes)
+        self.assertListEqual(self._nomes(self.colunar.listar_basicas()), self._nomes(self.padrao.listar_basicas()))
+        for primeiro in nomes:
+            entidade_colunar = self.colunar.get([primeiro])[0]
+            entidade_padrao = self.padrao.get([primeiro])[0]
+            self.assertIsInstance(entidade_colunar, VisaoEntidade)
+            self.assertListEqual(
+                self._nomes(self.colunar.evolucoes(entidade_colunar)),
+                self._nomes(self.padrao.evolucoes(entidade_padrao)),
+            )
+            self.assertListEqual(
+                self._nomes(self.colunar.derivacoes(entidade_colunar)),
+                self._nomes(self.padrao.derivacoes(entidade_padrao)),
+            )
+            for segundo in nomes:
+                selecao = [primeiro, segundo]
+                self.assertListEqual(
+                    self._nomes(self.colunar.cruzar(self.colunar.get(selecao))),
+                    self._nomes(self.padrao.cruzar(self.padrao.get(selecao))),
+                )
+
+    def test_combina_com_modo_compacto_e_tabela(self):
+        """Colunar, compacto e tabela de fusões podem ser usados juntos."""
+        gerenciador = GerenciadorEntidades(colunar=True, compacto=True, tabela_fusoes=True)
+        gerenciador.tabela_fusoes.precomputar()
+        gerenciador.adicionar(Entidade("Minotauro Marinho", ["TOURO", "HUMANO", "PEIXE"]))
+        selecao = ["Minotauro", "Peixe"]
+        self.assertListEqual(
+            self._nomes(gerenciador.cruzar(gerenciador.get(selecao))), ["Sereia", "Minotauro Marinho"]
+        )
+        humano, minotauro = gerenciador.get(["Humano", "Minotauro"])
+        self.assertTrue(minotauro.contem(humano))
+
+    def test_colunar_e_preguicoso_sao_exclusivos(self):
+        """Pedir os modos colunar e preguiçoso ao mesmo tempo é um erro."""
+        with self.assertRaises(ValueError):
+            GerenciadorEntidades(colunar=True, preguicoso=True)
+
+    def test_snapshot_restaurado_em_modo_colunar(self):
+        """Snapshots podem ser carregados diretamente para o modo colunar."""
+        with tempfile.TemporaryDirectory() as diretorio:
+            caminho = os.path.join(diretorio, "catalogo.snap")
+            self.padrao.salvar_snapshot(caminho)
+            restaurado = GerenciadorEntidades.carregar_snapshot(caminho, colunar=True)
+        self.assertListEqual(restaurado.listar_nomes(), self.padrao.listar_nomes())
+        centauro = restaurado.get(["Centauro"])[0]
+        self.assertEqual(centauro.caminho_imagem, "assets/centauro.png")
+        self.assertIn("Centauro Alado", self._nomes(restaurado.evolucoes(centauro)))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,124 @@
+import os
+import tempfile
+import unittest
+
+from package.entidade import Entidade
+from package.gerenciador_entidades import GerenciadorEntidades
+
+
+class TestGerenciadorPreguicoso(unittest.TestCase):
+    """
+    O modo preguiçoso só cria objetos Entidade quando uma consulta os devolve.
+    """
+
+    def setUp(self):
+        self.padrao = GerenciadorEntidades()
+        self.preguicoso = GerenciadorEntidades(preguicoso=True)
+
+    def _nomes(self, entidades):
+        return [entidade._nome for entidade in entidades]
+
+    def test_inicializacao_nao_materializa(self):
+        """Criar o catálogo e listar nomes não constrói nenhuma entidade."""
+        self.assertEqual(len(self.preguicoso), len(self.padrao))
+        self.assertListEqual(self.preguicoso.listar_nomes(), self.padrao.listar_nomes())
+        self.assertEqual(self.preguicoso._entidades.materializadas, 0)
+
+    def test_listar_basicas_materializa_apenas_basicas(self):
+        """A tela inicial só paga pelas criaturas básicas exibidas."""
+        basicas = self.preguicoso.listar_basicas()
+        self.assertListEqual(self._nomes(basicas), self._nomes(self.padrao.listar_basicas()))
+        self.assertEqual(self.preguicoso._entidades.materializadas, len(basicas))
+        self.assertIs(self.preguicoso.get(["Humano"])[0], self.preguicoso.get(["Humano"])[0])
+
+    def test_consultas_identicas_ao_modo_padrao(self):
+        """Fusões, evoluções e derivações coincidem para todo o catálogo."""
+        nomes = self.padrao.listar_nomes()
+        for primeiro in nomes:
+            entidade_preguicosa = self.preguicoso.get([primeiro])[0]
+            entidade_padrao = self.padrao.get([primeiro])[0]
+            self.assertListEqual(
+                self._nomes(self.preguicoso.evolucoes(entidade_preguicosa)),
+                self._nomes(self.padrao.evolucoes(entidade_padrao)),
+            )
+            self.assertListEqual(
+                self._nomes(self.preguicoso.derivacoes(entidade_preguicosa)),
+                self._nomes(self.padrao.derivacoes(entidade_padrao)),
+            )
+            for segundo in nomes:
+                selecao = [primeiro, segundo]
+                self.assertListEqual(
+                    self._nomes(self.preguicoso.cruzar(self.preguicoso.get(selecao))),
+                    self._nomes(self.padrao.cruzar(self.padrao.get(selecao))),
+                )
+
+    def test_carga_csv_guarda_registros(self):
+        """Linhas do CSV viram registros leves até serem consultadas."""
+        with tempfile.TemporaryDirectory() as diretorio:
+            caminho = os.path.join(diretorio, "extras.csv")
+            with open(caminho, "w", encoding="utf-8") as arquivo:
+                arquivo.write("nome,tags,imagem\nDragão,FOGO;AVE,\nFênix,FOGO;AVE;LUZ,img/fenix.png\n")
+            gerenciador = GerenciadorEntidades(preguicoso=True, predefinidas=False)
+            gerenciador.carregar_csv_em_lotes(caminho)
+        self.assertEqual(gerenciador._entidades.materializadas, 0)
+        dragao = gerenciador.get(["Dragão"])[0]
+        self.assertEqual(dragao.tags, {"FOGO", "AVE"})
+        self.assertListEqual(self._nomes(gerenciador.evolucoes(dragao)), ["Fênix"])
+        self.assertEqual(gerenciador.get(["Fênix"])[0].caminho_imagem, "img/fenix.png")
+
+    def test_entidade_alterada_e_reindexada(self):
+        """Alterações em entidades já materializadas valem após reindexar."""
+        humano = self.preguicoso.get(["Humano"])[0]
+        minotauro = self.preguicoso.get(["Minotauro"])[0]
+        minotauro.set_tags(["TOURO"])
+        self.preguicoso.reindexar()
+        self.assertNotIn(minotauro, self.preguicoso.evolucoes(humano))
+
+    def test_compacto_e_tabela_de_fusoes(self):
+        """O modo preguiçoso combina com o vocabulário compacto e a tabela."""
+        gerenciador = GerenciadorEntidades(preguicoso=True, compacto=True, tabela_fusoes=True)
+        gerenciador.tabela_fusoes.precomputar()
+        gerenciador.adicionar(Entidade("Minotauro Marinho", ["TOURO", "HUMANO", "PEIXE"]))
+        selecao = ["Minotauro", "Peixe"]
+        self.assertListEqual(
+            self._nomes(gerenciador.cruzar(gerenciador.get(selecao))),
+            self._nomes(self.padrao.cruzar(self.padrao.get(selecao))) + ["Minotauro Marinho"],
+        )
+        self.assertIsNotNone(gerenciador.get(["Sereia"])[0].mascara)
+
+
+class TestSnapshotPreguicoso(unittest.TestCase):
+    """
+    Um snapshot carregado em modo preguiçoso é lido direto do arquivo mapeado.
+    """
+
+    def setUp(self):
+        self.diretorio = tempfile.TemporaryDirectory()
+        self.caminho = os.path.join(self.diretorio.name, "catalogo.snap")
+        self.padrao = GerenciadorEntidades()
+        self.padrao.salvar_snapshot(self.caminho)
+        self.gerenciador = GerenciadorEntidades.carregar_snapshot(self.caminho, preguicoso=True)
+
+    def tearDown(self):
+        self.gerenciador.fechar()
+        self.diretorio.cleanup()
+
+    def test_consulta_sem_materializar_catalogo(self):
+        """Só as entidades devolvidas pela consulta são construídas."""
+        self.assertListEqual(self.gerenciador.listar_nomes(), self.padrao.listar_nomes())
+        centauro = self.gerenciador.get(["Centauro"])[0]
+        evolucoes = self.gerenciador.evolucoes(centauro)
+        esperadas = self.padrao.evolucoes(self.padrao.get(["Centauro"])[0])
+        self.assertEqual([e.nome for e in evolucoes], [e.nome for e in esperadas])
+        self.assertEqual(self.gerenciador._entidades.materializadas, 1 + len(evolucoes))
+        self.assertEqual(centauro.caminho_imagem, "assets/centauro.png")
+
+    def test_novas_entidades_apos_snapshot(self):
+        """Entidades adicionadas depois do snapshot seguem as mesmas regras."""
+        self.gerenciador.adicionar(Entidade("Centauro Marinho", ["CAVALO", "HUMANO", "PEIXE"]))
+        sereia = self.gerenciador.get(["Sereia"])[0]
+        self.assertIn("Centauro Marinho", [e.nome for e in self.gerenciador.evolucoes(sereia)])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,42 @@
+import unittest
+
+from package.catalogo_sintetico import gerar_gerenciador, gerar_registros
+
+
+class TestCatalogoSintetico(unittest.TestCase):
+    """
+    Testes do gerador de catálogos sintéticos usado nos benchmarks.
+    """
+
+    def test_reprodutivel_e_dentro_dos_limites(self):
+        """A mesma semente gera o mesmo catálogo respeitando a faixa de tags."""
+        registros = gerar_registros(300, tamanho_vocabulario=50, tags_por_entidade=(1, 4), semente=7)
+        self.assertEqual(registros, gerar_registros(300, tamanho_vocabulario=50, tags_por_entidade=(1, 4), semente=7))
+        self.assertEqual(len(registros), 300)
+        self.assertEqual(len({nome for nome, _, _ in registros}), 300)
+        for _, tags, _ in registros:
+            self.assertTrue(1 <= len(tags) <= 4)
+
+    def test_inclui_basicas_do_vocabulario(self):
+        """Cada tag do vocabulário tem uma criatura básica correspondente."""
+        gerenciador = gerar_gerenciador(200, tamanho_vocabulario=20, semente=1)
+        self.assertEqual(len(gerenciador), 200)
+        self.assertEqual(len(gerenciador.listar_basicas()), 20)
+
+    def test_basicas_limitadas_pela_proporcao(self):
+        """As básicas ocupam só uma fração do catálogo; o restante são quimeras."""
+        registros = gerar_registros(1000)
+        basicas = [nome for nome, tags, _ in registros if len(tags) == 1]
+        self.assertEqual(len(basicas), 100)
+        self.assertEqual(len(gerar_registros(1000, proporcao_basicas=0.0)), 1000)
+        with self.assertRaises(ValueError):
+            gerar_registros(10, proporcao_basicas=1.5)
+
+    def test_faixa_invalida(self):
+        """Mais tags por entidade do que o vocabulário é um erro."""
+        with self.assertRaises(ValueError):
+            gerar_registros(10, tamanho_vocabulario=3, tags_por_entidade=(1, 5))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,70 @@
+import unittest
+from itertools import permutations
+
+from package.catalogo_sintetico import gerar_gerenciador
+from package.entidade import Entidade
+from package.gerenciador_entidades import GerenciadorEntidades
+
+
+class TestCruzarEmLote(unittest.TestCase):
+    """
+    O cruzamento em lote deve devolver, seleção a seleção, o mesmo que cruzar.
+    """
+
+    def setUp(self):
+        self.gerenciador = GerenciadorEntidades()
+        self.basicas = self.gerenciador.listar_basicas()
+        self.selecoes = [
+            list(selecao) for quantidade in (2, 3) for selecao in permutations(self.basicas, quantidade)
+        ]
+
+    def _nomes(self, resultados):
+        return [[entidade._nome for entidade in resultado] for resultado in resultados]
+
+    def _esperado(self, gerenciador, selecoes):
+        return self._nomes(gerenciador.cruzar(selecao) for selecao in selecoes)
+
+    def test_pares_e_trios_identicos_ao_cruzar(self):
+        """Todos os pares e trios de básicas coincidem com chamadas individuais."""
+        self.assertListEqual(
+            self._nomes(self.gerenciador.cruzar_em_lote(self.selecoes)),
+            self._esperado(self.gerenciador, self.selecoes),
+        )
+
+    def test_selecoes_repetidas_e_externas(self):
+        """Seleções repetidas, vazias ou com tags desconhecidas seguem cruzar."""
+        humano, touro = self.gerenciador.get(["Humano", "Touro"])
+        selecoes = [[humano, touro], [humano, touro], [], [Entidade("Fogo", ["FOGO", "HUMANO"]), touro]]
+        resultados = self.gerenciador.cruzar_em_lote(selecoes)
+        self.assertListEqual(self._nomes(resultados), self._esperado(self.gerenciador, selecoes))
+        self.assertIsNot(resultados[0], resultados[1])
+
+    def test_modos_de_catalogo(self):
+        """Compacto, colunar, preguiçoso e tabelado devolvem o mesmo lote."""
+        esperado = self._esperado(self.gerenciador, self.selecoes)
+        for opcoes in ({"compacto": True}, {"colunar": True}, {"preguicoso": True}, {"tabela_fusoes": True}):
+            gerenciador = GerenciadorEntidades(**opcoes)
+            selecoes = [gerenciador.get([entidade._nome for entidade in selecao]) for selecao in self.selecoes]
+            with self.subTest(opcoes=opcoes):
+                self.assertListEqual(self._nomes(gerenciador.cruzar_em_lote(selecoes)), esperado)
+
+    def test_lote_preenche_tabela_de_fusoes(self):
+        """Com tabela de fusões, as assinaturas calculadas ficam registradas."""
+        gerenciador = GerenciadorEntidades(tabela_fusoes=True)
+        selecoes = [gerenciador.get(["Humano", "Touro"]), gerenciador.get(["Ave", "Leão"])]
+        gerenciador.cruzar_em_lote(selecoes)
+        self.assertEqual(len(gerenciador.tabela_fusoes), 2)
+
+    def test_pool_de_processos(self):
+        """Distribuir o lote entre processos não altera os resultados."""
+        gerenciador = gerar_gerenciador(300, tamanho_vocabulario=12, semente=3)
+        basicas = gerenciador.listar_basicas()
+        selecoes = [list(selecao) for selecao in permutations(basicas, 2)]
+        self.assertListEqual(
+            self._nomes(gerenciador.cruzar_em_lote(selecoes, processos=2)),
+            self._esperado(gerenciador, selecoes),
+        )
+
+
+if __name__ == "__main__":
+    unittest.main()
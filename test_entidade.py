@@ -1,5 +1,6 @@
 import unittest
 from package.entidade import Entidade
+from package.vocabulario_tags import VocabularioTags
 
 class TestEntidade(unittest.TestCase):
     """
@@ -63,6 +64,35 @@ class TestEntidade(unittest.TestCase):
         """
         self.assertFalse(self.minotauro.contem(self.minotauro_de_ferro))
 
+    def test_contem_compactado(self):
+        """
+        Entidades compactadas no mesmo vocabulário comparam máscaras
+        e devem produzir o mesmo resultado que a comparação de conjuntos.
+        """
+        vocabulario = VocabularioTags()
+        self.minotauro.compactar(vocabulario)
+        self.minotauro_de_ferro.compactar(vocabulario)
+        self.assertTrue(self.minotauro_de_ferro.contem(self.minotauro))
+        self.assertFalse(self.minotauro.contem(self.minotauro_de_ferro))
+        self.assertSetEqual(self.minotauro.tags, {"HUMANOIDE", "CHIFRES"})
+
+    def test_set_tags_descarta_mascara(self):
+        """Alterar as tags deve invalidar a máscara compactada."""
+        self.minotauro.compactar(VocabularioTags())
+        self.minotauro.set_tags(["FERRO"])
+        self.assertIsNone(self.minotauro.mascara)
+        self.assertFalse(self.minotauro_de_ferro.contem(Entidade("Fogo", ["FOGO"])))
+
+    def test_compactar_descarta_conjunto(self):
+        """
+        No modo compacto apenas a máscara fica armazenada; as tags são
+        reconstruídas a partir do vocabulário quando consultadas.
+        """
+        self.minotauro.compactar(VocabularioTags())
+        self.assertIsNone(self.minotauro._conjunto_tags)
+        self.assertSetEqual(self.minotauro.tags, {"HUMANOIDE", "CHIFRES"})
+        self.assertIn("CHIFRES", str(self.minotauro))
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -136,5 +136,314 @@ class TestGerenciadorEntidades(unittest.TestCase):
         self.assertIn(self.touro, derivacoes)
 
 
+class TestIndiceTags(unittest.TestCase):
+    """
+    Garante que evoluções e derivações calculadas pelo índice invertido
+    coincidem com a varredura completa do catálogo.
+    """
+
+    def setUp(self):
+        self.gerenciador_entidades = GerenciadorEntidades()
+        self.gerenciador_entidades.adicionar(Entidade("Vazio", []))
+        self.gerenciador_entidades.adicionar(Entidade("Dragão", ["AVE", "LEAO", "FOGO"]))
+
+    def _evolucoes_varredura(self, entidade):
+        return [
+            _entidade
+            for _entidade in self.gerenciador_entidades._entidades
+            if _entidade != entidade and _entidade.contem(entidade)
+        ]
+
+    def _derivacoes_varredura(self, entidade):
+        return [
+            _entidade
+            for _entidade in self.gerenciador_entidades._entidades
+            if _entidade != entidade and entidade.contem(_entidade)
+        ]
+
+    def test_resultados_identicos_a_varredura(self):
+        """Todas as entidades do catálogo devem gerar as mesmas listas, na mesma ordem."""
+        for entidade in self.gerenciador_entidades._entidades:
+            self.assertListEqual(
+                self.gerenciador_entidades.evolucoes(entidade),
+                self._evolucoes_varredura(entidade),
+            )
+            self.assertListEqual(
+                self.gerenciador_entidades.derivacoes(entidade),
+                self._derivacoes_varredura(entidade),
+            )
+
+    def test_entidade_externa_com_tag_desconhecida(self):
+        """Uma tag fora do vocabulário não possui evoluções."""
+        externa = Entidade("Fênix", ["AVE", "CINZAS"])
+        self.assertListEqual(self.gerenciador_entidades.evolucoes(externa), [])
+        self.assertListEqual(
+            self.gerenciador_entidades.derivacoes(externa),
+            self._derivacoes_varredura(externa),
+        )
+
+    def test_carregar_csv_atualiza_indice(self):
+        """Entidades vindas do CSV devem aparecer nas consultas indexadas."""
+        conteudo = "nome,tags\nHidra,PEIXE;FOGO;SERPENTE\n"
+        with tempfile.NamedTemporaryFile(delete=False, mode="w", encoding="utf-8") as tmp:
+            tmp.write(conteudo)
+            tmp_path = tmp.name
+        self.gerenciador_entidades.carregar_csv(tmp_path)
+        os.remove(tmp_path)
+
+        peixe = self.gerenciador_entidades.get(["Peixe"])[0]
+        nomes = [entidade._nome for entidade in self.gerenciador_entidades.evolucoes(peixe)]
+        self.assertIn("Hidra", nomes)
+
+    def test_reindexar_apos_alterar_tags(self):
+        """reindexar deve refletir tags alteradas diretamente na entidade."""
+        humano = self.gerenciador_entidades.get(["Humano"])[0]
+        dragao = self.gerenciador_entidades.get(["Dragão"])[0]
+        dragao.set_tags(["HUMANO", "FOGO"])
+        self.gerenciador_entidades.reindexar()
+        self.assertIn(dragao, self.gerenciador_entidades.evolucoes(humano))
+
+
+class TestGerenciadorCompacto(unittest.TestCase):
+    """
+    O modo compacto deve responder às consultas exatamente como o modo padrão.
+    """
+
+    def setUp(self):
+        self.padrao = GerenciadorEntidades()
+        self.compacto = GerenciadorEntidades(compacto=True)
+
+    def _nomes(self, entidades):
+        return [entidade._nome for entidade in entidades]
+
+    def test_entidades_recebem_mascara(self):
+        """Toda entidade do catálogo compacto deve carregar uma máscara."""
+        for entidade in self.compacto._entidades:
+            self.assertIsNotNone(entidade.mascara)
+
+    def test_cruzar_identico_ao_modo_padrao(self):
+        """Todos os pares de criaturas devem gerar as mesmas fusões."""
+        nomes = self.padrao.listar_nomes()
+        for primeiro in nomes:
+            for segundo in nomes:
+                selecao = [primeiro, segundo]
+                self.assertListEqual(
+                    self._nomes(self.compacto.cruzar(self.compacto.get(selecao))),
+                    self._nomes(self.padrao.cruzar(self.padrao.get(selecao))),
+                )
+
+    def test_cruzar_com_entidade_externa(self):
+        """Tags desconhecidas do vocabulário não devem remover tags do catálogo."""
+        externas = [Entidade("Fogo", ["FOGO", "HUMANO"]), Entidade("Touro", ["TOURO"])]
+        self.assertListEqual(
+            self._nomes(self.compacto.cruzar(externas)),
+            self._nomes(self.padrao.cruzar(externas)),
+        )
+
+    def test_evolucoes_derivacoes_identicas(self):
+        """Evoluções e derivações não dependem da representação das tags."""
+        for nome in self.padrao.listar_nomes():
+            entidade_padrao = self.padrao.get([nome])[0]
+            entidade_compacta = self.compacto.get([nome])[0]
+            self.assertListEqual(
+                self._nomes(self.compacto.evolucoes(entidade_compacta)),
+                self._nomes(self.padrao.evolucoes(entidade_padrao)),
+            )
+            self.assertListEqual(
+                self._nomes(self.compacto.derivacoes(entidade_compacta)),
+                self._nomes(self.padrao.derivacoes(entidade_padrao)),
+            )
+
+
+class TestIndiceNomes(unittest.TestCase):
+    """
+    Testes da busca por nome apoiada no dicionário de nomes.
+    """
+
+    def setUp(self):
+        self.gerenciador_entidades = GerenciadorEntidades()
+
+    def test_get_preserva_ordem_e_duplicatas(self):
+        """Duplicatas voltam em ordem de inserção e nomes ausentes são ignorados."""
+        outro_humano = Entidade("Humano", ["HUMANO", "FERRO"])
+        self.gerenciador_entidades.adicionar(outro_humano)
+        resultado = self.gerenciador_entidades.get(["Touro", "Inexistente", "Humano"])
+        self.assertEqual([entidade._nome for entidade in resultado], ["Touro", "Humano", "Humano"])
+        self.assertIs(resultado[2], outro_humano)
+
+    def test_buscar_nomes_indica_ausentes(self):
+        """A busca em lote devolve lista vazia para nomes não cadastrados."""
+        resultado = self.gerenciador_entidades.buscar_nomes(["Sereia", "Dragão"])
+        self.assertEqual([entidade._nome for entidade in resultado["Sereia"]], ["Sereia"])
+        self.assertListEqual(resultado["Dragão"], [])
+
+    def test_len_conta_catalogo(self):
+        """len deve coincidir com a listagem de nomes, inclusive com duplicatas."""
+        self.gerenciador_entidades.adicionar(Entidade("Humano", ["HUMANO"]))
+        self.assertEqual(
+            len(self.gerenciador_entidades),
+            len(self.gerenciador_entidades.listar_nomes()),
+        )
+
+    def test_reindexar_apos_renomear(self):
+        """reindexar deve refletir nomes alterados diretamente na entidade."""
+        sereia = self.gerenciador_entidades.get(["Sereia"])[0]
+        sereia.set_nome("Tritão")
+        self.gerenciador_entidades.reindexar()
+        self.assertListEqual(self.gerenciador_entidades.get(["Sereia"]), [])
+        self.assertListEqual(self.gerenciador_entidades.get(["Tritão"]), [sereia])
+
+
+class TestCargaEmLotes(unittest.TestCase):
+    """
+    Testes da carga de CSV em lotes com inserção em massa.
+    """
+
+    def setUp(self):
+        self.gerenciador_entidades = GerenciadorEntidades(tabela_fusoes=True)
+        linhas = ["nome,tags,imagem"]
+        linhas.extend(f"Quimera {indice},HUMANO;TOURO;T{indice}," for indice in range(25))
+        linhas.append(",HUMANO,")
+        linhas.append("Minotauro Novo,HUMANO;TOURO,minotauro.png")
+        with tempfile.NamedTemporaryFile(delete=False, mode="w", encoding="utf-8") as tmp:
+            tmp.write("\n".join(linhas) + "\n")
+            self.tmp_path = tmp.name
+
+    def tearDown(self):
+        os.remove(self.tmp_path)
+
+    def test_relatorio_e_progresso(self):
+        """O relatório soma todos os lotes e o progresso é chamado por lote."""
+        chamadas = []
+        relatorio = self.gerenciador_entidades.carregar_csv_em_lotes(
+            self.tmp_path,
+            tamanho_lote=10,
+            progresso=lambda parcial: chamadas.append(parcial.linhas_lidas),
+        )
+        self.assertEqual(chamadas, [10, 20, 27])
+        self.assertEqual(relatorio.linhas_lidas, 27)
+        self.assertEqual(relatorio.entidades_carregadas, 26)
+        self.assertEqual(len(relatorio.linhas_invalidas), 1)
+        novo = self.gerenciador_entidades.get(["Minotauro Novo"])[0]
+        self.assertEqual(novo.caminho_imagem, "minotauro.png")
+
+    def test_indices_atualizados_em_lote(self):
+        """Índices e tabela de fusões refletem as entidades inseridas em massa."""
+        humano, touro = self.gerenciador_entidades.get(["Humano", "Touro"])
+        self.gerenciador_entidades.cruzar([humano, touro])
+        self.gerenciador_entidades.carregar_csv_em_lotes(self.tmp_path, tamanho_lote=4)
+
+        nomes_fusao = [entidade._nome for entidade in self.gerenciador_entidades.cruzar([humano, touro])]
+        self.assertEqual(nomes_fusao, ["Minotauro", "Minotauro Novo"])
+        evolucoes = self.gerenciador_entidades.evolucoes(humano)
+        self.assertIn(self.gerenciador_entidades.get(["Quimera 7"])[0], evolucoes)
+
+
+class TestCargaParalela(unittest.TestCase):
+    """
+    Testes da carga de catálogos divididos em vários arquivos CSV.
+    """
+
+    def setUp(self):
+        self.diretorio = tempfile.TemporaryDirectory()
+        for indice_arquivo in range(3):
+            caminho = os.path.join(self.diretorio.name, f"parte_{indice_arquivo}.csv")
+            with open(caminho, "w", encoding="utf-8") as arquivo:
+                arquivo.write("nome,tags\n")
+                for indice_linha in range(4):
+                    arquivo.write(f"Quimera {indice_arquivo}-{indice_linha},HUMANO;T{indice_linha}\n")
+                arquivo.write(",HUMANO\n")
+
+    def tearDown(self):
+        self.diretorio.cleanup()
+
+    def _nomes_carregados(self, gerenciador):
+        return [entidade._nome for entidade in gerenciador._entidades if entidade._nome.startswith("Quimera")]
+
+    def test_ordem_deterministica_por_arquivo_e_linha(self):
+        """A ordem final segue o arquivo e depois a linha, com ou sem processos."""
+        padrao = os.path.join(self.diretorio.name, "*.csv")
+        serial = GerenciadorEntidades()
+        paralelo = GerenciadorEntidades()
+        relatorio_serial = serial.carregar_csvs(padrao, processos=1)
+        relatorio_paralelo = paralelo.carregar_csvs(padrao, processos=2)
+
+        esperado = [f"Quimera {i}-{j}" for i in range(3) for j in range(4)]
+        self.assertListEqual(self._nomes_carregados(serial), esperado)
+        self.assertListEqual(self._nomes_carregados(paralelo), esperado)
+        self.assertEqual(relatorio_paralelo.entidades_carregadas, 12)
+        self.assertEqual(relatorio_serial.linhas_invalidas, relatorio_paralelo.linhas_invalidas)
+        self.assertTrue(relatorio_paralelo.linhas_invalidas[0].arquivo.endswith("parte_0.csv"))
+
+
+
+class TestCacheConsultas(unittest.TestCase):
+    """
+    Testes do cache de evoluções e derivações por conjunto de tags.
+    """
+
+    def setUp(self):
+        self.gerenciador = GerenciadorEntidades()
+        self.humano, self.minotauro = self.gerenciador.get(["Humano", "Minotauro"])
+
+    def _nomes(self, entidades):
+        return [entidade._nome for entidade in entidades]
+
+    def test_consultas_repetidas_acertam_o_cache(self):
+        """A segunda consulta com as mesmas tags não recalcula o resultado."""
+        primeira = self.gerenciador.evolucoes(self.humano)
+        segunda = self.gerenciador.evolucoes(self.humano)
+        self.assertListEqual(primeira, segunda)
+        self.gerenciador.derivacoes(self.minotauro)
+        estatisticas = self.gerenciador.estatisticas_cache()
+        self.assertEqual((estatisticas["acertos"], estatisticas["falhas"]), (1, 2))
+        self.assertEqual(estatisticas["entradas"], 2)
+
+    def test_mesmas_tags_excluem_a_propria_entidade(self):
+        """O cache é por tags, mas cada entidade continua fora do próprio resultado."""
+        outro_humano = Entidade("Outro Humano", ["HUMANO"])
+        self.gerenciador.adicionar(outro_humano)
+        self.assertIn(outro_humano, self.gerenciador.evolucoes(self.humano))
+        self.assertIn(self.humano, self.gerenciador.evolucoes(outro_humano))
+        self.assertNotIn(outro_humano, self.gerenciador.evolucoes(outro_humano))
+        self.assertEqual(self.gerenciador.estatisticas_cache()["acertos"], 2)
+
+    def test_adicionar_e_carregar_csv_invalidam(self):
+        """Novas entidades aparecem mesmo depois de o resultado estar em cache."""
+        self.gerenciador.evolucoes(self.minotauro)
+        self.gerenciador.adicionar(Entidade("Minotauro Alado", ["HUMANO", "TOURO", "ASAS"]))
+        self.assertIn("Minotauro Alado", self._nomes(self.gerenciador.evolucoes(self.minotauro)))
+        with tempfile.TemporaryDirectory() as diretorio:
+            caminho = os.path.join(diretorio, "extras.csv")
+            with open(caminho, "w", encoding="utf-8") as arquivo:
+                arquivo.write("nome,tags\nMinotauro Dourado,HUMANO;TOURO;OURO\n")
+            self.gerenciador.carregar_csv(caminho)
+        self.assertIn("Minotauro Dourado", self._nomes(self.gerenciador.evolucoes(self.minotauro)))
+        self.assertEqual(self.gerenciador.estatisticas_cache()["acertos"], 0)
+
+    def test_limite_lru(self):
+        """Acima da capacidade, a consulta usada há mais tempo é descartada."""
+        gerenciador = GerenciadorEntidades(tamanho_cache=2)
+        humano, touro, peixe = gerenciador.get(["Humano", "Touro", "Peixe"])
+        gerenciador.evolucoes(humano)
+        gerenciador.evolucoes(touro)
+        gerenciador.evolucoes(humano)
+        gerenciador.evolucoes(peixe)
+        gerenciador.evolucoes(humano)
+        gerenciador.evolucoes(touro)
+        estatisticas = gerenciador.estatisticas_cache()
+        self.assertEqual((estatisticas["acertos"], estatisticas["falhas"]), (2, 4))
+        self.assertEqual(estatisticas["entradas"], 2)
+
+    def test_cache_desativado(self):
+        """Com tamanho zero as consultas são sempre recalculadas."""
+        gerenciador = GerenciadorEntidades(tamanho_cache=0)
+        humano = gerenciador.get(["Humano"])[0]
+        gerenciador.evolucoes(humano)
+        gerenciador.evolucoes(humano)
+        self.assertEqual(gerenciador.estatisticas_cache()["entradas"], 0)
+        self.assertEqual(gerenciador.estatisticas_cache()["acertos"], 0)
+
+
 if __name__ == "__main__":
     unittest.main()
@@ -0,0 +1,120 @@
+import unittest
+from itertools import permutations
+
+from package.catalogo_sintetico import gerar_gerenciador
+from package.entidade import Entidade
+from package.gerenciador_entidades import GerenciadorEntidades
+from package.grafo_fusoes import GrafoFusoes
+
+
+class TestGrafoFusoes(unittest.TestCase):
+    """
+    Testes do alcance de fusões e do diagrama de Hasse do catálogo.
+    """
+
+    def setUp(self):
+        self.gerenciador = GerenciadorEntidades()
+
+    def _nomes(self, entidades):
+        return [entidade._nome for entidade in entidades]
+
+    def _alcance_por_forca_bruta(self, gerenciador, iniciais):
+        disponiveis = {frozenset(entidade._tags): entidade for entidade in iniciais}
+        niveis = {tags: 0 for tags in disponiveis}
+        rodada = 1
+        while True:
+            representantes = list(disponiveis.values())
+            selecoes = [
+                list(selecao) for tamanho in (2, 3) for selecao in permutations(representantes, tamanho)
+            ]
+            novas = {}
+            for resultado in gerenciador.cruzar_em_lote(selecoes):
+                for entidade in resultado:
+                    tags = frozenset(entidade._tags)
+                    if tags not in disponiveis:
+                        novas.setdefault(tags, entidade)
+            if not novas:
+                return niveis
+            for tags, entidade in novas.items():
+                disponiveis[tags] = entidade
+                niveis[tags] = rodada
+            rodada += 1
+
+    def test_niveis_a_partir_das_basicas(self):
+        """Básicas ficam no nível 0 e as demais criaturas a uma fusão delas."""
+        grafo = self.gerenciador.grafo_fusoes()
+        self.assertEqual(grafo.nivel(self.gerenciador.get(["Humano"])[0]), 0)
+        self.assertEqual(grafo.nivel(self.gerenciador.get(["Hipogrifo"])[0]), 1)
+        self.assertEqual(len(grafo.alcancaveis()), len(self.gerenciador))
+        self.assertListEqual(grafo.inalcancaveis(), [])
+
+    def test_receitas_sao_fusoes_validas(self):
+        """Cada receita registrada produz a criatura quando cruzada."""
+        grafo = self.gerenciador.grafo_fusoes()
+        arestas = list(grafo.arestas())
+        self.assertEqual(len(arestas), len(self.gerenciador) - len(self.gerenciador.listar_basicas()))
+        for ingredientes, resultado in arestas:
+            self.assertIn(resultado, self.gerenciador.cruzar(ingredientes))
+
+    def test_caminho_com_varias_rodadas(self):
+        """O caminho lista as fusões intermediárias antes da criatura final."""
+        grafo = GrafoFusoes(self.gerenciador, iniciais=["Centauro Alado", "Touro"])
+        anjo = self.gerenciador.get(["Anjo"])[0]
+        self.assertEqual(grafo.nivel(anjo), 2)
+        self.assertIsNone(grafo.nivel(self.gerenciador.get(["Humano"])[0]))
+        caminho = grafo.caminho(anjo)
+        self.assertEqual(len(caminho), 3)
+        self.assertEqual(caminho[-1][1], anjo)
+        obtidas = set(self._nomes(self.gerenciador.get(["Centauro Alado", "Touro"])))
+        for ingredientes, resultado in caminho:
+            self.assertTrue(set(self._nomes(ingredientes)) <= obtidas)
+            self.assertIn(resultado, self.gerenciador.cruzar(ingredientes))
+            obtidas.add(resultado._nome)
+
+    def test_superconjunto_como_ultimo_ingrediente(self):
+        """Uma criatura que contém o alvo pode fechar a fusão."""
+        grafo = GrafoFusoes(self.gerenciador, iniciais=["Ave", "Centauro Alado"])
+        pegaso = self.gerenciador.get(["Pégaso"])[0]
+        self.assertEqual(grafo.nivel(pegaso), 1)
+        self.assertIn(pegaso, self.gerenciador.cruzar(grafo.receita(pegaso)))
+
+    def test_alcance_identico_a_forca_bruta(self):
+        """O alcance coincide com tentar todas as fusões rodada a rodada."""
+        gerenciador = gerar_gerenciador(40, tamanho_vocabulario=7, tags_por_entidade=(1, 3), semente=17)
+        trios = [entidade for entidade in gerenciador._entidades if len(entidade._tags) == 3][:3]
+        for iniciais in (gerenciador.listar_basicas(), trios):
+            grafo = GrafoFusoes(gerenciador, iniciais=[entidade._nome for entidade in iniciais])
+            grafo.alcancaveis()
+            with self.subTest(iniciais=self._nomes(iniciais)):
+                self.assertDictEqual(grafo._niveis, self._alcance_por_forca_bruta(gerenciador, iniciais))
+
+    def test_hasse_e_evolucoes(self):
+        """O fecho transitivo do diagrama de Hasse reproduz as evoluções."""
+        grafo = self.gerenciador.grafo_fusoes()
+        centauro_alado = self.gerenciador.get(["Centauro Alado"])[0]
+        self.assertEqual(
+            sorted(self._nomes(grafo.antecessores_hasse(centauro_alado))),
+            ["Anjo", "Centauro", "Pégaso"],
+        )
+        for entidade in self.gerenciador._entidades:
+            alcancadas = set()
+            fronteira = [entidade]
+            while fronteira:
+                for maior in grafo.sucessores_hasse(fronteira.pop()):
+                    if maior._nome not in alcancadas:
+                        alcancadas.add(maior._nome)
+                        fronteira.append(maior)
+            self.assertSetEqual(alcancadas, set(self._nomes(self.gerenciador.evolucoes(entidade))))
+
+    def test_cache_por_versao(self):
+        """O grafo é reaproveitado até o catálogo mudar."""
+        grafo = self.gerenciador.grafo_fusoes()
+        self.assertIs(self.gerenciador.grafo_fusoes(), grafo)
+        self.gerenciador.adicionar(Entidade("Quimera", ["LEAO", "TOURO", "AVE"]))
+        atualizado = self.gerenciador.grafo_fusoes()
+        self.assertIsNot(atualizado, grafo)
+        self.assertEqual(atualizado.nivel(self.gerenciador.get(["Quimera"])[0]), 1)
+
+
+if __name__ == "__main__":
+    unittest.main()
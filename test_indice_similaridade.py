@@ -0,0 +1,75 @@
+import random
+import unittest
+
+from package.catalogo_sintetico import gerar_gerenciador
+from package.entidade import Entidade
+from package.gerenciador_entidades import GerenciadorEntidades
+from package.indice_similaridade import jaccard
+
+
+def _forca_bruta(gerenciador, tags, k, excluir=()):
+    pontuadas = [
+        (-jaccard(tags, gerenciador._tags_em(posicao)), posicao)
+        for posicao in range(len(gerenciador))
+        if posicao not in excluir
+    ]
+    pontuadas = sorted(item for item in pontuadas if item[0] < 0)
+    return [(posicao, -similaridade) for similaridade, posicao in pontuadas[:k]]
+
+
+class TestIndiceSimilaridade(unittest.TestCase):
+    """
+    Testes da busca das criaturas mais próximas por similaridade de Jaccard.
+    """
+
+    def setUp(self):
+        self.gerenciador = GerenciadorEntidades()
+
+    def _nomes(self, resultado):
+        return [(entidade._nome, round(similaridade, 3)) for entidade, similaridade in resultado]
+
+    def test_jaccard(self):
+        """Interseção sobre união, com zero para conjuntos vazios."""
+        self.assertEqual(jaccard({"AVE", "LEAO"}, {"AVE", "LEAO", "HUMANO"}), 2 / 3)
+        self.assertEqual(jaccard(set(), set()), 0.0)
+
+    def test_similares_por_tags(self):
+        """Consultas por tags ordenam por similaridade e depois pela ordem do catálogo."""
+        resultado = self.gerenciador.similares(["AVE", "LEAO", "HUMANO"], k=3)
+        self.assertListEqual(self._nomes(resultado), [("Esfinge", 1.0), ("Grifo", 0.667), ("Anjo", 0.667)])
+        self.assertListEqual(self.gerenciador.similares(["DRAGAO"]), [])
+
+    def test_similares_por_entidade_exclui_a_propria(self):
+        """Ao consultar por uma entidade, ela mesma não é recomendada."""
+        grifo = self.gerenciador.get(["Grifo"])[0]
+        resultado = self.gerenciador.similares(grifo, k=2)
+        self.assertNotIn(grifo, [entidade for entidade, _ in resultado])
+        self.assertListEqual(self._nomes(resultado), [("Hipogrifo", 0.667), ("Esfinge", 0.667)])
+        externo = Entidade("Grifo", ["AVE", "LEAO"])
+        self.assertEqual(self.gerenciador.similares(externo, k=1)[0][0], grifo)
+
+    def test_minimo_e_atualizacao_do_catalogo(self):
+        """O limite mínimo filtra resultados e novas entidades entram no índice."""
+        self.assertListEqual(self.gerenciador.similares(["CAVALO", "PEIXE", "HUMANO"], minimo=0.9), [])
+        self.gerenciador.adicionar(Entidade("Centauro Marinho", ["CAVALO", "PEIXE", "HUMANO"]))
+        resultado = self.gerenciador.similares(["CAVALO", "PEIXE", "HUMANO"], minimo=0.9)
+        self.assertListEqual(self._nomes(resultado), [("Centauro Marinho", 1.0)])
+
+    def test_identico_a_forca_bruta(self):
+        """O índice devolve exatamente o top-k da varredura completa."""
+        gerenciador = gerar_gerenciador(3000, tamanho_vocabulario=60, semente=4)
+        indice = gerenciador.indice_similaridade()
+        aleatorio = random.Random(4)
+        for _ in range(40):
+            posicao = aleatorio.randrange(len(gerenciador))
+            tags = gerenciador._tags_em(posicao)
+            k = aleatorio.choice([1, 5, 20])
+            with self.subTest(tags=sorted(tags), k=k):
+                self.assertListEqual(
+                    indice.posicoes_similares(tags, k, excluir=[posicao]),
+                    _forca_bruta(gerenciador, tags, k, excluir={posicao}),
+                )
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -1,7 +1,10 @@
 import os
 import tempfile
+import time
 import unittest
+from unittest import mock
 
+from package.armazenamento import ArmazenamentoLog, ArmazenamentoSQLite
 from package.jogador import Jogador
 
 
@@ -50,5 +53,129 @@ class TestJogador(unittest.TestCase):
         self.assertEqual(jogador.creditos, 1)
 
 
+class ArmazenamentoContador(ArmazenamentoLog):
+    def __init__(self, arquivo):
+        super().__init__(arquivo)
+        self.escritas = 0
+
+    def registrar(self, *args):
+        self.escritas += 1
+        super().registrar(*args)
+
+
+class TestJogadorLote(unittest.TestCase):
+    def setUp(self):
+        self.diretorio = tempfile.TemporaryDirectory()
+        self.caminho = os.path.join(self.diretorio.name, "dados_jogador.log")
+
+    def tearDown(self):
+        self.diretorio.cleanup()
+
+    def test_lote_grava_uma_vez(self):
+        armazenamento = ArmazenamentoContador(self.caminho)
+        jogador = Jogador("Alice", armazenamento=armazenamento)
+        jogador.adicionar_creditos(2)
+        self.assertEqual(armazenamento.escritas, 1)
+
+        with jogador.em_lote():
+            for criatura in ("Minotauro", "Sereia", "Anjo"):
+                jogador.registrar_fusao(criatura)
+            self.assertTrue(jogador.gastar_creditos(1))
+            self.assertTrue(jogador.pendente)
+            self.assertEqual(armazenamento.escritas, 1)
+        self.assertEqual(armazenamento.escritas, 2)
+        self.assertFalse(jogador.pendente)
+
+        reaberto = Jogador("Alice", armazenamento=ArmazenamentoLog(self.caminho))
+        self.assertSetEqual(reaberto.criaturas_descobertas, {"Minotauro", "Sereia", "Anjo"})
+        self.assertEqual(reaberto.creditos, 1)
+
+    def test_lotes_aninhados(self):
+        armazenamento = ArmazenamentoContador(self.caminho)
+        jogador = Jogador("Bob", armazenamento=armazenamento)
+        with jogador.em_lote():
+            jogador.registrar_fusao("Grifo")
+            with jogador.em_lote():
+                jogador.adicionar_creditos(1)
+            self.assertEqual(armazenamento.escritas, 0)
+        self.assertEqual(armazenamento.escritas, 1)
+
+    def test_salvamento_automatico(self):
+        armazenamento = ArmazenamentoContador(self.caminho)
+        jogador = Jogador("Carol", armazenamento=armazenamento, salvamento_automatico=0.01)
+        jogador.registrar_fusao("Grifo")
+        jogador.adicionar_creditos(3)
+        self.assertEqual(armazenamento.escritas, 0)
+        limite = time.monotonic() + 2
+        while jogador.pendente and time.monotonic() < limite:
+            time.sleep(0.01)
+        self.assertEqual(armazenamento.escritas, 1)
+
+    def test_lote_sqlite_recusa_gasto_concorrente(self):
+        caminho = os.path.join(self.diretorio.name, "dados_jogador.sqlite3")
+        with ArmazenamentoSQLite(caminho) as primeiro, ArmazenamentoSQLite(caminho) as segundo:
+            jogador = Jogador("Dave", armazenamento=primeiro)
+            jogador.adicionar_creditos(1)
+            concorrente = Jogador("Dave", armazenamento=segundo)
+            self.assertTrue(concorrente.gastar_creditos(1))
+
+            with jogador.em_lote():
+                jogador.registrar_fusao("Sereia")
+                self.assertFalse(jogador.gastar_creditos(1))
+            self.assertEqual(jogador.creditos, 0)
+            self.assertEqual(primeiro.carregar("Dave"), ({"Sereia"}, 0))
+
+    def test_lote_sqlite_gasta_creditos_pendentes(self):
+        caminho = os.path.join(self.diretorio.name, "dados_jogador.sqlite3")
+        with ArmazenamentoSQLite(caminho) as armazenamento:
+            jogador = Jogador("Erin", armazenamento=armazenamento)
+            with jogador.em_lote():
+                jogador.adicionar_creditos(2)
+                self.assertTrue(jogador.gastar_creditos(1))
+            self.assertEqual(armazenamento.carregar("Erin"), (set(), 1))
+
+    def test_falha_no_salvamento_automatico_e_repassada(self):
+        armazenamento = ArmazenamentoContador(self.caminho)
+        jogador = Jogador("Frank", armazenamento=armazenamento, salvamento_automatico=0.01)
+        with mock.patch.object(armazenamento, "registrar", side_effect=OSError("disco cheio")):
+            jogador.registrar_fusao("Grifo")
+            limite = time.monotonic() + 2
+            while jogador.falha_salvamento is None and time.monotonic() < limite:
+                time.sleep(0.01)
+        self.assertIsInstance(jogador.falha_salvamento, OSError)
+        self.assertEqual(jogador.quantidade_descobertas, 1)
+        self.assertTrue(jogador.pendente)
+        with self.assertRaises(OSError):
+            jogador.salvar()
+        self.assertIsNone(jogador.falha_salvamento)
+        self.assertFalse(jogador.pendente)
+        self.assertEqual(ArmazenamentoLog(self.caminho).carregar("Frank"), ({"Grifo"}, 0))
+
+    def test_falha_ao_salvar_mantem_pendencias(self):
+        armazenamento = ArmazenamentoContador(self.caminho)
+        jogador = Jogador("Gil", armazenamento=armazenamento)
+        with mock.patch.object(armazenamento, "registrar", side_effect=OSError("disco cheio")):
+            with self.assertRaises(OSError):
+                with jogador.em_lote():
+                    jogador.registrar_fusao("Grifo")
+                    jogador.adicionar_creditos(2)
+        self.assertTrue(jogador.pendente)
+        self.assertEqual(jogador.creditos, 2)
+        jogador.salvar()
+        self.assertEqual(ArmazenamentoLog(self.caminho).carregar("Gil"), ({"Grifo"}, 2))
+
+    def test_gasto_sqlite_grava_criaturas_na_mesma_transacao(self):
+        caminho = os.path.join(self.diretorio.name, "dados_jogador.sqlite3")
+        with ArmazenamentoSQLite(caminho) as armazenamento:
+            jogador = Jogador("Hana", armazenamento=armazenamento)
+            jogador.adicionar_creditos(1)
+            with mock.patch.object(armazenamento, "registrar", side_effect=AssertionError):
+                self.assertTrue(jogador.gastar_creditos(1, ["Sereia", "Anjo"]))
+            self.assertFalse(jogador.pendente)
+            self.assertEqual(armazenamento.carregar("Hana"), ({"Sereia", "Anjo"}, 0))
+            self.assertFalse(jogador.gastar_creditos(1, ["Grifo"]))
+            self.assertEqual(armazenamento.carregar("Hana"), ({"Sereia", "Anjo"}, 0))
+
+
 if __name__ == "__main__":
     unittest.main()
@@ -0,0 +1,103 @@
+import json
+import os
+import tempfile
+import unittest
+
+from package import metricas
+from package.armazenamento import ArmazenamentoPickle
+from package.gerenciador_entidades import GerenciadorEntidades
+from package.jogador import Jogador
+from package.miniaturas import gerar_miniatura
+
+try:
+    from PIL import Image
+except ImportError:  # pragma: no cover - depende do ambiente
+    Image = None
+
+
+class TestMetricas(unittest.TestCase):
+    """
+    Testes da instrumentação opcional dos caminhos críticos.
+    """
+
+    def setUp(self):
+        metricas.REGISTRO.limpar()
+        self.diretorio = tempfile.TemporaryDirectory()
+
+    def tearDown(self):
+        metricas.desativar()
+        metricas.REGISTRO.limpar()
+        self.diretorio.cleanup()
+
+    def test_desativado_nao_envolve_metodos(self):
+        """Sem ativar, os métodos originais permanecem intactos."""
+        original = GerenciadorEntidades.__dict__["cruzar"]
+        gerenciador = GerenciadorEntidades()
+        gerenciador.cruzar(gerenciador.get(["Humano", "Touro"]))
+        self.assertIs(GerenciadorEntidades.__dict__["cruzar"], original)
+        self.assertEqual(metricas.REGISTRO.snapshot()["latencias"], {})
+
+    def test_ativar_registra_latencias_e_bytes(self):
+        """Chamadas e bytes de persistência são contabilizados quando ativo."""
+        metricas.ativar()
+        gerenciador = GerenciadorEntidades()
+        for _ in range(3):
+            gerenciador.cruzar(gerenciador.get(["Humano", "Touro"]))
+        caminho = os.path.join(self.diretorio.name, "dados_jogador.pkl")
+        jogador = Jogador("Alice", armazenamento=ArmazenamentoPickle(caminho))
+        jogador.adicionar_creditos(1)
+
+        dados = metricas.REGISTRO.snapshot()
+        self.assertEqual(dados["latencias"]["gerenciador.cruzar"]["quantidade"], 3)
+        self.assertEqual(dados["latencias"]["jogador.salvar"]["quantidade"], 1)
+        self.assertEqual(dados["contadores"]["armazenamento.pickle.escritos.bytes"], os.path.getsize(caminho))
+
+        metricas.desativar()
+        gerenciador.cruzar(gerenciador.get(["Humano", "Touro"]))
+        self.assertEqual(metricas.REGISTRO.snapshot()["latencias"]["gerenciador.cruzar"]["quantidade"], 3)
+
+    @unittest.skipIf(Image is None, "Pillow não está instalado")
+    def test_bytes_lidos_das_miniaturas(self):
+        """A leitura da imagem original soma seus bytes ao contador de miniaturas."""
+        caminho = os.path.join(self.diretorio.name, "humano.png")
+        Image.new("RGB", (160, 160), "white").save(caminho)
+        metricas.ativar()
+        gerar_miniatura(caminho)
+
+        lidos = metricas.REGISTRO.snapshot()["contadores"]["miniaturas.origem.lidos.bytes"]
+        self.assertTrue(0 < lidos <= os.path.getsize(caminho))
+        self.assertIn(f"chimera_miniaturas_origem_lidos_bytes_total {lidos}", metricas.REGISTRO.exportar_prometheus())
+        self.assertIn("miniaturas.origem.lidos.bytes", json.loads(metricas.REGISTRO.exportar_json())["contadores"])
+
+    def test_instrumentar_alvo_proprio(self):
+        """Classes externas podem registrar seus próprios métodos."""
+
+        class Servico:
+            def executar(self):
+                return 42
+
+        metricas.instrumentar(Servico, "executar", "servico.executar")
+        metricas.ativar()
+        self.assertEqual(Servico().executar(), 42)
+        self.assertEqual(metricas.REGISTRO.snapshot()["latencias"]["servico.executar"]["quantidade"], 1)
+        metricas._alvos.remove((Servico, "executar", "servico.executar"))
+
+    def test_exportacoes(self):
+        """JSON e formato texto do Prometheus refletem o mesmo registro."""
+        registro = metricas.RegistroMetricas()
+        registro.incrementar("armazenamento.log.escritos.bytes", 10)
+        registro.observar("gerenciador.get", 0.0002)
+        registro.observar("gerenciador.get", 2.0)
+
+        dados = json.loads(registro.exportar_json())
+        self.assertEqual(dados["latencias"]["gerenciador.get"]["faixas"]["0.0005"], 1)
+        self.assertEqual(dados["latencias"]["gerenciador.get"]["faixas"]["+Inf"], 2)
+
+        texto = registro.exportar_prometheus()
+        self.assertIn("chimera_armazenamento_log_escritos_bytes_total 10", texto)
+        self.assertIn('chimera_gerenciador_get_segundos_bucket{le="+Inf"} 2', texto)
+        self.assertIn("chimera_gerenciador_get_segundos_count 2", texto)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,160 @@
+import os
+import tempfile
+import time
+import unittest
+
+from package.miniaturas import CacheLRU, CacheMiniaturasDisco, CarregadorMiniaturas
+
+
+class TestCacheLRU(unittest.TestCase):
+    """
+    Testes do cache limitado usado para as miniaturas das criaturas.
+    """
+
+    def test_limite_de_itens_descarta_menos_recente(self):
+        """Ao exceder o limite, o item usado há mais tempo sai primeiro."""
+        cache = CacheLRU(max_itens=2)
+        cache.put("humano", 1)
+        cache.put("touro", 2)
+        cache.get("humano")
+        cache.put("peixe", 3)
+        self.assertIn("humano", cache)
+        self.assertNotIn("touro", cache)
+        self.assertEqual(len(cache), 2)
+
+    def test_limite_de_bytes(self):
+        """O orçamento de bytes é respeitado e contabilizado."""
+        cache = CacheLRU(max_bytes=100)
+        cache.put("humano", 1, 60)
+        cache.put("touro", 2, 60)
+        self.assertNotIn("humano", cache)
+        self.assertEqual(cache.bytes_usados, 60)
+        cache.put("touro", 3, 10)
+        self.assertEqual(cache.bytes_usados, 10)
+        self.assertEqual(cache.get("touro"), 3)
+
+    def test_item_maior_que_orcamento_permanece(self):
+        """Um único item grande não esvazia o cache por completo."""
+        cache = CacheLRU(max_bytes=10)
+        cache.put("grifo", 1, 50)
+        self.assertEqual(cache.get("grifo"), 1)
+
+
+class TestCarregadorMiniaturas(unittest.TestCase):
+    """
+    Testes do carregamento de miniaturas em segundo plano.
+    """
+
+    def _coletar_tudo(self, carregador):
+        prontas = []
+        limite = time.monotonic() + 2
+        while carregador.pendentes and time.monotonic() < limite:
+            prontas.extend(carregador.coletar())
+            time.sleep(0.005)
+        return prontas
+
+    def test_resultados_e_falhas(self):
+        """Miniaturas geradas voltam pela fila e falhas viram None."""
+
+        def gerar(caminho, tamanho):
+            if caminho == "ausente.png":
+                raise OSError("arquivo ausente")
+            return (caminho, tamanho)
+
+        carregador = CarregadorMiniaturas(processadores=2, gerar=gerar)
+        carregador.solicitar("a", "humano.png")
+        carregador.solicitar("a", "humano.png")
+        carregador.solicitar("b", "ausente.png")
+        prontas = dict(self._coletar_tudo(carregador))
+        carregador.encerrar()
+
+        self.assertEqual(prontas, {"a": ("humano.png", (80, 80)), "b": None})
+
+    def test_falha_inesperada_nao_e_repetida(self):
+        """Qualquer exceção vira None e a chave não volta para a fila."""
+        chamadas = []
+
+        def gerar(caminho, tamanho):
+            chamadas.append(caminho)
+            raise RuntimeError("imagem grande demais")
+
+        carregador = CarregadorMiniaturas(processadores=1, gerar=gerar)
+        self.assertTrue(carregador.solicitar("c", "bomba.png"))
+        prontas = dict(self._coletar_tudo(carregador))
+        self.assertFalse(carregador.solicitar("c", "bomba.png"))
+        carregador.encerrar()
+
+        self.assertEqual(prontas, {"c": None})
+        self.assertEqual(chamadas, ["bomba.png"])
+
+
+class MiniaturaFalsa:
+    def __init__(self, origem):
+        self.origem = origem
+
+    def save(self, caminho, format=None):
+        with open(caminho, "wb") as arquivo:
+            arquivo.write(self.origem.encode("utf-8"))
+
+
+class TestCacheMiniaturasDisco(unittest.TestCase):
+    """
+    Testes do cache persistente de miniaturas.
+    """
+
+    def setUp(self):
+        self.diretorio = tempfile.TemporaryDirectory()
+        self.geradas = []
+        self.imagem = os.path.join(self.diretorio.name, "humano.png")
+        with open(self.imagem, "wb") as arquivo:
+            arquivo.write(b"png")
+
+        def gerar(caminho, tamanho):
+            self.geradas.append(caminho)
+            return MiniaturaFalsa(caminho)
+
+        self.cache = CacheMiniaturasDisco(os.path.join(self.diretorio.name, "cache"), gerar=gerar)
+
+    def tearDown(self):
+        self.diretorio.cleanup()
+
+    def test_gerar_e_obter(self):
+        """Uma miniatura gerada passa a ser encontrada no disco."""
+        self.assertIsNone(self.cache.obter(self.imagem))
+        self.cache.gerar(self.imagem)
+        self.assertTrue(os.path.exists(self.cache.obter(self.imagem)))
+        self.assertIsNone(self.cache.obter(self.imagem, (40, 40)))
+
+    def test_alteracao_do_arquivo_invalida_chave(self):
+        """Modificar a imagem de origem gera uma nova chave."""
+        chave = self.cache.chave(self.imagem)
+        with open(self.imagem, "ab") as arquivo:
+            arquivo.write(b"mais bytes")
+        self.assertNotEqual(self.cache.chave(self.imagem), chave)
+
+    def test_aquecer_gera_apenas_ausentes(self):
+        """Aquecer ignora miniaturas já presentes e arquivos inexistentes."""
+        ausente = os.path.join(self.diretorio.name, "ausente.png")
+        self.assertEqual(self.cache.aquecer([self.imagem, self.imagem, ausente]), 1)
+        self.assertEqual(self.cache.aquecer([self.imagem]), 0)
+        self.assertEqual(self.geradas, [self.imagem])
+
+    def test_aquecer_continua_apos_falha(self):
+        """Uma imagem com erro inesperado é contada como falha e as demais seguem."""
+        defeituosa = os.path.join(self.diretorio.name, "bomba.png")
+        with open(defeituosa, "wb") as arquivo:
+            arquivo.write(b"png")
+
+        def gerar(caminho, tamanho):
+            if caminho == defeituosa:
+                raise RuntimeError("imagem grande demais")
+            return MiniaturaFalsa(caminho)
+
+        cache = CacheMiniaturasDisco(os.path.join(self.diretorio.name, "cache"), gerar=gerar)
+        self.assertEqual(cache.aquecer([defeituosa, self.imagem]), 1)
+        self.assertEqual(cache.falhas, [defeituosa])
+        self.assertIsNotNone(cache.obter(self.imagem))
+
+
+if __name__ == "__main__":
+    unittest.main()
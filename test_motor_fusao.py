@@ -0,0 +1,85 @@
+import os
+import tempfile
+import unittest
+
+from package.armazenamento import ArmazenamentoLog, ArmazenamentoSQLite
+from package.gerenciador_entidades import GerenciadorEntidades
+from package.jogador import Jogador
+from package.motor_fusao import (
+    CRIATURAS_NAO_ENCONTRADAS,
+    FALHA_CREDITOS,
+    FUSAO_CONCLUIDA,
+    SELECAO_INSUFICIENTE,
+    SEM_COMBINACAO,
+    SEM_CREDITOS,
+    MotorFusao,
+)
+
+
+class TestMotorFusao(unittest.TestCase):
+    """
+    Testes do fluxo de fusão sem interface gráfica.
+    """
+
+    def setUp(self):
+        self.diretorio = tempfile.TemporaryDirectory()
+        self.caminho = os.path.join(self.diretorio.name, "dados_jogador.log")
+        self.jogador = Jogador("Alice", armazenamento=ArmazenamentoLog(self.caminho))
+        self.motor = MotorFusao(GerenciadorEntidades(tabela_fusoes=True))
+
+    def tearDown(self):
+        self.diretorio.cleanup()
+
+    def test_fusao_concluida(self):
+        """Uma fusão válida registra as criaturas e consome um crédito."""
+        self.jogador.adicionar_creditos(2)
+        resultado = self.motor.realizar_fusao(self.jogador, ["Humano", "Touro"])
+        self.assertEqual(resultado.situacao, FUSAO_CONCLUIDA)
+        self.assertIn("Minotauro", [entidade._nome for entidade in resultado.novas_criaturas])
+        self.assertIn("Minotauro", self.jogador.criaturas_descobertas)
+        self.assertEqual(self.jogador.creditos, 1)
+
+        reaberto = Jogador("Alice", armazenamento=ArmazenamentoLog(self.caminho))
+        self.assertEqual(reaberto.creditos, 1)
+        self.assertIn("Minotauro", reaberto.criaturas_descobertas)
+
+    def test_selecao_insuficiente(self):
+        """Uma única criatura não pode ser fundida."""
+        self.jogador.adicionar_creditos(1)
+        resultado = self.motor.realizar_fusao(self.jogador, ["Humano"])
+        self.assertEqual(resultado.situacao, SELECAO_INSUFICIENTE)
+        self.assertEqual(self.jogador.creditos, 1)
+
+    def test_sem_creditos(self):
+        """Sem créditos nenhuma fusão é tentada."""
+        resultado = self.motor.realizar_fusao(self.jogador, ["Humano", "Touro"])
+        self.assertEqual(resultado.situacao, SEM_CREDITOS)
+        self.assertEqual(self.jogador.quantidade_descobertas, 0)
+
+    def test_criatura_desconhecida_e_sem_combinacao(self):
+        """Falhas de fusão não consomem créditos."""
+        self.jogador.adicionar_creditos(1)
+        resultado = self.motor.realizar_fusao(self.jogador, ["Humano", "Dragão"])
+        self.assertEqual(resultado.situacao, CRIATURAS_NAO_ENCONTRADAS)
+        resultado = self.motor.realizar_fusao(self.jogador, ["Peixe", "Leão"])
+        self.assertEqual(resultado.situacao, SEM_COMBINACAO)
+        self.assertEqual(resultado.novas_criaturas, [])
+        self.assertEqual(self.jogador.creditos, 1)
+
+    def test_creditos_gastos_por_outra_sessao(self):
+        """Um saldo local desatualizado resulta em FALHA_CREDITOS, sem exceção."""
+        caminho = os.path.join(self.diretorio.name, "dados_jogador.sqlite3")
+        with ArmazenamentoSQLite(caminho) as primeiro, ArmazenamentoSQLite(caminho) as segundo:
+            jogador = Jogador("Bob", armazenamento=primeiro)
+            jogador.adicionar_creditos(1)
+            concorrente = Jogador("Bob", armazenamento=segundo)
+            self.assertTrue(concorrente.gastar_creditos(1))
+
+            resultado = self.motor.realizar_fusao(jogador, ["Humano", "Touro"])
+            self.assertEqual(resultado.situacao, FALHA_CREDITOS)
+            self.assertEqual(jogador.quantidade_descobertas, 0)
+            self.assertEqual(primeiro.carregar("Bob"), (set(), 0))
+
+
+if __name__ == "__main__":
+    unittest.main()
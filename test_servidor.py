@@ -0,0 +1,113 @@
+import os
+import sqlite3
+import tempfile
+import unittest
+from unittest import mock
+
+from package.armazenamento import ArmazenamentoSQLite
+from package.cliente_carga import ClienteFusao, gerar_carga
+from package.servidor import LIMITE_LINHA_BYTES, MAXIMO_SELECOES_SIMULACAO, ServidorFusao
+
+
+QUESTOES = [{"pergunta": "O que é herança?", "alternativas": ["A", "B"], "correta": 1}]
+
+
+class TestServidorFusao(unittest.IsolatedAsyncioTestCase):
+    """
+    Testes do servidor multijogador usando o cliente de carga local.
+    """
+
+    async def asyncSetUp(self):
+        self.diretorio = tempfile.TemporaryDirectory()
+        self.armazenamento = ArmazenamentoSQLite(os.path.join(self.diretorio.name, "jogo.sqlite3"))
+        self.fusao = ServidorFusao(self.armazenamento, questoes=QUESTOES)
+        self.servidor = await self.fusao.iniciar("127.0.0.1", 0)
+        self.porta = self.servidor.sockets[0].getsockname()[1]
+        self.cliente = await ClienteFusao.conectar("127.0.0.1", self.porta)
+
+    async def asyncTearDown(self):
+        await self.cliente.fechar()
+        self.servidor.close()
+        await self.servidor.wait_closed()
+        self.armazenamento.fechar()
+        self.diretorio.cleanup()
+
+    async def test_quiz_e_fusao(self):
+        """Responder corretamente rende créditos que pagam uma fusão."""
+        sem_creditos = await self.cliente.pedir("fusao", "Alice", criaturas=["Humano", "Touro"])
+        self.assertEqual(sem_creditos["situacao"], "sem_creditos")
+
+        pergunta = await self.cliente.pedir("pergunta", "Alice")
+        self.assertNotIn("correta", pergunta)
+        errada = await self.cliente.pedir("responder", "Alice", resposta=0)
+        self.assertFalse(errada["correta"])
+        certa = await self.cliente.pedir("responder", "Alice", resposta=1)
+        self.assertEqual(certa["creditos"], 1)
+        repetida = await self.cliente.pedir("responder", "Alice", resposta=1)
+        self.assertFalse(repetida["ok"])
+
+        fusao = await self.cliente.pedir("fusao", "Alice", criaturas=["Humano", "Touro"])
+        self.assertEqual(fusao["situacao"], "concluida")
+        self.assertIn("Minotauro", fusao["novas_criaturas"])
+        self.assertEqual(fusao["creditos"], 0)
+
+        descobertas = await self.cliente.pedir("descobertas", "Alice")
+        self.assertIn("Minotauro", descobertas["criaturas"])
+        self.assertEqual(self.armazenamento.carregar("Alice")[1], 0)
+
+    async def test_pedidos_invalidos(self):
+        """Pedidos malformados recebem erro sem derrubar a conexão."""
+        self.assertFalse((await self.cliente.pedir("voar", "Alice"))["ok"])
+        self.assertFalse((await self.cliente.pedir("creditos", ""))["ok"])
+        self.assertFalse((await self.cliente.pedir("fusao", "Alice", criaturas="Humano"))["ok"])
+        self.assertTrue((await self.cliente.pedir("creditos", "Alice"))["ok"])
+
+    async def test_pedidos_com_tipos_inesperados(self):
+        """Ações não textuais, respostas fora do intervalo e falhas internas viram erro."""
+        self.assertFalse((await self.cliente.pedir(["creditos"], "Alice"))["ok"])
+        await self.cliente.pedir("pergunta", "Alice")
+        infinita = await self.cliente.pedir("responder", "Alice", resposta=float("inf"))
+        self.assertFalse(infinita["ok"])
+        with mock.patch.object(
+            self.fusao._motor, "realizar_fusao", side_effect=sqlite3.OperationalError("database is locked")
+        ):
+            falha = await self.cliente.pedir("fusao", "Alice", criaturas=["Humano", "Touro"])
+        self.assertFalse(falha["ok"])
+        self.assertIn("erro", falha)
+        self.assertTrue((await self.cliente.pedir("creditos", "Alice"))["ok"])
+
+    async def test_simular_selecoes_sem_cobrar(self):
+        """Simular várias seleções devolve as fusões sem gastar créditos."""
+        simulacao = await self.cliente.pedir(
+            "simular", "Bia", selecoes=[["Humano", "Touro"], ["Peixe", "Leão"]]
+        )
+        self.assertIn("Minotauro", simulacao["resultados"][0])
+        self.assertEqual(simulacao["resultados"][1], [])
+        self.assertEqual((await self.cliente.pedir("descobertas", "Bia"))["criaturas"], [])
+        self.assertFalse((await self.cliente.pedir("simular", "Bia", selecoes=["Humano"]))["ok"])
+
+    async def test_simular_lote_grande(self):
+        """Lotes grandes cabem numa linha; acima do máximo o pedido é recusado."""
+        selecoes = [["Humano", "Touro"]] * 4000
+        simulacao = await self.cliente.pedir("simular", "Bia", selecoes=selecoes)
+        self.assertEqual(len(simulacao["resultados"]), 4000)
+        self.assertIn("Minotauro", simulacao["resultados"][-1])
+
+        excesso = [["Humano", "Touro"]] * (MAXIMO_SELECOES_SIMULACAO + 1)
+        self.assertFalse((await self.cliente.pedir("simular", "Bia", selecoes=excesso))["ok"])
+
+        gigante = await self.cliente.pedir("creditos", "Bia", extra="x" * (LIMITE_LINHA_BYTES + 1))
+        self.assertFalse(gigante["ok"])
+        self.assertTrue((await self.cliente.pedir("creditos", "Bia"))["ok"])
+
+    async def test_carga_concorrente(self):
+        """Vários jogadores simultâneos são atendidos sem erros."""
+        relatorio = await gerar_carga("127.0.0.1", self.porta, jogadores=8, requisicoes=20, semente=1)
+        self.assertEqual(relatorio.requisicoes, 160)
+        self.assertEqual(relatorio.erros, 0)
+        self.assertGreater(relatorio.requisicoes_por_segundo, 0)
+        self.assertLessEqual(relatorio.percentil(0.5), relatorio.percentil(0.99))
+
+
+if __name__ == "__main__":
+    unittest.main()
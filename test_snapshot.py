@@ -0,0 +1,129 @@
+import os
+import tempfile
+import unittest
+
+from package.entidade import Entidade
+from package.gerenciador_entidades import GerenciadorEntidades
+from package.snapshot import IndiceNomesSnapshot, PostagemSnapshot, Snapshot
+
+
+class TestSnapshot(unittest.TestCase):
+    """
+    Testes do formato binário de snapshot do catálogo.
+    """
+
+    def setUp(self):
+        self.diretorio = tempfile.TemporaryDirectory()
+        self.caminho = os.path.join(self.diretorio.name, "catalogo.snap")
+        self.gerenciador = GerenciadorEntidades()
+        self.gerenciador.adicionar(Entidade("Dragão", ["AVE", "LEAO", "FOGO"], "assets/dragão.png"))
+        self.gerenciador.adicionar(Entidade("Vazio", []))
+
+    def tearDown(self):
+        self.diretorio.cleanup()
+
+    def _resumo(self, gerenciador):
+        return [
+            (entidade._nome, sorted(entidade._tags), entidade._caminho_imagem)
+            for entidade in gerenciador._entidades
+        ]
+
+    def test_ida_e_volta(self):
+        """O catálogo reaberto deve ter as mesmas entidades e consultas."""
+        self.gerenciador.salvar_snapshot(self.caminho)
+        restaurado = GerenciadorEntidades.carregar_snapshot(self.caminho)
+        self.addCleanup(restaurado.fechar)
+
+        self.assertListEqual(self._resumo(restaurado), self._resumo(self.gerenciador))
+        self.assertEqual(
+            {tag: set(postagem) for tag, postagem in restaurado._indice_tags.items()},
+            self.gerenciador._indice_tags,
+        )
+        humano = restaurado.get(["Humano"])[0]
+        self.assertListEqual(
+            [entidade._nome for entidade in restaurado.evolucoes(humano)],
+            [entidade._nome for entidade in self.gerenciador.evolucoes(self.gerenciador.get(["Humano"])[0])],
+        )
+        self.assertEqual(restaurado.get(["Vazio"])[0]._tags, set())
+
+    def test_modo_compacto_preserva_vocabulario(self):
+        """Um snapshot de catálogo compacto reabre com o mesmo vocabulário."""
+        compacto = GerenciadorEntidades(compacto=True)
+        compacto.salvar_snapshot(self.caminho)
+        restaurado = GerenciadorEntidades.carregar_snapshot(self.caminho, compacto=True)
+        self.addCleanup(restaurado.fechar)
+        for identificador in range(len(compacto._vocabulario)):
+            self.assertEqual(restaurado._vocabulario.tag(identificador), compacto._vocabulario.tag(identificador))
+        self.assertListEqual(self._resumo(restaurado), self._resumo(compacto))
+
+    def test_carga_padrao_mantem_snapshot_mapeado(self):
+        """
+        Por padrão o catálogo continua servido pelo arquivo mapeado, sem
+        construir as entidades; preguicoso=False reconstrói tudo em memória.
+        """
+        self.gerenciador.salvar_snapshot(self.caminho)
+        mapeado = GerenciadorEntidades.carregar_snapshot(self.caminho)
+        self.addCleanup(mapeado.fechar)
+        self.assertEqual(len(mapeado), len(self.gerenciador))
+        self.assertEqual(mapeado._entidades.materializadas, 0)
+
+        em_memoria = GerenciadorEntidades.carregar_snapshot(self.caminho, preguicoso=False)
+        self.assertIsInstance(em_memoria._entidades, list)
+        self.assertListEqual(self._resumo(em_memoria), self._resumo(self.gerenciador))
+
+    def test_indices_servidos_pelo_arquivo(self):
+        """
+        Nomes e postagens são consultados no arquivo mapeado, sem recriar os
+        índices em memória; entidades adicionadas depois também são encontradas.
+        """
+        self.gerenciador.adicionar(Entidade("Dragão", ["FOGO"]))
+        self.gerenciador.salvar_snapshot(self.caminho)
+        mapeado = GerenciadorEntidades.carregar_snapshot(self.caminho)
+        self.addCleanup(mapeado.fechar)
+        self.assertIsInstance(mapeado._indice_nomes, IndiceNomesSnapshot)
+        self.assertIsInstance(mapeado._indice_tags["FOGO"], PostagemSnapshot)
+
+        extras = [
+            Entidade("Dragão", ["FOGO", "AVE"]),
+            Entidade("Salamandra", ["FOGO", "NOVA"]),
+            Entidade("Nada", []),
+        ]
+        mapeado.adicionar_varias(extras)
+        self.gerenciador.adicionar_varias(extras)
+        self.assertListEqual(mapeado._indice_nomes.get("Dragão"), self.gerenciador._indice_nomes["Dragão"])
+        self.assertEqual(mapeado._indice_nomes.get("Inexistente", ()), ())
+        self.assertListEqual(mapeado._ids_sem_tags, self.gerenciador._ids_sem_tags)
+        for tags in ({"FOGO"}, {"FOGO", "AVE"}, {"NOVA", "FOGO"}, {"HUMANO", "AVE", "LEAO"}, set()):
+            with self.subTest(tags=sorted(tags)):
+                self.assertListEqual(
+                    list(mapeado._ids_superconjuntos(tags)), list(self.gerenciador._ids_superconjuntos(tags))
+                )
+                self.assertListEqual(mapeado._ids_subconjuntos(tags), self.gerenciador._ids_subconjuntos(tags))
+        fogo = mapeado._indice_tags["FOGO"]
+        self.assertIn(len(mapeado) - 2, fogo)
+        self.assertNotIn(0, fogo)
+        self.assertListEqual(
+            [(entidade._nome, pontuacao) for entidade, pontuacao in mapeado.similares(extras[1], k=3)],
+            [(entidade._nome, pontuacao) for entidade, pontuacao in self.gerenciador.similares(extras[1], k=3)],
+        )
+
+    def test_acesso_direto_ao_snapshot(self):
+        """O snapshot mapeado permite ler entidades sem reconstruir o catálogo."""
+        self.gerenciador.salvar_snapshot(self.caminho)
+        with Snapshot(self.caminho) as snapshot:
+            self.assertEqual(len(snapshot), len(self.gerenciador._entidades))
+            posicao = len(snapshot) - 2
+            self.assertEqual(snapshot.nome(posicao), "Dragão")
+            self.assertEqual(snapshot.caminho_imagem(posicao), "assets/dragão.png")
+            self.assertSetEqual(set(snapshot.tags(posicao)), {"AVE", "LEAO", "FOGO"})
+
+    def test_arquivo_invalido(self):
+        """Arquivos que não são snapshots devem ser rejeitados."""
+        with open(self.caminho, "wb") as arquivo:
+            arquivo.write(b"nome,tags\nHumano,HUMANO\n" * 4)
+        with self.assertRaises(ValueError):
+            GerenciadorEntidades.carregar_snapshot(self.caminho)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,102 @@
+import unittest
+from concurrent.futures import ThreadPoolExecutor
+from itertools import permutations
+from unittest import mock
+
+from package.entidade import Entidade
+from package.gerenciador_entidades import GerenciadorEntidades
+from package.tabela_fusoes import TabelaFusoes, assinatura_fusao
+
+
+class TestTabelaFusoes(unittest.TestCase):
+    """
+    A tabela de fusões deve devolver exatamente o que o cruzamento
+    por varredura do catálogo devolveria.
+    """
+
+    def setUp(self):
+        self.padrao = GerenciadorEntidades()
+        self.tabelado = GerenciadorEntidades(tabela_fusoes=True)
+
+    def _nomes(self, entidades):
+        return [entidade._nome for entidade in entidades]
+
+    def test_pares_e_trios_identicos_ao_cruzar(self):
+        """Pares e trios de criaturas básicas geram os mesmos resultados, na mesma ordem."""
+        nomes = [entidade._nome for entidade in self.padrao.listar_basicas()]
+        for quantidade in (2, 3):
+            for selecao in permutations(nomes, quantidade):
+                self.assertListEqual(
+                    self._nomes(self.tabelado.cruzar(self.tabelado.get(selecao))),
+                    self._nomes(self.padrao.cruzar(self.padrao.get(selecao))),
+                )
+
+    def test_precomputar_preenche_tabela(self):
+        """Após precomputar, os pares de básicas já estão na tabela."""
+        tabela = self.tabelado.tabela_fusoes
+        tabela.precomputar()
+        humano, touro = self.tabelado.get(["Humano", "Touro"])
+        self.assertIn(assinatura_fusao([humano, touro]), tabela)
+        self.assertIn("Minotauro", self._nomes(self.tabelado.cruzar([humano, touro])))
+
+    def test_adicionar_atualiza_receitas(self):
+        """Uma nova entidade deve entrar nas receitas já calculadas."""
+        humano, touro = self.tabelado.get(["Humano", "Touro"])
+        tamanho_anterior = len(self.tabelado.cruzar([humano, touro]))
+        self.tabelado.adicionar(Entidade("Minotauro Sombrio", ["HUMANO", "TOURO"]))
+        resultado = self._nomes(self.tabelado.cruzar([humano, touro]))
+        self.assertEqual(len(resultado), tamanho_anterior + 1)
+        self.assertEqual(resultado[-1], "Minotauro Sombrio")
+
+    def test_reindexar_invalida_tabela(self):
+        """Mudanças fora de adicionar invalidam as receitas calculadas."""
+        humano, touro = self.tabelado.get(["Humano", "Touro"])
+        self.tabelado.cruzar([humano, touro])
+        minotauro = self.tabelado.get(["Minotauro"])[0]
+        minotauro.set_tags(["HUMANO", "TOURO", "AVE"])
+        self.tabelado.reindexar()
+        self.assertNotIn("Minotauro", self._nomes(self.tabelado.cruzar([humano, touro])))
+
+    def test_tamanho_maximo_descarta_menos_recente(self):
+        """A tabela mantém no máximo tamanho_maximo receitas, descartando a menos usada."""
+        tabela = TabelaFusoes(self.tabelado, tamanho_maximo=2)
+        humano, touro, peixe = self.tabelado.get(["Humano", "Touro", "Peixe"])
+        primeira = assinatura_fusao([humano, touro])
+        segunda = assinatura_fusao([humano, peixe])
+        terceira = assinatura_fusao([touro, peixe])
+        tabela.posicoes(primeira)
+        tabela.posicoes(segunda)
+        tabela.posicoes(primeira)
+        tabela.posicoes(terceira)
+        self.assertEqual(len(tabela), 2)
+        self.assertIn(primeira, tabela)
+        self.assertNotIn(segunda, tabela)
+        self.assertListEqual(
+            self._nomes(self.tabelado._entidades[posicao] for posicao in tabela.posicoes(segunda)),
+            self._nomes(self.padrao.cruzar(self.padrao.get(["Humano", "Peixe"]))),
+        )
+
+    def test_cruzar_concorrente_com_tabela_pequena(self):
+        """Várias threads podem cruzar enquanto a tabela descarta receitas."""
+        self.tabelado._tabela_fusoes = TabelaFusoes(self.tabelado, tamanho_maximo=8)
+        nomes = [entidade._nome for entidade in self.padrao.listar_basicas()]
+        selecoes = list(permutations(nomes, 2)) * 20
+        esperado = [self._nomes(self.padrao.cruzar(self.padrao.get(selecao))) for selecao in selecoes]
+        with ThreadPoolExecutor(max_workers=8) as executor:
+            obtido = list(executor.map(
+                lambda selecao: self._nomes(self.tabelado.cruzar(self.tabelado.get(selecao))), selecoes
+            ))
+        self.assertListEqual(obtido, esperado)
+        self.assertLessEqual(len(self.tabelado.tabela_fusoes), 8)
+
+    def test_precomputar_respeita_tamanho_maximo(self):
+        """Precomputar para ao encher a tabela, sem descartar o que acabou de calcular."""
+        tabela = TabelaFusoes(self.tabelado, tamanho_maximo=5)
+        with mock.patch.object(tabela, "_calcular", wraps=tabela._calcular) as calcular:
+            tabela.precomputar()
+        self.assertEqual(calcular.call_count, 5)
+        self.assertEqual(len(tabela), 5)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,43 @@
+import unittest
+
+from package.vocabulario_tags import VocabularioTags
+
+
+class TestVocabularioTags(unittest.TestCase):
+    """
+    Testes para o vocabulário que converte tags em bits de uma máscara inteira.
+    """
+
+    def setUp(self):
+        self.vocabulario = VocabularioTags()
+
+    def test_internar_reaproveita_identificador(self):
+        """A mesma tag deve receber sempre o mesmo identificador."""
+        primeiro = self.vocabulario.internar("AVE")
+        segundo = self.vocabulario.internar("LEAO")
+        self.assertEqual(self.vocabulario.internar("AVE"), primeiro)
+        self.assertNotEqual(primeiro, segundo)
+        self.assertEqual(len(self.vocabulario), 2)
+
+    def test_mascara_e_tags_ida_e_volta(self):
+        """Converter tags em máscara e de volta deve preservar o conjunto."""
+        mascara = self.vocabulario.mascara(["AVE", "LEAO", "HUMANO"])
+        self.assertSetEqual(self.vocabulario.tags(mascara), {"AVE", "LEAO", "HUMANO"})
+
+    def test_mascara_sem_internar_ignora_desconhecidas(self):
+        """Consultas não devem aumentar o vocabulário."""
+        self.vocabulario.internar("AVE")
+        mascara = self.vocabulario.mascara(["AVE", "FOGO"], internar=False)
+        self.assertEqual(mascara, self.vocabulario.mascara(["AVE"]))
+        self.assertNotIn("FOGO", self.vocabulario)
+
+    def test_vocabulario_grande(self):
+        """Máscaras devem funcionar com mais tags do que bits de uma palavra."""
+        tags = [f"TAG{indice}" for indice in range(200)]
+        mascara = self.vocabulario.mascara(tags)
+        self.assertTrue(mascara >> 199 & 1)
+        self.assertSetEqual(self.vocabulario.tags(mascara), set(tags))
+
+
+if __name__ == "__main__":
+    unittest.main()